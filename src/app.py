@@ -3,6 +3,7 @@ import pygame
 from caches import image_cache
 from exit_requested import ExitRequested
 import context
+import planner
 from tank_game import TankGame
 
 
@@ -22,6 +23,8 @@ def main():
         tank_game.start()
     except ExitRequested:
         pass
+    finally:
+        planner.shutdown()
 
 
 if __name__ == "__main__":
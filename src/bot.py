@@ -1,12 +1,53 @@
 from __future__ import annotations
+import functools
 import math
 import random
 
+import numpy as np
 import pygame
 
+import constants
 from cannonballs import CannonballType
+from impact import Impact, ImpactType
+from planner import ShotSearch
 from player import Player
+from shot_table import shot_table
 from tank import Tank
+from terrain import Terrain
+from trajectory import SHELLS, SPAWN_OFFSET
+
+# angle, speed, CannonballType, wind, flight time and horizontal miss of a shot
+ShotRecord = tuple[float, float, int, float, float, float]
+# All the prices of the shop are multiples of this amount
+PRICE_UNIT = 500
+
+
+# The value of a cannonball is its damage times its radius, as the radius
+# makes a direct hit, that does the damage, easier
+@functools.lru_cache(maxsize=None)
+def best_purchase(money: int) -> tuple[int, ...]:
+    """
+    Returns how many cannonballs of every CannonballType to buy with money,
+    so that the sum of their values is the largest. It is solved as a
+    knapsack, with a table of the best purchase for every amount of money.
+    """
+    budget = money // PRICE_UNIT
+    # value and number of cannonballs of the best purchase for every budget
+    best = [(0, ())] * (budget + 1)
+    for shell in SHELLS:
+        price = shell.price // PRICE_UNIT
+        best = [
+            max(
+                (
+                    best[amount - units * price][0]
+                    + units * shell.damage * shell.radius,
+                    best[amount - units * price][1] + (units,),
+                )
+                for units in range(amount // price + 1)
+            )
+            for amount in range(budget + 1)
+        ]
+    return best[budget][1]
 
 
 class Bot(Tank):
@@ -16,10 +57,15 @@ class Bot(Tank):
     purchase new projectiles on its own.
     """
 
+    history: dict[int, list[ShotRecord]]
+    history_positions: dict[int, tuple[pygame.Vector2, pygame.Vector2]]
+
     def __init__(
         self, color: pygame.Color | str, position: pygame.Vector2, player: Player
     ):
         super().__init__(color, position, player)
+        self.history = {}
+        self.history_positions = {}
 
     def random_shoot(self, position2: pygame.Vector2, gravity):
         """
@@ -52,6 +98,175 @@ class Bot(Tank):
             self.shoot_angle = math.radians(random.randint(10, 180))
             self.shoot_velocity = random.randint(20, 100)
 
+    def start_planning(
+        self,
+        terrain: Terrain,
+        tanks: list[Tank],
+        gravity: float,
+        wind: float,
+        budget: int,
+    ) -> ShotSearch:
+        """
+        This method starts to search, on the worker thread, the shot that
+        does the most damage to the other tanks, against the terrain, the
+        gravity and the wind. The search starts from the corrections of the
+        previous misses and the shots of the shot table for every enemy, and
+        tries about budget angles, speeds and projectiles if none of them hits.
+        """
+        seeds = self.corrected_shots(tanks, wind)
+        for tank in tanks:
+            if tank is not self and tank.is_alive:
+                seeds += shot_table.lookup(
+                    tank.position.x - self.position.x,
+                    tank.position.y - self.position.y,
+                    gravity,
+                    wind,
+                )
+
+        return ShotSearch(
+            terrain,
+            np.array([tank.position for tank in tanks]),
+            np.array([tank.life if tank.is_alive else 0 for tank in tanks]),
+            tanks.index(self),
+            gravity,
+            wind,
+            dict(self.player.ammunition),
+            budget,
+            seeds,
+        )
+
+    def finish_planning(self, search: ShotSearch) -> bool:
+        """
+        This method stops the search and aims the tank with the best shot it
+        found, that is remembered in the shot table if it hits an enemy
+        directly. Returns False, without aiming, if no shot damages the others.
+        """
+        shot = search.finish()
+        if shot is None:
+            return False
+
+        if search.hit not in (-1, search.shooter):
+            dx, dy = search.positions[search.hit] - search.positions[search.shooter]
+            shot_table.remember(dx, dy, search.gravity, search.wind, shot)
+
+        self.shoot_angle, self.shoot_velocity, self.actual = shot
+        return True
+
+    def record_shot(self, tanks: list[Tank], impact: Impact, wind: float) -> None:
+        """
+        This method keeps the shot that the tank has just fired, with the
+        horizontal distance from the impact to the enemy closest to it, which
+        is taken as the target. Only the last two shots at every target are
+        kept, and the shots that leave the map are not measured.
+        """
+        enemies = [
+            index
+            for index, tank in enumerate(tanks)
+            if tank is not self and tank.is_alive
+        ]
+        if len(enemies) == 0 or impact.impact_type == ImpactType.BORDER:
+            return
+
+        target = min(
+            enemies, key=lambda index: abs(tanks[index].position.x - impact.position.x)
+        )
+        self.forget_moved(tanks, target)
+
+        # The cannonball flies with a constant horizontal speed
+        start = self.position.x + SPAWN_OFFSET[self.actual] * math.cos(self.shoot_angle)
+        horizontal_speed = (
+            self.shoot_velocity * math.cos(self.shoot_angle)
+            + wind * constants.WIND_EFFECT_SCALE / constants.X_SPEED
+        )
+        if abs(horizontal_speed) < constants.EPSILON:
+            return
+        time = (impact.position.x - start) / horizontal_speed
+
+        record = (
+            self.shoot_angle,
+            self.shoot_velocity,
+            self.actual,
+            wind,
+            time,
+            impact.position.x - tanks[target].position.x,
+        )
+        self.history[target] = self.history.get(target, [])[-1:] + [record]
+        self.history_positions[target] = (
+            pygame.Vector2(self.position),
+            pygame.Vector2(tanks[target].position),
+        )
+
+    def forget_moved(self, tanks: list[Tank], target: int) -> None:
+        """
+        This method forgets the shots at the target if it, or the tank, has
+        moved since they were fired, because their misses no longer apply.
+        """
+        if target not in self.history_positions:
+            return
+
+        position, target_position = self.history_positions[target]
+        if (
+            position.distance_to(self.position) > constants.BOT_HISTORY_TOLERANCE
+            or target_position.distance_to(tanks[target].position)
+            > constants.BOT_HISTORY_TOLERANCE
+        ):
+            del self.history[target]
+            del self.history_positions[target]
+
+    def corrected_shots(
+        self, tanks: list[Tank], wind: float
+    ) -> list[tuple[float, float]]:
+        """
+        Returns, for every enemy that the tank has shot before, the angle of
+        the last shot and the speed that corrects its miss. The misses are
+        moved by the change of the wind drift during the flight, and the speed
+        is found with the secant of the last two shots with the same angle,
+        or with Newton's method and a range that grows with the square of the
+        speed when there is only one.
+        """
+        shots = []
+        for target in list(self.history):
+            self.forget_moved(tanks, target)
+            if target not in self.history or not tanks[target].is_alive:
+                continue
+
+            misses = [
+                miss
+                + (wind - shot_wind)
+                * constants.WIND_EFFECT_SCALE
+                / constants.X_SPEED
+                * time
+                for _, _, _, shot_wind, time, miss in self.history[target]
+            ]
+            angle, speed, caliber, _, _, _ = self.history[target][-1]
+            if abs(misses[-1]) < constants.EPSILON:
+                shots.append((angle, speed))
+                continue
+
+            previous_angle, previous_speed = self.history[target][0][:2]
+            if (
+                len(misses) == 2
+                and abs(previous_angle - angle) < constants.EPSILON
+                and abs(previous_speed - speed) > constants.EPSILON
+                and abs(misses[0] - misses[-1]) > constants.EPSILON
+            ):
+                slope = (misses[-1] - misses[0]) / (speed - previous_speed)
+            else:
+                distance = (
+                    self.history[target][-1][5]
+                    + tanks[target].position.x
+                    - self.position.x
+                    - SPAWN_OFFSET[caliber] * math.cos(angle)
+                )
+                slope = 2 * distance / speed
+            if abs(slope) < constants.EPSILON:
+                continue
+
+            speed = min(max(speed - misses[-1] / slope, 1), constants.SHOOT_MAX_SPEED)
+            shots.append((angle, speed))
+
+        return shots
+
     def selection_cannonball(self):
         """
         This method chooses the type of projectile based on the availability of
@@ -70,24 +285,9 @@ class Bot(Tank):
 
     def buy_cannonballs(self):
         """
-        This method simulates a process of randomly purchasing cannon shells,
-        where the type of shell and the player's amount of money determine
-        whether the purchase is made and what type of shell is added to the
-        inventory.
-        """
-        buy = True
-        while buy:
-            cannon = random.randint(1, 3)
-            if self.player.money < 1000:
-                buy = False
-            if cannon == 1 and self.player.money >= 1000:
-                self.player.money -= 1000
-                self.player.ammunition[CannonballType.MM60] += 1
-
-            if cannon == 2 and self.player.money >= 2500:
-                self.player.money -= 2500
-                self.player.ammunition[CannonballType.MM80] += 1
-
-            if cannon == 3 and self.player.money >= 4000:
-                self.player.money -= 4000
-                self.player.ammunition[CannonballType.MM105] += 1
+        This method buys the cannonballs that do the most damage with the
+        money of the player.
+        """
+        for caliber, units in enumerate(best_purchase(self.player.money)):
+            self.player.money -= SHELLS[caliber].price * units
+            self.player.ammunition[caliber] += units
@@ -1,8 +1,11 @@
 from abc import abstractmethod
+from collections import OrderedDict
 import os
 import sys
 
 import pygame
+
+import constants
 from context import instance
 
 
@@ -100,6 +103,59 @@ class FontCache(FileCache):
         return self.__fonts[font_params]
 
 
+class TextCache:
+    """
+    A cache class for rendered texts, it keeps the surfaces of the texts
+    rendered with the fonts of the FontCache and forgets the least recently
+    used ones when their size goes over the budget of bytes. The surfaces are
+    shared, so they must not be modified.
+    """
+
+    __texts: OrderedDict[tuple, pygame.surface.Surface]
+    __bytes: int
+    budget: int
+
+    def __init__(self, budget: int):
+        self.__texts = OrderedDict()
+        self.__bytes = 0
+        self.budget = budget
+
+    def render(
+        self,
+        font_params: tuple[str, int],
+        text: str,
+        color,
+        background=None,
+        bold: bool = False,
+        italic: bool = False,
+    ) -> pygame.surface.Surface:
+        """Get the text rendered with antialiasing from the cache."""
+        key = (font_params, bold, italic, text, color, background)
+        if key in self.__texts:
+            self.__texts.move_to_end(key)
+            return self.__texts[key]
+
+        font = font_cache[font_params]
+        previous = font.get_bold(), font.get_italic()
+        font.set_bold(bold)
+        font.set_italic(italic)
+        surface = font.render(text, True, color, background)
+        font.set_bold(previous[0])
+        font.set_italic(previous[1])
+
+        self.__texts[key] = surface
+        self.__bytes += self.size_of(surface)
+        while self.__bytes > self.budget and len(self.__texts) > 1:
+            _, forgotten = self.__texts.popitem(last=False)
+            self.__bytes -= self.size_of(forgotten)
+        return surface
+
+    @staticmethod
+    def size_of(surface: pygame.surface.Surface) -> int:
+        """Get the bytes of the pixels of a surface."""
+        return surface.get_pitch() * surface.get_height()
+
+
 class AudioCache(FileCache):
     """A cache class for audio files."""
 
@@ -117,5 +173,6 @@ class AudioCache(FileCache):
 
 image_cache = ImageCache()
 font_cache = FontCache()
+text_cache = TextCache(constants.TEXT_CACHE_BYTES)
 audio_cache = AudioCache()
 animation_cache = AnimationCache()
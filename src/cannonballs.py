@@ -1,13 +1,20 @@
 import math
 import sys
 from abc import abstractmethod
+from typing import Optional
 
+import numpy as np
 import pygame
 
 import constants
 import context
 from draw import Drawable
 
+# Side of the square sprites of the cannonballs, centered on their position
+SPRITE_SIZE = 96  # px
+# The sprites are rotated in steps of this angle
+SPRITE_ANGLE_STEP = 5  # degrees
+
 
 class Cannonball(Drawable):
     """
@@ -19,19 +26,31 @@ class Cannonball(Drawable):
     damage: int
     radius: float
     position: pygame.Vector2
+    previous_position: pygame.Vector2
+    interpolation: float
     velocity: pygame.Vector2
-    trajectory: list[pygame.Vector2]
+    trajectory: np.ndarray  # ring buffer with the last points of the path
+    trajectory_length: int  # points added to the path
+    trajectory_drawn: int  # points already drawn on the overlay
+    trajectory_overlay: Optional[pygame.surface.Surface]
+    trajectory_bounds: Optional[pygame.Rect]  # area of the points on the overlay
     max_height: float
     max_distance: int
     is_alive: bool
 
     def __init__(self, position: pygame.Vector2, velocity: pygame.Vector2):
         self.position = position
+        self.previous_position = position.copy()
+        self.interpolation = 1.0
         self.velocity = velocity
         self.max_height = sys.maxsize
         self.max_distance = sys.maxsize
         self.is_alive = True
-        self.trajectory = []
+        self.trajectory = np.empty((constants.TRAJECTORY_POINTS, 2))
+        self.trajectory_length = 0
+        self.trajectory_drawn = 0
+        self.trajectory_overlay = None
+        self.trajectory_bounds = None
         self.radius_damage = 0
 
     def tick(self, dt: float, gravity: float):
@@ -40,21 +59,22 @@ class Cannonball(Drawable):
         of time, its purpose is to simulate the movement and behavior of the
         parable drawn by the cannonball.
         """
+        self.previous_position = self.position.copy()
         self.position += self.velocity * dt
         self.velocity[1] += gravity * dt
 
         if self.position.y < self.max_height:
             self.max_height = self.position.y
 
+        last = self.trajectory[(self.trajectory_length - 1) % len(self.trajectory)]
         if (
-            len(self.trajectory) == 0
-            or (
-                (self.trajectory[-1].x - self.position.x) ** 2
-                + (self.trajectory[-1].y - self.position.y) ** 2
-            )
-            > 50
+            self.trajectory_length == 0
+            or (last[0] - self.position.x) ** 2 + (last[1] - self.position.y) ** 2 > 50
         ):
-            self.trajectory.append(pygame.Vector2(self.position.x, self.position.y))
+            self.trajectory[self.trajectory_length % len(self.trajectory)] = (
+                self.position
+            )
+            self.trajectory_length += 1
 
     def kill(self):
         """
@@ -63,19 +83,89 @@ class Cannonball(Drawable):
         life status in False
         """
         del self.trajectory
+        self.trajectory_overlay = None
         self.is_alive = False
 
     def draw_trajectory(self, screen: pygame.surface.Surface):
         """
-        This function draws the trajectory of the bullet, for each point on the
-        trajectory list draws a circle.
+        This function draws the trajectory of the bullet. The points are drawn
+        as circles on an overlay that is kept between frames, so only the
+        points added since the last call are drawn, and then the area of the
+        overlay that has points is drawn on the screen.
+        """
+        if self.trajectory_overlay is None:
+            self.trajectory_overlay = pygame.surface.Surface(screen.get_size())
+            self.trajectory_overlay.fill(constants.TRAJECTORY_COLORKEY)
+            self.trajectory_overlay.set_colorkey(constants.TRAJECTORY_COLORKEY)
+
+        # The points that the ring buffer has overwritten are already drawn
+        first = max(
+            self.trajectory_drawn, self.trajectory_length - len(self.trajectory)
+        )
+        for index in range(first, self.trajectory_length):
+            x, y = self.trajectory[index % len(self.trajectory)]
+            rect = pygame.draw.circle(self.trajectory_overlay, "#000000", (x, y), 1)
+            if self.trajectory_bounds is None:
+                self.trajectory_bounds = rect
+            else:
+                self.trajectory_bounds.union_ip(rect)
+        self.trajectory_drawn = self.trajectory_length
+
+        if self.trajectory_bounds is not None:
+            screen.blit(
+                self.trajectory_overlay, self.trajectory_bounds, self.trajectory_bounds
+            )
+
+    def get_draw_position(self) -> pygame.Vector2:
+        """
+        This function returns the position where the bullet must be drawn,
+        interpolated between the last two steps of the simulation.
         """
-        for point in self.trajectory:
-            pygame.draw.circle(screen, "#000000", (point.x, point.y), 1)
+        return self.previous_position.lerp(self.position, self.interpolation)
 
-    @abstractmethod
     def draw(self, screen: pygame.surface.Surface) -> None:
-        """This function is responsible for drawing the bullet chosen by the user"""
+        """
+        This function is responsible for drawing the bullet chosen by the user,
+        with the sprite of its travel angle.
+        """
+        position = self.get_draw_position()
+        travel_angle = math.degrees(math.atan2(self.velocity.y, self.velocity.x))
+        sprite, offset = sprite_cache[type(self), travel_angle, self.is_alive]
+        screen.blit(sprite, position + offset)
+
+    def get_rect(self) -> pygame.Rect:
+        """This function returns the area where the bullet is drawn"""
+        position = self.get_draw_position()
+        travel_angle = math.degrees(math.atan2(self.velocity.y, self.velocity.x))
+        sprite, offset = sprite_cache[type(self), travel_angle, self.is_alive]
+        return sprite.get_rect(topleft=position + offset).inflate(2, 2)
+
+    def get_trajectory_rect(self) -> pygame.Rect:
+        """
+        This function returns the area where the points of the trajectory kept
+        in the ring buffer are drawn.
+        """
+        points = self.trajectory[: min(self.trajectory_length, len(self.trajectory))]
+        if len(points) == 0:
+            return pygame.Rect(0, 0, 0, 0)
+        low, high = points.min(axis=0), points.max(axis=0)
+        return pygame.Rect(
+            low[0] - 2, low[1] - 2, high[0] - low[0] + 5, high[1] - low[1] + 5
+        )
+
+    @staticmethod
+    @abstractmethod
+    def paint(
+        screen: pygame.surface.Surface,
+        position: pygame.Vector2,
+        angle_x: float,
+        angle_y: float,
+        is_alive: bool,
+    ) -> None:
+        """
+        This function is responsible for drawing the bullet at the given
+        position, with the cosine and sine of its travel angle.
+        """
         raise NotImplementedError
 
     def get_max_height(self) -> int:
@@ -112,27 +202,33 @@ class Cannonball105mm(Cannonball):
 
     radius_damage: int
     units_available: int
+    price: int
 
     def __init__(self, position: pygame.Vector2, velocity: pygame.Vector2):
         super().__init__(position, velocity)
         self.damage = 50
         self.radius_damage = 30
         self.units_available = 3
+        self.price = 4000
         self.radius = 30
 
-    def draw(self, screen: pygame.surface.Surface) -> None:
+    @staticmethod
+    def paint(
+        screen: pygame.surface.Surface,
+        position: pygame.Vector2,
+        angle_x: float,
+        angle_y: float,
+        is_alive: bool,
+    ) -> None:
         """This function is responsible for drawing the bullet chosen by the user"""
-        travel_angle = math.atan2(self.velocity.y, self.velocity.x)
-        angle_x = math.cos(travel_angle)
-        angle_y = math.sin(travel_angle)
-        tail_x = self.position.x + 20 * angle_x
-        tail_y = self.position.y - 20 * angle_y
+        tail_x = position.x + 20 * angle_x
+        tail_y = position.y - 20 * angle_y
         middle_x = tail_x + 5 * angle_x
         middle_y = tail_y - 5 * angle_y
         pygame.draw.line(
             screen,
             "gray",
-            (self.position.x, self.position.y),
+            (position.x, position.y),
             (tail_x, tail_y),
             4,
         )
@@ -146,7 +242,7 @@ class Cannonball105mm(Cannonball):
         pygame.draw.circle(
             screen,
             "black",
-            (self.position.x, self.position.y),
+            (position.x, position.y),
             12,
         )
 
@@ -159,31 +255,37 @@ class Cannonball60mm(Cannonball):
 
     radius_damage: int
     units_available: int
+    price: int
 
     def __init__(self, position: pygame.Vector2, velocity: pygame.Vector2):
         super().__init__(position, velocity)
         self.damage = 30
         self.radius_damage = 10
         self.units_available = 3
+        self.price = 1000
         self.radius = 10
 
-    def draw(self, screen: pygame.surface.Surface) -> None:
+    @staticmethod
+    def paint(
+        screen: pygame.surface.Surface,
+        position: pygame.Vector2,
+        angle_x: float,
+        angle_y: float,
+        is_alive: bool,
+    ) -> None:
         """This function is responsible for drawing the bullet chosen by the user"""
-        travel_angle = math.atan2(self.velocity.y, self.velocity.x)
-        angle_x = math.cos(travel_angle)
-        angle_y = math.sin(travel_angle)
-        tail_x = self.position.x - 10 * angle_x
-        tail_y = self.position.y - 10 * angle_y
+        tail_x = position.x - 10 * angle_x
+        tail_y = position.y - 10 * angle_y
 
         pygame.draw.line(
             screen,
             "#4b5320",
-            (self.position.x, self.position.y),
+            (position.x, position.y),
             (tail_x, tail_y),
             4,
         )
 
-        if self.is_alive:
+        if is_alive:
             fire_x = tail_x - 6 * angle_x
             fire_y = tail_y - 6 * angle_y
             pygame.draw.line(screen, "#fbb741", (tail_x, tail_y), (fire_x, fire_y), 6)
@@ -197,36 +299,95 @@ class Cannonball80mm(Cannonball):
 
     radius_damage: int
     units_available: int
+    price: int
 
     def __init__(self, position: pygame.Vector2, velocity: pygame.Vector2):
         super().__init__(position, velocity)
         self.damage = 40
         self.radius_damage = 20
         self.units_available = 10
+        self.price = 2500
         self.radius = 20
 
-    def draw(self, screen: pygame.surface.Surface) -> None:
+    @staticmethod
+    def paint(
+        screen: pygame.surface.Surface,
+        position: pygame.Vector2,
+        angle_x: float,
+        angle_y: float,
+        is_alive: bool,
+    ) -> None:
         """This function is responsible for drawing the bullet chosen by the user"""
-        travel_angle = math.atan2(self.velocity.y, self.velocity.x)
-        angle_x = math.cos(travel_angle)
-        angle_y = math.sin(travel_angle)
-
-        tail_x = self.position.x - 25 * angle_x
-        tail_y = self.position.y - 25 * angle_y
+        tail_x = position.x - 25 * angle_x
+        tail_y = position.y - 25 * angle_y
 
         pygame.draw.line(
             screen,
             constants.DarkGreen,
-            (self.position.x, self.position.y),
+            (position.x, position.y),
             (tail_x, tail_y),
             10,
         )
 
-        sep_start = (self.position.x - 10 * angle_x, self.position.y - 10 * angle_y)
-        sep_end = (self.position.x - 15 * angle_x, self.position.y - 15 * angle_y)
+        sep_start = (position.x - 10 * angle_x, position.y - 10 * angle_y)
+        sep_end = (position.x - 15 * angle_x, position.y - 15 * angle_y)
 
         pygame.draw.line(screen, "yellow", sep_start, sep_end, 10)
 
         cola = (tail_x - 10 * angle_x, tail_y - 10 * angle_y)
 
         pygame.draw.line(screen, "orange", (tail_x, tail_y), cola, 4)
+
+
+class SpriteCache:
+    """
+    A cache class for the sprites of the cannonballs, drawn once for every
+    type of cannonball and travel angle, rounded to SPRITE_ANGLE_STEP.
+    """
+
+    __sprites: dict[
+        tuple[type, int, bool], tuple[pygame.surface.Surface, pygame.Vector2]
+    ]
+
+    def __init__(self):
+        self.__sprites = {}
+
+    def __getitem__(
+        self, sprite_params: tuple[type, float, bool]
+    ) -> tuple[pygame.surface.Surface, pygame.Vector2]:
+        """
+        Get the sprite of the given type of cannonball, travel angle in
+        degrees and alive state from the cache, cropped to what is drawn, and
+        the offset from the position of the cannonball to its corner.
+        """
+        cannonball_type, travel_angle, is_alive = sprite_params
+        steps = 360 // SPRITE_ANGLE_STEP
+        key = (
+            cannonball_type,
+            round(travel_angle / SPRITE_ANGLE_STEP) % steps,
+            is_alive,
+        )
+
+        if key not in self.__sprites:
+            angle = math.radians(key[1] * SPRITE_ANGLE_STEP)
+            sprite = pygame.surface.Surface((SPRITE_SIZE, SPRITE_SIZE), pygame.SRCALPHA)
+            cannonball_type.paint(
+                sprite,
+                pygame.Vector2(SPRITE_SIZE // 2, SPRITE_SIZE // 2),
+                math.cos(angle),
+                math.sin(angle),
+                is_alive,
+            )
+            bounds = sprite.get_bounding_rect()
+            sprite = sprite.subsurface(bounds).copy()
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.__sprites[key] = (
+                sprite,
+                pygame.Vector2(bounds.topleft) - (SPRITE_SIZE // 2, SPRITE_SIZE // 2),
+            )
+
+        return self.__sprites[key]
+
+
+sprite_cache = SpriteCache()
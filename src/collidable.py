@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import Optional
 
 from pygame import Vector2
 
@@ -21,3 +22,16 @@ class Collidable:
         10 meters before collide.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def sweep(
+        self, start: Vector2, end: Vector2, validation_distance: float = 0
+    ) -> Optional[float]:
+        """
+        This method is the continuous version of collides_with, it is
+        responsible for saying when a point that moves in a straight line from
+        start to end collides with self for the first time. It should return
+        the fraction of the way, between 0 and 1, where the contact happens or
+        None if it does not collide in that segment.
+        """
+        raise NotImplementedError
@@ -1,3 +1,4 @@
+from difficulty import BotDifficulty
 from effects import AmbientEffect
 
 # Default settings
@@ -5,6 +6,8 @@ DEFAULT_NUMBER_OF_PLAYERS = 2
 DEFAULT_ROUNDS = 1
 DEFAULT_NUMBER_OF_BOTS = 0
 DEFAULT_TYPE_EFFECT = AmbientEffect.NONE
+DEFAULT_BOT_DIFFICULTY = BotDifficulty.NORMAL
+DEFAULT_SIMULTANEOUS_TURNS = False
 DEFAULT_GRAVITY = 9.8  # m/s^2
 DEFAULT_WINDOWS_SIZE = (800, 800)
 
@@ -14,6 +17,7 @@ GRAY = (94, 94, 110)
 DarkGreen = "#1C542D"
 White = "#FFFFFF"
 HUD_BACKGROUND = "#282828"
+TRAJECTORY_COLORKEY = (255, 0, 255)  # transparent color of the trajectory
 
 # Limits
 EPSILON = 0.0001
@@ -21,6 +25,11 @@ MIN_GRAVITY = 1.0
 MAX_GRAVITY = 30.0
 SHOOT_MAX_SPEED = 400
 FPS = 75
+PHYSICS_FPS = 75  # fixed steps per second of the simulation
+MAX_FRAME_TIME = 0.25  # s, longer frames are not fully simulated
+TRAJECTORY_POINTS = 1024  # last points of the path of a cannonball kept
+DIRTY_AREA_LIMIT = 0.5  # part of the window updated before a full flip
+TEXT_CACHE_BYTES = 16 * 1024 * 1024  # rendered texts kept in memory
 
 # Terrain settings
 SEA_LEVEL = 200  # px
@@ -42,6 +51,17 @@ DAMAGE_PER_SPEED = 0.1
 TANK_RADIO = 18
 TANK_OFFSET = 20  # tanks float this many pixels up
 BOT_SLEEP_TIME = 1000  # ms
+# ms, then the bots shoot the best shot found. The time is taken from the
+# pause of BOT_SLEEP_TIME, so a turn of a bot is not longer because of it
+BOT_THINK_TIME = 1000
+# shots that the bots try for each difficulty
+BOT_SEARCH_BUDGET = {
+    BotDifficulty.EASY: 500,
+    BotDifficulty.NORMAL: 3000,
+    BotDifficulty.HARD: 10000,
+}
+# the bots forget their shots at a tank when it or the bot moves further
+BOT_HISTORY_TOLERANCE = 4  # px
 
 # Map settings
 MAP_SEED = -1
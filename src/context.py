@@ -9,6 +9,7 @@ from pygame.time import Clock
 
 import constants
 import player
+from difficulty import BotDifficulty
 from effects import AmbientEffect
 
 
@@ -29,6 +30,8 @@ class Context:
     clock: pygame.time.Clock
     players: list[player.Player]
     type_of_effect: AmbientEffect
+    bot_difficulty: BotDifficulty
+    simultaneous_turns: bool
 
     def __init__(self) -> None:
         """Initialize the class with the default values"""
@@ -38,6 +41,8 @@ class Context:
         self.number_of_rounds = constants.DEFAULT_ROUNDS
         self.number_of_bots = constants.DEFAULT_NUMBER_OF_BOTS
         self.type_of_effect = constants.DEFAULT_TYPE_EFFECT
+        self.bot_difficulty = constants.DEFAULT_BOT_DIFFICULTY
+        self.simultaneous_turns = constants.DEFAULT_SIMULTANEOUS_TURNS
         self.__fps = float(constants.FPS)
         self.clock = Clock()
         self.players = []
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class BotDifficulty(Enum):
+    """
+    This class defines an enumerator with the difficulty of the bots. Each
+    level gives them a bigger number of shots to try while they think, see
+    BOT_SEARCH_BUDGET.
+    """
+
+    EASY = 0
+    NORMAL = 1
+    HARD = 2
@@ -44,6 +44,12 @@ class Explosion(Drawable):
         self.current_index = 0
         self.loop = loop
 
+    def get_rect(self) -> pygame.Rect:
+        """Returns the area where the current frame of the animation is drawn."""
+        rect = self.images[self.current_index].get_rect()
+        rect.center = (int(self.position[0]), int(self.position[1]))
+        return rect.inflate(2, 2)
+
     def draw(self, screen: pygame.surface.Surface) -> None:
         """Draws the current frame of the explosion animation on the screen."""
         pos_x = self.position[0] - self.images[self.current_index].get_size()[0] // 2
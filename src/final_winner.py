@@ -1,7 +1,7 @@
 import pygame
 
 import constants
-from caches import font_cache, image_cache
+from caches import image_cache, text_cache
 from context import instance
 from inputs import check_running
 
@@ -68,7 +68,7 @@ class FinalWinner:
 
     def __init__(self):
         self.instance = instance
-        self.font = font_cache["Roboto.ttf", int(self.instance.windows_size[0] / 51.2)]
+        self.font = ("Roboto.ttf", int(self.instance.windows_size[0] / 51.2))
         self.tanks = self.instance.players
 
     def final_winner(self):
@@ -109,10 +109,8 @@ class FinalWinner:
                 self.instance.windows_size[1] / 2 - size[1] / 2,
             ),
         )
-        out_text = self.font.render(
-            "Presione espacio para ver la tabla de posiciones",
-            True,
-            "white",
+        out_text = text_cache.render(
+            self.font, "Presione espacio para ver la tabla de posiciones", "white"
         )
         size = out_text.get_rect().size
         screen.blit(
@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class HeightIndex:
+    """
+    This class is a range maximum index over the height of the terrain
+    columns. It is a segment tree stored in a flat array, where the leaves are
+    the columns and every node keeps the highest column below it, so the
+    highest ground under any range of columns is found in logarithmic time and
+    it can be updated when a crater is carved.
+    """
+
+    size: int
+    leaves: int
+    tree: np.ndarray
+
+    def __init__(self, heights: np.ndarray):
+        """Builds the tree, level by level, for the given column heights"""
+        self.size = len(heights)
+        self.leaves = 1 << max(0, (self.size - 1).bit_length())
+        self.tree = np.full(2 * self.leaves, -np.inf)
+        self.tree[self.leaves : self.leaves + self.size] = heights
+
+        level = self.leaves
+        while level > 1:
+            self.tree[level // 2 : level] = np.maximum(
+                self.tree[level : 2 * level : 2], self.tree[level + 1 : 2 * level : 2]
+            )
+            level //= 2
+
+    def update(self, start: int, end: int, heights: np.ndarray) -> None:
+        """
+        Replaces the heights of the columns in [start, end) and recalculates
+        only the nodes above them.
+        """
+        if start >= end:
+            return
+
+        self.tree[self.leaves + start : self.leaves + end] = heights
+        low = (self.leaves + start) // 2
+        high = (self.leaves + end - 1) // 2
+        while low >= 1:
+            self.tree[low : high + 1] = np.maximum(
+                self.tree[2 * low : 2 * high + 2 : 2],
+                self.tree[2 * low + 1 : 2 * high + 2 : 2],
+            )
+            low //= 2
+            high //= 2
+
+    def max(self, start: int, end: int) -> float:
+        """
+        Returns the highest column in [start, end), or -inf if the range is
+        empty.
+        """
+        start = max(start, 0) + self.leaves
+        end = min(end, self.size) + self.leaves
+        highest = -np.inf
+
+        while start < end:
+            if start & 1:
+                highest = max(highest, self.tree[start])
+                start += 1
+            if end & 1:
+                end -= 1
+                highest = max(highest, self.tree[end])
+            start //= 2
+            end //= 2
+
+        return float(highest)
+
+    def chunks(self, chunk_size: int) -> np.ndarray:
+        """
+        Returns the highest column of every aligned chunk of chunk_size
+        columns, chunk_size must be a power of two not bigger than the number
+        of leaves.
+        """
+        first = self.leaves // chunk_size
+        count = -(-self.size // chunk_size)
+        return self.tree[first : first + count]
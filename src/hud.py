@@ -1,10 +1,10 @@
 import math
-from typing import Optional
+from typing import Callable, Optional
 
 import pygame
 
 import constants
-from caches import font_cache, image_cache
+from caches import image_cache, text_cache
 from context import instance
 from draw import Drawable
 from effects import AmbientEffect
@@ -25,6 +25,11 @@ class HUD(Drawable):
     width = 160
     height = 50
     color: dict[int, int]
+    layer: pygame.Surface  # background of the window and panels of the HUD
+    panel_keys: dict[str, tuple]  # state shown on each panel of the layer
+    redrawn_rects: list[pygame.Rect]  # panels drawn again by the last draw
+    icons: dict[tuple[str, int, int], pygame.Surface]  # scaled images
+    overlay_rects: list[pygame.Rect]  # areas drawn by the last draw_overlay
 
     def __init__(self, tanks: list[Tank], tank_game, gravity, wind: Optional[Wind]):
         self.tank_game = tank_game
@@ -37,10 +42,10 @@ class HUD(Drawable):
                 / 3.6
             )
         )
-        self.font = font_cache["Roboto.ttf", int(instance.windows_size[0] // 53.33)]
-        self.font30 = font_cache["Roboto.ttf", int(instance.windows_size[0] // 42.6)]
-        self.font16 = font_cache["Roboto.ttf", int(instance.windows_size[0] // 80)]
-        self.font12 = font_cache["Roboto.ttf", int(instance.windows_size[0] // 106.6)]
+        self.font = ("Roboto.ttf", int(instance.windows_size[0] // 53.33))
+        self.font30 = ("Roboto.ttf", int(instance.windows_size[0] // 42.6))
+        self.font16 = ("Roboto.ttf", int(instance.windows_size[0] // 80))
+        self.font12 = ("Roboto.ttf", int(instance.windows_size[0] // 106.6))
         self.text_angle1 = None
         self.text_angle2 = None
         self.text_velocity1 = None
@@ -53,6 +58,12 @@ class HUD(Drawable):
             self.actual_gravity = gravity
         if wind is not None:
             self.actual_wind = wind
+        self.layer = pygame.Surface(instance.windows_size)
+        self.layer.fill(constants.HUD_BACKGROUND)
+        self.panel_keys = {}
+        self.redrawn_rects = []
+        self.icons = {}
+        self.overlay_rects = []
 
     def draw_shoot_info(self, screen: pygame.surface.Surface) -> None:
         """
@@ -82,35 +93,37 @@ class HUD(Drawable):
                 instance.windows_size[0] / 1.349,
                 instance.windows_size[1] // 1.6,
             )
-        screen.blit(rect_surface, (rect_x1, rect_y1))
-        screen.blit(rect_surface, (rect_x2, rect_y2))
+        self.overlay_rects.append(screen.blit(rect_surface, (rect_x1, rect_y1)))
+        self.overlay_rects.append(screen.blit(rect_surface, (rect_x2, rect_y2)))
 
         if self.tank_game.cannonball is not None:
-            self.text_cannonball_info = self.font.render(
+            self.text_cannonball_info = text_cache.render(
+                self.font,
                 f"Maxima Altura: {self.tank_game.cannonball.get_max_height()} [m]",
-                True,
                 "white",
             )
-            screen.blit(
-                self.text_cannonball_info,
-                pygame.Vector2(
-                    instance.windows_size[0] / 32, instance.windows_size[1] / 1.56
-                ),
+            self.overlay_rects.append(
+                screen.blit(
+                    self.text_cannonball_info,
+                    pygame.Vector2(
+                        instance.windows_size[0] / 32, instance.windows_size[1] / 1.56
+                    ),
+                )
             )
 
             distance = self.tank_game.cannonball.calculate_distance_to(
                 self.tanks[self.tank_game.actual_player].position
             )
-            self.text_cannonball_info = self.font.render(
-                f"Distancia total: {int(distance)}[m]",
-                True,
-                "white",
+            self.text_cannonball_info = text_cache.render(
+                self.font, f"Distancia total: {int(distance)}[m]", "white"
             )
-            screen.blit(
-                self.text_cannonball_info,
-                pygame.Vector2(
-                    instance.windows_size[0] / 1.29, instance.windows_size[1] / 1.56
-                ),
+            self.overlay_rects.append(
+                screen.blit(
+                    self.text_cannonball_info,
+                    pygame.Vector2(
+                        instance.windows_size[0] / 1.29, instance.windows_size[1] / 1.56
+                    ),
+                )
             )
 
     @staticmethod
@@ -217,6 +230,16 @@ class HUD(Drawable):
             25,
         )
 
+    def get_icon(self, filename: str, size: tuple[float, float]) -> pygame.Surface:
+        """
+        This method returns the image scaled to the given size, it is only
+        scaled the first time it is requested.
+        """
+        key = (filename, int(size[0]), int(size[1]))
+        if key not in self.icons:
+            self.icons[key] = pygame.transform.scale(image_cache[filename], size)
+        return self.icons[key]
+
     def tank_info(self) -> pygame.Surface:
         """
         This method is responsible for displaying all the tank and player
@@ -228,12 +251,11 @@ class HUD(Drawable):
         sf = pygame.Surface((width, height))
         sf.fill("#232323")
         # this is for health
-        heart_icon = image_cache["images/heart.png"]
-        heart_icon = pygame.transform.scale(heart_icon, (width / 14, height / 8))
+        heart_icon = self.get_icon("images/heart.png", (width / 14, height / 8))
         sf.blit(heart_icon, (width / 7.5, height / 3.5))
         width_bar = width / 7.5 + width / 10
         height_bar = height / 3.7
-        text = self.font30.render("Información", True, "white")
+        text = text_cache.render(self.font30, "Información", "white")
         sf.blit(text, (width / 2 - text.get_size()[0] / 2, 5))
         bar_length = width // 1.5
         bar_height = height / 6.66
@@ -244,42 +266,39 @@ class HUD(Drawable):
             "#131313",
             (width_bar + fill1, height_bar, bar_length - fill1 + 1, bar_height),
         )
-        player = self.font16.render(
-            "Salud " + str(actual_tank.life) + " / 100", True, "white"
+        player = text_cache.render(
+            self.font16, "Salud " + str(actual_tank.life) + " / 100", "white"
         )
         sf.blit(player, (width_bar + width_bar // 9, height_bar + height_bar // 9))
 
         # this is for money
-        money_icon = image_cache["images/money.png"]
-        money_icon = pygame.transform.scale(money_icon, (width / 11.66, height / 6.66))
+        money_icon = self.get_icon("images/money.png", (width / 11.66, height / 6.66))
         sf.blit(money_icon, (width / 7.5, height / 2.2))
-        actual_money = self.font16.render(
+        actual_money = text_cache.render(
+            self.font16,
             "Dinero disponible: $" + str(actual_tank.player.money),
-            True,
             "#FFFFFF",
         )
         sf.blit(actual_money, (width / 4, height / 2))
 
         # this is por murders
-        murders_icon = image_cache["images/murders.png"]
-        murders_icon = pygame.transform.scale(murders_icon, (width / 14, height / 8))
+        murders_icon = self.get_icon("images/murders.png", (width / 14, height / 8))
         sf.blit(murders_icon, (width / 7.5, height / 1.55))
-        actual_murders = self.font16.render(
+        actual_murders = text_cache.render(
+            self.font16,
             "Asesinatos cometidos: "
             + str(self.tanks[self.tank_game.actual_player].player.murders),
-            True,
             "#FFFFFF",
         )
         sf.blit(actual_murders, (width / 4, height / 1.5))
 
         # this is por deads
-        deads_icon = image_cache["images/deads.png"]
-        deads_icon = pygame.transform.scale(deads_icon, (width / 14, height / 8))
+        deads_icon = self.get_icon("images/deads.png", (width / 14, height / 8))
         sf.blit(deads_icon, (width / 7.5, height / 1.25))
-        actual_deads = self.font16.render(
+        actual_deads = text_cache.render(
+            self.font16,
             "Veces que ha muerto: "
             + str(self.tanks[self.tank_game.actual_player].player.deaths),
-            True,
             "#FFFFFF",
         )
         sf.blit(actual_deads, (width / 4, height / 1.2))
@@ -295,8 +314,8 @@ class HUD(Drawable):
         height = instance.windows_size[1] / 3.6
         sf = pygame.Surface((width, height))
         sf.fill("#232323")
-        actual_player1 = self.font30.render("Jugador", True, "#FFFFFF")
-        actual_player = self.font30.render("actual", True, "#FFFFFF")
+        actual_player1 = text_cache.render(self.font30, "Jugador", "#FFFFFF")
+        actual_player = text_cache.render(self.font30, "actual", "#FFFFFF")
         sf.blit(actual_player1, (width / 6, height / 72))
         sf.blit(actual_player, (width / 4, height / 7))
         pygame.draw.rect(
@@ -361,13 +380,13 @@ class HUD(Drawable):
         sf = pygame.Surface((width, height))
         sf.fill("#232323")
         alto = height // 2
-        text = self.font30.render("Selección de bala", True, "white")
+        text = text_cache.render(self.font30, "Selección de bala", "white")
         sf.blit(text, (width / 2 - text.get_size()[0] / 2, width / 40))
-        mm60 = self.font16.render("60MM", True, "white")
+        mm60 = text_cache.render(self.font16, "60MM", "white")
         sf.blit(mm60, (width / 3 - mm60.get_size()[0] / 0.5, width / 7))
-        mm80 = self.font16.render("80MM", True, "white")
+        mm80 = text_cache.render(self.font16, "80MM", "white")
         sf.blit(mm80, (width / 2 - mm80.get_size()[0] / 1.5, width / 7))
-        mm105 = self.font16.render("105MM", True, "white")
+        mm105 = text_cache.render(self.font16, "105MM", "white")
         sf.blit(mm105, (width / 1.2 - mm105.get_size()[0] / 2, width / 7))
         ancho = width / 7
         for i in range(3):
@@ -387,11 +406,7 @@ class HUD(Drawable):
         if instance.windows_size[0] != instance.windows_size[1]:
             for i in range(3):
                 pygame.draw.circle(sf, "#45484A", (ancho, alto), width / 17.5)
-                cantidad = self.font.render(
-                    f"{self.color[i]}",
-                    True,
-                    "white",
-                )
+                cantidad = text_cache.render(self.font, f"{self.color[i]}", "white")
                 if self.color[i] > 9:
                     sf.blit(cantidad, (ancho - width / 23.33, alto - height / 13.33))
                 else:
@@ -400,11 +415,7 @@ class HUD(Drawable):
         else:
             for i in range(3):
                 pygame.draw.circle(sf, "#45484A", (ancho, alto), width / 17.5)
-                cantidad = self.font.render(
-                    f"{self.color[i]}",
-                    True,
-                    "white",
-                )
+                cantidad = text_cache.render(self.font, f"{self.color[i]}", "white")
                 if self.color[i] > 9:
                     sf.blit(cantidad, (ancho - width / 23.33, alto - height / 27.33))
                 else:
@@ -426,17 +437,18 @@ class HUD(Drawable):
         sf = pygame.Surface((width, height))
         sf.fill("#232323")
 
-        text = self.font30.render("Ajustes de bala", True, "white")
-        velocity_label = self.font16.render("Velocidad", True, "white")
-        angle_label = self.font16.render("Angulo", True, "white")
-        gravity_label = self.font16.render("Gravedad", True, "white")
-        wind_label = self.font16.render("Viento", True, "white")
+        text = text_cache.render(self.font30, "Ajustes de bala", "white")
+        velocity_label = text_cache.render(self.font16, "Velocidad", "white")
+        angle_label = text_cache.render(self.font16, "Angulo", "white")
+        gravity_label = text_cache.render(self.font16, "Gravedad", "white")
+        wind_label = text_cache.render(self.font16, "Viento", "white")
 
         self.speedometer.actual = self.tank_game.tanks[
             self.tank_game.actual_player
         ].shoot_velocity
-        self.font16.set_bold(True)
-        velocity = self.font16.render(f"{self.speedometer.actual:.2f}", True, "white")
+        velocity = text_cache.render(
+            self.font16, f"{self.speedometer.actual:.2f}", "white", bold=True
+        )
 
         sf.blit(text, (width / 2 - text.get_size()[0] / 2, width / 70))
         cds = pygame.rect.Rect(
@@ -460,10 +472,8 @@ class HUD(Drawable):
             AmbientEffect.GRAVITY_AND_WIND,
             AmbientEffect.GRAVITY,
         ]:
-            gravity = self.font16.render(
-                f"{self.actual_gravity:.2f}",
-                True,
-                "white",
+            gravity = text_cache.render(
+                self.font16, f"{self.actual_gravity:.2f}", "white", bold=True
             )
             cds = pygame.rect.Rect(
                 (2 / 4) * width - width / 35,
@@ -486,10 +496,8 @@ class HUD(Drawable):
             AmbientEffect.GRAVITY_AND_WIND,
             AmbientEffect.WIND,
         ]:
-            wind = self.font16.render(
-                f"{self.actual_wind.velocity:.2f}",
-                True,
-                "white",
+            wind = text_cache.render(
+                self.font16, f"{self.actual_wind.velocity:.2f}", "white", bold=True
             )
 
             cds = pygame.rect.Rect(
@@ -508,10 +516,11 @@ class HUD(Drawable):
                 ),
             )
 
-        angle = self.font16.render(
+        angle = text_cache.render(
+            self.font16,
             f"{math.degrees(self.tank_game.tanks[self.tank_game.actual_player].shoot_angle):.2f}",
-            True,
             "white",
+            bold=True,
         )
 
         cds = pygame.rect.Rect(
@@ -529,11 +538,8 @@ class HUD(Drawable):
                 (6 / 8) * height - height / 23.33 - velocity_label.get_size()[1],
             ),
         )
-        self.font16.set_bold(False)
 
-        sf.blit(
-            self.speedometer.get_draw(), (width / 15, (1 / 3) * height - height / 20)
-        )
+        self.speedometer.draw(sf, (width / 15, (1 / 3) * height - height / 20))
 
         return sf
 
@@ -549,10 +555,12 @@ class HUD(Drawable):
         for tank in self.tank_game.tanks:
             if tank != self.tank_game.tanks[self.tank_game.actual_player]:
                 bar_length = (tank.life / 100) * width
-                pygame.draw.rect(
-                    sf,
-                    "gray",
-                    (tank.position.x + 5, tank.position.y + 50, width, height),
+                self.overlay_rects.append(
+                    pygame.draw.rect(
+                        sf,
+                        "gray",
+                        (tank.position.x + 5, tank.position.y + 50, width, height),
+                    )
                 )
 
                 if tank.life <= 100:
@@ -562,19 +570,76 @@ class HUD(Drawable):
                 if tank.life < 50:
                     color_life = "red"
 
-                pygame.draw.rect(
-                    sf,
-                    color_life,
-                    (tank.position.x + 5, tank.position.y + 50, bar_length, height),
+                self.overlay_rects.append(
+                    pygame.draw.rect(
+                        sf,
+                        color_life,
+                        (tank.position.x + 5, tank.position.y + 50, bar_length, height),
+                    )
                 )
 
+    def get_panels(
+        self,
+    ) -> list[tuple[Callable[[], pygame.Surface], tuple, tuple[float, float]]]:
+        """
+        This method returns, for every panel of the HUD, the method that draws
+        it, the state it shows, with the precision used to display it, and
+        its position on the window.
+        """
+        actual_tank = self.tanks[self.tank_game.actual_player]
+        top = (
+            instance.windows_size[1]
+            - instance.windows_size[1] / 3.6
+            - instance.border_padding / 2
+        )
+        hud_top = (
+            instance.windows_size[1] - instance.hud_height - instance.border_padding / 2
+        )
+        return [
+            (
+                self.get_actual_player,
+                (actual_tank.color,),
+                (instance.border_padding - instance.windows_size[0] / 128, top),
+            ),
+            (
+                self.get_cannonball_indicators,
+                (
+                    f"{actual_tank.shoot_velocity:.2f}",
+                    f"{math.degrees(actual_tank.shoot_angle):.2f}",
+                    f"{self.tank_game.gravity:.2f}",
+                    (
+                        None
+                        if self.tank_game.wind is None
+                        else f"{self.tank_game.wind.velocity:.2f}"
+                    ),
+                ),
+                (instance.border_padding + instance.windows_size[0] / 7.5, top),
+            ),
+            (
+                self.get_select_cannonball,
+                (tuple(actual_tank.player.ammunition.values()), actual_tank.actual),
+                (instance.border_padding + instance.windows_size[0] / 2.39, hud_top),
+            ),
+            (
+                self.tank_info,
+                (
+                    actual_tank.life,
+                    actual_tank.player.money,
+                    actual_tank.player.murders,
+                    actual_tank.player.deaths,
+                ),
+                (instance.border_padding + instance.windows_size[0] / 1.42, hud_top),
+            ),
+        ]
+
     def draw(self, screen: pygame.surface.Surface) -> None:
         """
         This function allows you to display on the screen everything related to the
         information about each tank such as angle and rate of fire,
-        score, maximum height, maximum distance, also check if the tank
-        killed itself to call the corresponding function. Furthermore, if the mode
-        developer is activated shows the FPS
+        score and the ammunition. The panels are kept on a layer, and each one
+        is only drawn again when the state it shows changes, the areas drawn
+        again are kept in redrawn_rects. It also checks if the restart button
+        is clicked.
         """
         restart_pos = (
             instance.border_padding + instance.windows_size[0] / 128,
@@ -586,54 +651,32 @@ class HUD(Drawable):
             (restart_pos[0] - ms[0]) ** 2 + (restart_pos[1] - ms[1]) ** 2
         ) < radius**2 and pygame.mouse.get_pressed()[0]:
             self.tank_game.restart()
-        screen.blit(
-            self.get_actual_player(),
-            (
-                instance.border_padding - instance.windows_size[0] / 128,
-                instance.windows_size[1]
-                - instance.windows_size[1] / 3.6
-                - instance.border_padding / 2,
-            ),
-        )
-        screen.blit(
-            self.get_cannonball_indicators(),
-            (
-                instance.border_padding + instance.windows_size[0] / 7.5,
-                instance.windows_size[1]
-                - instance.windows_size[1] / 3.6
-                - instance.border_padding / 2,
-            ),
-        )
-        screen.blit(
-            self.get_select_cannonball(),
-            (
-                instance.border_padding + instance.windows_size[0] / 2.39,
-                instance.windows_size[1]
-                - instance.hud_height
-                - instance.border_padding / 2,
-            ),
-        )
-        screen.blit(
-            self.tank_info(),
-            (
-                instance.border_padding + instance.windows_size[0] / 1.42,
-                instance.windows_size[1]
-                - instance.hud_height
-                - instance.border_padding / 2,
-            ),
-        )
 
+        self.redrawn_rects = []
+        for draw_panel, key, position in self.get_panels():
+            name = draw_panel.__name__
+            if self.panel_keys.get(name) != key:
+                self.redrawn_rects.append(self.layer.blit(draw_panel(), position))
+                self.panel_keys[name] = key
+        screen.blit(self.layer, (0, 0))
+
+    def draw_overlay(self, screen: pygame.surface.Surface) -> None:
+        """
+        This method draws the information of the HUD that goes over the game,
+        the maximum height and distance of the last shot, the health bars of
+        the tanks and, if the developer mode is activated, the FPS. The areas
+        drawn are kept in overlay_rects.
+        """
+        self.overlay_rects = []
         if self.tank_game.last_state is not None:
             self.draw_shoot_info(screen)
 
         if constants.DEVELOPMENT_MODE:
-            screen.blit(
-                self.font.render(
-                    f"FPS: {int(instance.fps)}",
-                    True,
-                    "black",
-                ),
-                (0, 0),
+            self.overlay_rects.append(
+                screen.blit(
+                    text_cache.render(self.font, f"FPS: {int(instance.fps)}", "black"),
+                    (0, 0),
+                )
             )
         keys_pressed = pygame.key.get_pressed()
         if keys_pressed[pygame.K_v]:
@@ -1,10 +1,8 @@
 from typing import Optional
 
 import pygame
-from pygame.font import Font
-
 import constants
-from caches import font_cache, audio_cache, image_cache
+from caches import audio_cache, image_cache, text_cache
 from context import instance
 from inputs import check_running
 
@@ -27,9 +25,9 @@ class InGameMenu:
     user presses the esc option on the keyboard.
     """
 
-    fontExit: Font
-    fontBack: Font
-    fontRestart: Font
+    fontExit: tuple[str, int]
+    fontBack: tuple[str, int]
+    fontRestart: tuple[str, int]
     box_size = pygame.Vector2
     box_pos: Optional[tuple[float, float]]
     botton_color1: str
@@ -43,11 +41,9 @@ class InGameMenu:
         self.button_reset_position = pygame.Vector2(
             instance.windows_size[0] / 4.26, instance.windows_size[1] / 15
         )
-        self.fontExit = font_cache["Roboto.ttf", int(instance.windows_size[0] / 51.2)]
-        self.fontRestart = font_cache[
-            "Roboto.ttf", int(instance.windows_size[0] / 51.2)
-        ]
-        self.fontBack = font_cache["Roboto.ttf", int(instance.windows_size[0] / 51.2)]
+        self.fontExit = ("Roboto.ttf", int(instance.windows_size[0] / 51.2))
+        self.fontRestart = ("Roboto.ttf", int(instance.windows_size[0] / 51.2))
+        self.fontBack = ("Roboto.ttf", int(instance.windows_size[0] / 51.2))
         self.botton_color1 = "#73726E"
         self.botton_color2 = "#73726E"
         self.botton_color3 = "#73726E"
@@ -157,7 +153,7 @@ class InGameMenu:
         """
         sf = pygame.Surface(self.button_reset_position)
         box_size = sf.get_size()
-        end = self.fontRestart.render(mensaje, True, "#ffffff")
+        end = text_cache.render(self.fontRestart, mensaje, "#ffffff")
         box_pos = ((box_size[0] - box_size[0]) / 3, box_size[1] / 4)
         if mensaje == "Reiniciar Partida":
             sf.fill(self.botton_color1)
@@ -1,9 +1,7 @@
 from typing import Optional
 
 import pygame
-from pygame.font import Font
-
-from caches import font_cache
+from caches import text_cache
 from caches import image_cache
 from caches import audio_cache
 from exit_requested import ExitRequested
@@ -28,7 +26,7 @@ class Menu:
     on the screen when you enter the game.
     """
 
-    fontTitle: Font
+    fontTitle: tuple[str, int]
     box_size = (instance.windows_size[0] / 6.4, instance.windows_size[1] / 7.2)
     box_pos: Optional[tuple[float, float]]
     botton_color: str
@@ -37,7 +35,7 @@ class Menu:
     prev: bool
 
     def __init__(self, screen: pygame.surface.Surface):
-        self.fontTitle = font_cache["Roboto.ttf", int(instance.windows_size[0] / 29.76)]
+        self.fontTitle = ("Roboto.ttf", int(instance.windows_size[0] / 29.76))
         self.box_pos = None
         self.box_pos_options = None
         self.button_color1 = "#2E3440"
@@ -73,9 +71,7 @@ class Menu:
         size = self.screen.get_size()
         self.box_pos = ((size[0] - self.box_size[0]) / 2, (5 / 8) * size[1])
         self.box_pos_options = ((size[0] - self.box_size[0]) / 2, (6.5 / 8) * size[1])
-        self.fontTitle.set_bold(True)
-        title = self.fontTitle.render("Tank Game", True, "#ffffff")
-        self.fontTitle.set_bold(False)
+        title = text_cache.render(self.fontTitle, "Tank Game", "#ffffff", bold=True)
         self.screen.blit(title, ((size[0] - title.get_size()[0]) / 2, size[1] / 6))
 
         box = pygame.rect.Rect(*self.box_pos, self.box_size[0], self.box_size[1])
@@ -96,7 +92,7 @@ class Menu:
             0,
             10,
         )
-        play = self.fontTitle.render("Jugar", True, "#FFFFFF")
+        play = text_cache.render(self.fontTitle, "Jugar", "#FFFFFF")
         self.screen.blit(
             play,
             (
@@ -104,7 +100,7 @@ class Menu:
                 self.box_pos[1] + self.box_size[1] / 2 - play.get_size()[1] / 2,
             ),
         )
-        options = self.fontTitle.render("Opciones", True, "#FFFFFF")
+        options = text_cache.render(self.fontTitle, "Opciones", "#FFFFFF")
         self.screen.blit(
             options,
             (
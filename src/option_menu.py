@@ -4,7 +4,7 @@ import pygame
 from pygame import Surface, SurfaceType
 
 import constants
-from caches import font_cache, image_cache
+from caches import image_cache, text_cache
 from context import instance
 from effects import AmbientEffect
 from inputs import check_running
@@ -83,7 +83,7 @@ class OptionMenu:
             instance.windows_size
         )
         self.screen = screen
-        self.font = font_cache["Roboto.ttf", int(instance.windows_size[0] / 51.2)]
+        self.font = ("Roboto.ttf", int(instance.windows_size[0] / 51.2))
         self.sobre = None
         self.button = Button(screen, self.secondary_buttons, self.principal_button_size)
 
@@ -142,7 +142,7 @@ class OptionMenu:
                 self.principal_button(11),
                 (instance.windows_size[0] / 1.25, instance.windows_size[1] / 2.21),
             )
-            msj = self.font.render("Tamaño de la Pantalla", True, "#ffffff")
+            msj = text_cache.render(self.font, "Tamaño de la Pantalla", "#ffffff")
             self.screen.blit(
                 msj,
                 (
@@ -150,7 +150,7 @@ class OptionMenu:
                     instance.windows_size[1] / 6.26,
                 ),
             )
-            msj = self.font.render("Cantidad de Jugadores", True, "#ffffff")
+            msj = text_cache.render(self.font, "Cantidad de Jugadores", "#ffffff")
             self.screen.blit(
                 msj,
                 (
@@ -158,7 +158,7 @@ class OptionMenu:
                     instance.windows_size[1] / 3.42,
                 ),
             )
-            msj = self.font.render("Cantidad de Bots", True, "#ffffff")
+            msj = text_cache.render(self.font, "Cantidad de Bots", "#ffffff")
             self.screen.blit(
                 msj,
                 (
@@ -166,7 +166,7 @@ class OptionMenu:
                     instance.windows_size[1] / 2.36,
                 ),
             )
-            msj = self.font.render("Número de Rondas", True, "#ffffff")
+            msj = text_cache.render(self.font, "Número de Rondas", "#ffffff")
             self.screen.blit(
                 msj,
                 (
@@ -174,7 +174,7 @@ class OptionMenu:
                     instance.windows_size[1] / 1.82,
                 ),
             )
-            msj = self.font.render("Efectos de Entorno", True, "#ffffff")
+            msj = text_cache.render(self.font, "Efectos de Entorno", "#ffffff")
             self.screen.blit(
                 msj,
                 (
@@ -183,7 +183,7 @@ class OptionMenu:
                 ),
             )
 
-            msj = self.font.render(f"{self.quantity_players}", True, "#8ACAC0")
+            msj = text_cache.render(self.font, f"{self.quantity_players}", "#8ACAC0")
             self.screen.blit(
                 msj,
                 (
@@ -191,7 +191,7 @@ class OptionMenu:
                     instance.windows_size[1] / 2.93,
                 ),
             )
-            msj = self.font.render(f"{self.quantity_bots}", True, "#8ACAC0")
+            msj = text_cache.render(self.font, f"{self.quantity_bots}", "#8ACAC0")
             self.screen.blit(
                 msj,
                 (
@@ -199,7 +199,7 @@ class OptionMenu:
                     instance.windows_size[1] / 2.14,
                 ),
             )
-            msj = self.font.render(f"{self.quantity_rounds}", True, "#8ACAC0")
+            msj = text_cache.render(self.font, f"{self.quantity_rounds}", "#8ACAC0")
             self.screen.blit(
                 msj,
                 (
@@ -207,9 +207,9 @@ class OptionMenu:
                     instance.windows_size[1] / 1.69,
                 ),
             )
-            msj = self.font.render(
+            msj = text_cache.render(
+                self.font,
                 f"{self.environment_effects[self.index_environment_effects.value]}",
-                True,
                 "#8ACAC0",
             )
             if self.index_environment_effects.value < len(self.environment_effects) - 1:
@@ -229,7 +229,7 @@ class OptionMenu:
                     ),
                 )
             x, y = self.screen_resolution[self.index_screen_resolution]
-            msj = self.font.render(f"{x} X {y}", True, "#8ACAC0")
+            msj = text_cache.render(self.font, f"{x} X {y}", "#8ACAC0")
             if self.index_screen_resolution == 0:
                 self.screen.blit(
                     msj,
@@ -378,7 +378,7 @@ class OptionMenu:
         if index == 11:
             sf.fill(self.button_color11)
         box_size = sf.get_size()
-        end = self.font.render("Continuar", True, "#ffffff")
+        end = text_cache.render(self.font, "Continuar", "#ffffff")
         box_pos = ((box_size[0] - box_size[0]) / 3, box_size[1] / 4)
         sf.blit(
             end,
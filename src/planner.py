@@ -0,0 +1,295 @@
+"""
+This module aims the shots of the bots. A grid of angles, speeds and
+cannonballs is fired with Trajectory against the terrain and the tanks, and
+the shot that takes the most life from the enemies, with the damage rules of
+Round, is chosen. The search is anytime: the grid is tried in batches that
+cover it more densely each time, so it can be stopped at any moment with a
+good shot, and it runs on a worker thread while the game keeps rendering.
+"""
+
+import math
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, Optional
+
+import numpy as np
+
+import constants
+from cannonballs import CannonballType
+from impact import ImpactType
+from terrain import Terrain
+from trajectory import CHUNK_SIZE, DAMAGE, RADIUS, launch
+
+# Limits and proportions of the grid of candidate shots of every cannonball
+MIN_ANGLE = math.radians(5)
+MAX_ANGLE = math.radians(175)
+MIN_SPEED = 10
+# Half of the speed of the tanks, as the faster shots land on the map only when
+# they are fired almost vertically, and would take half of the grid for few
+# useful shots. The corrections of local_shots can still go over it
+MAX_SPEED = constants.SHOOT_MAX_SPEED // 2
+ANGLE_STEPS = 120
+SPEED_STEPS = 28
+# Corrections tried around every seed shot, in radians and fractions of speed
+LOCAL_ANGLES = np.radians(np.linspace(-1.5, 1.5, 5))
+LOCAL_SPEEDS = np.linspace(0.94, 1.06, 9)
+# Shots tried between two checks of the deadline
+BATCH_SIZE = 1024
+
+# The searches of the bots run one at a time outside the render loop, on a
+# worker thread that is created with the first search
+executor: Optional[ThreadPoolExecutor] = None
+
+Shot = tuple[float, float, int]
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Returns the executor of the searches, creating it the first time"""
+    global executor  # pylint: disable=global-statement
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="planner")
+    return executor
+
+
+def shutdown() -> None:
+    """Cancels the pending searches and stops the worker thread, if any"""
+    global executor  # pylint: disable=global-statement
+    if executor is not None:
+        executor.shutdown(cancel_futures=True)
+        executor = None
+
+
+def radius_damage(
+    positions: np.ndarray,
+    center: np.ndarray,
+    damage: np.ndarray,
+    impact_type: np.ndarray,
+    hit: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the damage that explosions at center (..., 2) do to the tanks at
+    positions (..., tanks, 2), like Round.do_radius_damage. The tank hit
+    directly and the cannonballs that hit the border do no radius damage,
+    neither do the explosions at a distance of exactly 1, where the formula
+    divides by zero.
+    """
+    distance = np.linalg.norm(positions - center[..., np.newaxis, :], axis=-1)
+    gap = (1.0 - distance) ** 2
+    splash = np.zeros(gap.shape)
+    np.divide(damage[..., np.newaxis], gap, out=splash, where=gap != 0)
+    splash *= 100
+
+    exploded = (impact_type != ImpactType.BORDER)[..., np.newaxis]
+    splash = np.where(exploded, splash, 0).astype(int)
+    return np.where(np.arange(splash.shape[-1]) == hit[..., np.newaxis], 0, splash)
+
+
+def candidate_shots(
+    calibers: list[int], budget: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the angles, speeds and CannonballType of a grid of about budget
+    shots, with the proportions of ANGLE_STEPS and SPEED_STEPS. They are
+    shuffled with a fixed order, so any prefix of them covers all the grid.
+    """
+    scale = math.sqrt(budget / (len(calibers) * ANGLE_STEPS * SPEED_STEPS))
+    angles = np.linspace(MIN_ANGLE, MAX_ANGLE, max(2, round(ANGLE_STEPS * scale)))
+    speeds = np.linspace(MIN_SPEED, MAX_SPEED, max(2, round(SPEED_STEPS * scale)))
+
+    angle, speed, caliber = (
+        grid.ravel() for grid in np.meshgrid(angles, speeds, calibers, indexing="ij")
+    )
+    order = np.random.default_rng(0).permutation(angle.size)
+    return angle[order], speed[order], caliber[order]
+
+
+def local_shots(
+    seeds: list[tuple[float, float]], calibers: list[int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the angles, speeds and CannonballType of small corrections of the
+    angle and the speed of the seed shots, with every cannonball.
+    """
+    seeds = np.asarray(seeds, dtype=float).reshape(-1, 2)
+    angle, speed, caliber = np.broadcast_arrays(
+        seeds[:, 0, np.newaxis, np.newaxis, np.newaxis]
+        + LOCAL_ANGLES[:, np.newaxis, np.newaxis],
+        seeds[:, 1, np.newaxis, np.newaxis, np.newaxis] * LOCAL_SPEEDS[:, np.newaxis],
+        np.asarray(calibers),
+    )
+    speed = np.clip(speed, 1, constants.SHOOT_MAX_SPEED)
+    return angle.ravel(), speed.ravel(), caliber.ravel()
+
+
+def score_shots(
+    terrain: Terrain,
+    positions: np.ndarray,
+    life: np.ndarray,
+    shooter: int,
+    gravity: float,
+    wind: float,
+    angle: np.ndarray,
+    speed: np.ndarray,
+    caliber: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns, for every shot of the tank shooter, the life it takes from the
+    other tanks minus the life it takes from the shooter, counting the radius
+    damage and the direct hit like Round.check_last_state, and the tank that
+    it hits directly, or -1. The fall of the tanks is not predicted.
+    """
+    trajectory = launch(positions[shooter], angle, speed, caliber, gravity, wind)
+
+    chunk_maxima = None
+    if terrain.height_index.leaves >= CHUNK_SIZE:
+        chunk_maxima = terrain.height_index.chunks(CHUNK_SIZE)
+    impact_type, time, hit = trajectory.first_impact(
+        terrain.ground_lines,
+        terrain.size,
+        positions,
+        RADIUS[caliber],
+        chunk_maxima=chunk_maxima,
+    )
+
+    center = np.stack(trajectory.position_at(time), axis=1)
+    damage = radius_damage(positions, center, DAMAGE[caliber], impact_type, hit)
+    direct = np.flatnonzero(hit >= 0)
+    damage[direct, hit[direct]] += DAMAGE[caliber][direct]
+
+    # A tank can not lose more life than it has
+    taken = np.minimum(damage, np.maximum(life, 0))
+    sign = np.where(np.arange(len(life)) == shooter, -1, 1)
+    return (taken * sign).sum(axis=1), hit
+
+
+def search_shots(
+    terrain: Terrain,
+    positions: np.ndarray,
+    life: np.ndarray,
+    shooter: int,
+    gravity: float,
+    wind: float,
+    ammunition: dict[int, int],
+    budget: int,
+    seeds: list[tuple[float, float]],
+) -> Iterator[tuple[Optional[Shot], int]]:
+    """
+    Tries shots of the tank shooter in batches, with the cannonballs it has,
+    and yields after every batch the angle, speed and CannonballType of the
+    best shot found so far (None while no shot damages the enemies) and the
+    tank it hits directly. The corrections of the seed shots are tried first,
+    and if one of them hits an enemy directly the search ends, otherwise it
+    goes on with a grid of about budget shots.
+    """
+    calibers = [
+        caliber
+        for caliber in (CannonballType.MM60, CannonballType.MM80, CannonballType.MM105)
+        if ammunition[caliber] > 0
+    ]
+    if len(calibers) == 0:
+        return
+
+    phases = [candidate_shots(calibers, budget)]
+    if len(seeds) > 0:
+        phases.insert(0, local_shots(seeds, calibers))
+
+    best = None
+    best_hit = -1
+    best_score = 0
+    for angle, speed, caliber in phases:
+        for start in range(0, angle.size, BATCH_SIZE):
+            batch = slice(start, start + BATCH_SIZE)
+            score, hit = score_shots(
+                terrain,
+                positions,
+                life,
+                shooter,
+                gravity,
+                wind,
+                angle[batch],
+                speed[batch],
+                caliber[batch],
+            )
+
+            index = int(np.argmax(score))
+            if score[index] > best_score:
+                best_score = score[index]
+                best_hit = int(hit[index])
+                best = (
+                    float(angle[batch][index]),
+                    float(speed[batch][index]),
+                    int(caliber[batch][index]),
+                )
+            yield best, best_hit
+
+        if best_hit not in (-1, shooter):
+            return
+
+
+class ShotSearch:
+    """
+    This class runs search_shots on the worker thread. The best shot found,
+    and the tank it hits, are available at any moment, and the search can be
+    stopped between two batches.
+    """
+
+    positions: np.ndarray
+    shooter: int
+    gravity: float
+    wind: float
+    best: Optional[Shot]
+    hit: int
+    stop_event: threading.Event
+    future: Future
+
+    def __init__(
+        self,
+        terrain: Terrain,
+        positions: np.ndarray,
+        life: np.ndarray,
+        shooter: int,
+        gravity: float,
+        wind: float,
+        ammunition: dict[int, int],
+        budget: int,
+        seeds: list[tuple[float, float]],
+    ):
+        """Starts the search with the arguments of search_shots"""
+        self.positions = positions
+        self.shooter = shooter
+        self.gravity = gravity
+        self.wind = wind
+        self.best = None
+        self.hit = -1
+        self.stop_event = threading.Event()
+        self.future = get_executor().submit(
+            self.run,
+            terrain,
+            positions,
+            life,
+            shooter,
+            gravity,
+            wind,
+            ammunition,
+            budget,
+            seeds,
+        )
+
+    def run(self, *args) -> None:
+        """Keeps the best shot of every batch until the search ends or stops"""
+        for self.best, self.hit in search_shots(*args):
+            if self.stop_event.is_set():
+                return
+
+    def done(self) -> bool:
+        """Returns whether the search has ended"""
+        return self.future.done()
+
+    def finish(self) -> Optional[Shot]:
+        """
+        Stops the search after the current batch and returns the best shot
+        found, errors of the search are raised here.
+        """
+        self.stop_event.set()
+        self.future.result()
+        return self.best
@@ -1,7 +1,7 @@
 import pygame
 
 import constants
-from caches import audio_cache, font_cache, image_cache
+from caches import audio_cache, image_cache, text_cache
 from context import instance
 from inputs import check_running
 from exit_requested import ExitRequested
@@ -29,8 +29,8 @@ class PositionTable:
         self.button_position = pygame.Vector2(
             instance.windows_size[0] / 4.26, instance.windows_size[1] / 8
         )
-        self.font = font_cache["Roboto.ttf", int(instance.windows_size[0] / 51.2)]
-        self.fontTittle = font_cache["Roboto.ttf", int(instance.windows_size[0] / 35)]
+        self.font = ("Roboto.ttf", int(instance.windows_size[0] / 51.2))
+        self.fontTittle = ("Roboto.ttf", int(instance.windows_size[0] / 35))
         self.screen = screen
         self.round = None
         self.color = "#2E3440"
@@ -60,15 +60,15 @@ class PositionTable:
             rect_surface.set_alpha(transparency)
             rect_x1, rect_y1 = (0, 0)
             self.screen.blit(rect_surface, (rect_x1, rect_y1))
-            msj = self.fontTittle.render("Tabla de posiciones", True, "#ffffff")
+            msj = text_cache.render(self.fontTittle, "Tabla de posiciones", "#ffffff")
             self.screen.blit(
                 msj, (instance.windows_size[0] / 2.61, instance.windows_size[1] / 36)
             )
-            deads = self.font.render("Jugador", True, "#ffffff")
+            deads = text_cache.render(self.font, "Jugador", "#ffffff")
             self.screen.blit(
                 deads, (instance.windows_size[0] / 3.2, instance.windows_size[1] / 8)
             )
-            murders = self.font.render("Asesinatos cometidos", True, "#ffffff")
+            murders = text_cache.render(self.font, "Asesinatos cometidos", "#ffffff")
             self.screen.blit(
                 murders, (instance.windows_size[0] / 1.82, instance.windows_size[1] / 8)
             )
@@ -111,7 +111,7 @@ class PositionTable:
         sf = pygame.Surface(self.table)
         box_size = sf.get_size()
         sf.fill(self.color)
-        end = self.font.render(mensaje, True, "#ffffff")
+        end = text_cache.render(self.font, mensaje, "#ffffff")
         box_pos = ((box_size[0] - box_size[0]) / 3, box_size[1] / 4)
         sf.blit(
             end,
@@ -153,7 +153,7 @@ class PositionTable:
         """
         sf = pygame.Surface(self.button_position)
         box_size = sf.get_size()
-        end = self.font.render("Salir", True, "#ffffff")
+        end = text_cache.render(self.font, "Salir", "#ffffff")
         box_pos = ((box_size[0] - box_size[0]) / 3, box_size[1] / 2.5)
         sf.fill(self.color1)
 
@@ -253,7 +253,7 @@ class PositionTable:
         sf = pygame.Surface((width, height))
         sf.fill(self.color)
         box_size = sf.get_size()
-        end = self.font.render(f"{i + 1}°", True, "#ffffff")
+        end = text_cache.render(self.font, f"{i + 1}°", "#ffffff")
         box_pos = ((box_size[0] - box_size[0]) / 3, box_size[1] / 2.5)
 
         sf.blit(
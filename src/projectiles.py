@@ -0,0 +1,239 @@
+"""
+This module moves many cannonballs at once. The cannonballs in flight are
+kept as arrays of positions, velocities and the values of their
+CannonballType, instead of one Cannonball object each, so every step of the
+simulation integrates and checks the collisions of all of them together,
+with the same rules as Cannonball.tick and Round.find_first_impact.
+"""
+
+import numpy as np
+import pygame
+
+import constants
+from cannonballs import SPRITE_SIZE, sprite_cache
+from impact import ImpactType
+from terrain import Terrain
+from trajectory import RADIUS, SHELLS
+
+
+class ProjectileBatch:
+    """
+    This class represents the cannonballs in flight as a structure of arrays,
+    with one row for every cannonball. The rows of the cannonballs that hit
+    something are marked as dead and dropped when new ones are fired.
+    """
+
+    position: np.ndarray  # (n, 2)
+    previous_position: np.ndarray  # (n, 2)
+    velocity: np.ndarray  # (n, 2)
+    caliber: np.ndarray  # (n,) CannonballType
+    shooter: np.ndarray  # (n,) index of the tank that fired it
+    alive: np.ndarray  # (n,)
+    interpolation: float
+
+    def __init__(self):
+        self.position = np.empty((0, 2))
+        self.previous_position = np.empty((0, 2))
+        self.velocity = np.empty((0, 2))
+        self.caliber = np.empty(0, dtype=int)
+        self.shooter = np.empty(0, dtype=int)
+        self.alive = np.empty(0, dtype=bool)
+        self.interpolation = 1.0
+
+    def __len__(self) -> int:
+        """Returns the number of cannonballs in flight"""
+        return int(self.alive.sum())
+
+    @property
+    def radius(self) -> np.ndarray:
+        """Returns the radius of every cannonball"""
+        return RADIUS[self.caliber]
+
+    def add(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        caliber: np.ndarray,
+        shooter: np.ndarray,
+    ) -> None:
+        """
+        Adds cannonballs with the given positions and velocities, of shape
+        (n, 2), CannonballType and tanks that fired them.
+        """
+        keep = self.alive
+        position = np.asarray(position, dtype=float).reshape(-1, 2)
+        self.position = np.concatenate((self.position[keep], position))
+        self.previous_position = np.concatenate(
+            (self.previous_position[keep], position)
+        )
+        self.velocity = np.concatenate(
+            (self.velocity[keep], np.asarray(velocity, dtype=float).reshape(-1, 2))
+        )
+        self.caliber = np.concatenate(
+            (self.caliber[keep], np.broadcast_to(caliber, len(position)))
+        )
+        self.shooter = np.concatenate(
+            (self.shooter[keep], np.broadcast_to(shooter, len(position)))
+        )
+        self.alive = np.concatenate((self.alive[keep], np.ones(len(position), bool)))
+
+    def step(self, dt: float, gravity: float, wind: float = 0.0) -> None:
+        """
+        Moves the cannonballs in flight dt seconds, like Cannonball.tick and
+        the drift of the wind of Round.process_cannonball_trajectory.
+        """
+        alive = self.alive
+        self.previous_position[alive] = self.position[alive]
+        self.position[alive] += self.velocity[alive] * (dt * constants.X_SPEED)
+        self.velocity[alive, 1] += gravity * dt * constants.X_SPEED
+        self.position[alive, 0] += wind * dt * constants.WIND_EFFECT_SCALE
+
+    @staticmethod
+    def terrain_impact(
+        terrain: Terrain, start: np.ndarray, end: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the fraction of the last step where each of the given
+        cannonballs first goes under the ground, or inf, like Terrain.sweep.
+        Every row checks a window of columns as wide as the longest step.
+        """
+        times = np.full(len(start), np.inf)
+        # Broad phase against the highest column of the map
+        highest = terrain.height_index.max(0, terrain.size[0])
+        deep = np.maximum(start[:, 1], end[:, 1]) > terrain.size[1] - highest
+        if not deep.any():
+            return times
+
+        start, end = start[deep], end[deep]
+        delta = end - start
+        first = np.maximum(np.minimum(start[:, 0], end[:, 0]).astype(int), 0)
+        last = np.minimum(
+            np.maximum(start[:, 0], end[:, 0]).astype(int), terrain.size[0] - 1
+        )
+        width = max(int((last - first).max()) + 1, 1)
+        columns = first[:, np.newaxis] + np.arange(width)
+        inside = columns <= last[:, np.newaxis]
+        tops = (
+            terrain.size[1]
+            - terrain.ground_lines[np.minimum(columns, terrain.size[0] - 1)]
+        )
+
+        delta_x = delta[:, 0, np.newaxis]
+        vertical = np.abs(delta_x) < constants.EPSILON
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Fraction of the way where the segment enters and leaves each column
+            first_border = (columns - start[:, 0, np.newaxis]) / delta_x
+            second_border = (columns + 1 - start[:, 0, np.newaxis]) / delta_x
+            enter = np.where(
+                vertical, 0, np.clip(np.minimum(first_border, second_border), 0, 1)
+            )
+            leave = np.where(
+                vertical, 1, np.clip(np.maximum(first_border, second_border), 0, 1)
+            )
+
+            start_y = start[:, 1, np.newaxis]
+            delta_y = delta[:, 1, np.newaxis]
+            crossing = np.where(
+                (leave * delta_y + start_y > tops) & (delta_y > 0),
+                (tops - start_y) / delta_y,
+                np.inf,
+            )
+        crossing = np.where(enter * delta_y + start_y > tops, enter, crossing)
+        times[deep] = np.where(inside, crossing, np.inf).min(axis=1)
+        return times
+
+    @staticmethod
+    def tank_impact(
+        start: np.ndarray, end: np.ndarray, centers: np.ndarray, radius: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns, with shape (cannonballs, tanks), the fraction of the last
+        step where each cannonball enters the circle of its radius around each
+        tank, or inf, like Tank.sweep.
+        """
+        delta = (end - start)[:, np.newaxis]
+        offset = start[:, np.newaxis] - centers[np.newaxis]
+
+        a = (delta**2).sum(axis=2)
+        b = 2 * (offset * delta).sum(axis=2)
+        c = (offset**2).sum(axis=2) - radius[:, np.newaxis] ** 2
+        discriminant = b**2 - 4 * a * c
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (-b - np.sqrt(discriminant)) / (2 * a)
+
+        times = np.where((a > 0) & (discriminant >= 0) & (t >= 0) & (t <= 1), t, np.inf)
+        return np.where(c <= 0, 0.0, times)
+
+    def collide(
+        self, terrain: Terrain, centers: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Checks the last step of the cannonballs in flight against the terrain
+        and the tanks at centers (tanks, 2), and returns the rows, ImpactType,
+        exact positions and tank hit (or -1) of the cannonballs that hit
+        something, which are no longer alive. The terrain wins the ties, and
+        the cannonballs that leave the map hit the border.
+        """
+        rows = np.flatnonzero(self.alive)
+        start, end = self.previous_position[rows], self.position[rows]
+
+        terrain_time = self.terrain_impact(terrain, start, end)
+        tank_time = np.full(len(rows), np.inf)
+        tank = np.full(len(rows), -1)
+        if len(centers) > 0:
+            times = self.tank_impact(
+                start, end, np.asarray(centers, dtype=float), self.radius[rows]
+            )
+            tank = np.argmin(times, axis=1)
+            tank_time = times[np.arange(len(rows)), tank]
+
+        hit = tank_time < terrain_time
+        time = np.where(hit, tank_time, terrain_time)
+        impact_type = np.where(hit, ImpactType.TANK, ImpactType.TERRAIN)
+        border = ~np.isfinite(time) & ((end[:, 0] < 0) | (end[:, 0] > terrain.size[0]))
+        impact_type = np.where(border, ImpactType.BORDER, impact_type)
+
+        impacted = np.isfinite(time) | border
+        time = np.where(np.isfinite(time), time, 1.0)
+        position = start + (end - start) * time[:, np.newaxis]
+
+        rows = rows[impacted]
+        self.position[rows] = position[impacted]
+        self.alive[rows] = False
+        return (
+            rows,
+            impact_type[impacted],
+            position[impacted],
+            np.where(hit, tank, -1)[impacted],
+        )
+
+    def get_rects(self) -> list[pygame.Rect]:
+        """Returns the areas where the cannonballs in flight are drawn"""
+        rows = np.flatnonzero(self.alive)
+        position = self.previous_position[rows] + self.interpolation * (
+            self.position[rows] - self.previous_position[rows]
+        )
+        return [
+            pygame.Rect(
+                x - SPRITE_SIZE // 2, y - SPRITE_SIZE // 2, SPRITE_SIZE, SPRITE_SIZE
+            )
+            for x, y in position.tolist()
+        ]
+
+    def draw(self, screen: pygame.surface.Surface) -> None:
+        """
+        Draws the sprites of the cannonballs in flight, interpolated between
+        the last two steps of the simulation.
+        """
+        rows = np.flatnonzero(self.alive)
+        position = self.previous_position[rows] + self.interpolation * (
+            self.position[rows] - self.previous_position[rows]
+        )
+        travel_angle = np.degrees(
+            np.arctan2(self.velocity[rows, 1], self.velocity[rows, 0])
+        )
+        for (x, y), caliber, angle in zip(
+            position.tolist(), self.caliber[rows], travel_angle.tolist()
+        ):
+            sprite, offset = sprite_cache[type(SHELLS[caliber]), angle, True]
+            screen.blit(sprite, (x + offset.x, y + offset.y))
@@ -1,7 +1,8 @@
 import math
 import random
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import pygame
 from pygame.key import ScancodeWrapper
 
@@ -9,7 +10,7 @@ import constants
 import context
 from background import Background
 from bot import Bot
-from caches import animation_cache, audio_cache, font_cache
+from caches import animation_cache, audio_cache, text_cache
 from cannonballs import CannonballType, Cannonball
 from context import Context
 from effects import AmbientEffect
@@ -22,11 +23,15 @@ from in_game_menu import InGameMenuStatus
 from inputs import check_running
 from map import Map
 from menu import Menu
+from planner import ShotSearch, radius_damage
 from player import Player
+from projectiles import ProjectileBatch
 from shop_menu import Shop
+from simulation_clock import SimulationClock
 from snow_storm import SnowStorm
 from tank import Tank
 from terrain import Terrain
+from trajectory import DAMAGE, RADIUS_DAMAGE
 from warning_windows import WarningWindows
 from wind import Wind
 from winner_screen import WinnerScreen
@@ -46,7 +51,18 @@ class Round:
     turns_queue: list[int]
     actual_player: int
     cannonball: Optional[Cannonball]
+    projectiles: Optional[ProjectileBatch]
+    salvo_impacts: list[tuple[int, int, int, np.ndarray, int]]
+    explosions: list[Explosion]
+    scene: pygame.surface.Surface  # background and terrain
+    terrain_layer: pygame.surface.Surface  # terrain alone, drawn over the snow
+    scene_version: Optional[int]  # version of the terrain drawn on the scene
+    game_rect: pygame.surface.Surface
+    dirty_rects: list[pygame.Rect]  # areas of the window drawn in this frame
+    previous_dirty_rects: list[pygame.Rect]
+    full_update: bool  # the whole window must be updated
     tanks_alive: int
+    think_time: int  # ms that the bots have planned in this turn
     wind: Optional[Wind]
     gravity: float
 
@@ -84,7 +100,18 @@ class Round:
             self.map.define_terrain_colors(),
         )
 
+        self.scene = pygame.surface.Surface(self.context.map_size)
+        self.terrain_layer = pygame.surface.Surface(
+            self.context.map_size, pygame.SRCALPHA
+        )
+        self.scene_version = None
+        self.game_rect = pygame.surface.Surface(self.context.map_size)
+        self.dirty_rects = []
+        self.previous_dirty_rects = []
+        self.full_update = True
+
         self.tanks_alive = len(self.context.players)
+        self.think_time = 0
         self.winner_msj = WinnerScreen(self)
         self.players = self.context.players
         self.winner = None
@@ -94,7 +121,11 @@ class Round:
         self.animacion_fuego = None
         self.last_state = None
         self.cannonball = None
+        self.projectiles = None
+        self.salvo_impacts = []
+        self.explosions = []
         self.context.fps = constants.FPS
+        self.simulation_clock = SimulationClock()
         self.menu = Menu(self.context.screen)
         self.create_tanks()
         self.create_turns()
@@ -180,13 +211,30 @@ class Round:
 
     def find_tank(self):
         """
-        This method is responsible for finding the tank that is alive and is
-        not the player tank
+        This method is responsible for aiming the bot, it plans the shot that
+        does the most damage while the game keeps rendering, and if there is
+        none it shoots randomly to a tank that is alive and is not the player
+        tank
         """
         current_tank = self.get_current_tank()
         if not isinstance(current_tank, Bot):
             return
 
+        wind = 0.0 if self.wind is None else self.wind.velocity
+        search = current_tank.start_planning(
+            self.terrain,
+            self.tanks,
+            self.gravity,
+            wind,
+            constants.BOT_SEARCH_BUDGET[self.context.bot_difficulty],
+        )
+        try:
+            self.wait_planning(search)
+        finally:
+            planned = current_tank.finish_planning(search)
+        if planned:
+            return
+
         find = True
         while find:
             random_tank = random.randint(0, len(self.tanks) - 1)
@@ -196,6 +244,30 @@ class Round:
                 )
                 find = False
 
+    def record_bot_shot(self) -> None:
+        """
+        This method lets the bot that has just shot keep where its cannonball
+        hit, so it can correct the miss in its next turn.
+        """
+        current_tank = self.get_current_tank()
+        if not isinstance(current_tank, Bot) or self.last_state is None:
+            return
+
+        wind = 0.0 if self.wind is None else self.wind.velocity
+        current_tank.record_shot(self.tanks, self.last_state, wind)
+
+    def wait_planning(self, search: ShotSearch) -> None:
+        """
+        This method keeps rendering while the bot thinks, until its search
+        ends or BOT_THINK_TIME passes. The time is added to think_time.
+        """
+        start = pygame.time.get_ticks()
+        deadline = start + constants.BOT_THINK_TIME
+        while not search.done() and pygame.time.get_ticks() < deadline:
+            check_running()
+            self.render()
+        self.think_time += pygame.time.get_ticks() - start
+
     def draw_cannonball_indicator(self, sf: pygame.surface.Surface):
         """This method allows you to track the bullet when it is not on the screen."""
         if self.cannonball is None:
@@ -214,8 +286,8 @@ class Round:
                 ],
             )
             height = self.context.map_size[1] - self.cannonball.position.y
-            height_text = font_cache["Roboto.ttf", 18].render(
-                f" {height:.2f}[m] ", True, "#ffffff", "#2196F3"
+            height_text = text_cache.render(
+                ("Roboto.ttf", 18), f" {height:.2f}[m] ", "#ffffff", "#2196F3"
             )
 
             sf.blit(
@@ -232,17 +304,39 @@ class Round:
                 ),
             )
 
+    def simulate(self, physics: Optional[Callable[[float], bool]] = None) -> bool:
+        """
+        This method consumes the time accumulated in the simulation clock in
+        fixed steps. In each step the wind and the snow advance, and then the
+        given physics function, that receives the dt and returns True to stop
+        the simulation (for example, when the cannonball impacts). Returns True
+        if the physics function stopped it.
+        """
+        for dt in self.simulation_clock.steps():
+            self.snow_storm.tick(dt)
+            if self.wind is not None:
+                self.wind.tick(dt)
+            if physics is not None and physics(dt):
+                return True
+        return False
+
     def render(self) -> None:
         """
         This method is responsible for drawing each element of the window, it
         also puts the execution to sleep for a while to make the game run at the
-        fps, specified in the FPS constant
-        """
-        game_rect = pygame.surface.Surface(self.context.map_size)
-
-        self.background.draw(game_rect)
-        self.snow_storm.draw(game_rect)
-        self.terrain.draw(game_rect)
+        fps, specified in the FPS constant. The time of the frame is given to the
+        simulation clock, and the steps not consumed by a physics loop only
+        advance the ambient effects. The frame is composed from layers that
+        are kept between frames: the background and the terrain, that are
+        only drawn again when the terrain changes, the HUD, and the moving
+        elements that are drawn on top of them. Only the areas of the window
+        that changed are updated on the display.
+        """
+        self.simulate()
+        self.collect_game_rects(self.update_scene())
+        game_rect = self.game_rect
+        game_rect.blit(self.scene, (0, 0))
+        self.snow_storm.draw_behind(game_rect, self.terrain_layer)
         self.draw_cannonball_indicator(game_rect)
 
         for tank in self.tanks:
@@ -251,33 +345,116 @@ class Round:
         if self.cannonball is not None:
             self.cannonball.draw(game_rect)
 
-        self.context.screen.fill(constants.HUD_BACKGROUND)
+        if self.projectiles is not None:
+            self.projectiles.draw(game_rect)
+
         if self.last_state is not None and self.cannonball is not None:
             self.cannonball.draw_trajectory(game_rect)
         if self.animacion is not None:
             self.animacion.draw(game_rect)
+        for explosion in self.explosions:
+            explosion.draw(game_rect)
+
+        self.hud.draw(self.context.screen)
         self.context.screen.blit(
             game_rect, (self.context.border_padding, self.context.border_padding)
         )
+        self.hud.draw_overlay(self.context.screen)
+        self.dirty_rects.extend(self.hud.redrawn_rects)
+        self.dirty_rects.extend(self.hud.overlay_rects)
 
-        self.hud.draw(self.context.screen)
-
-        self.snow_storm.tick(1.0 / self.context.fps)
-        if self.cannonball is None and self.last_state is None:
+        if (
+            self.cannonball is None
+            and self.last_state is None
+            and self.projectiles is None
+        ):
             self.warning.draw(self.context.screen)
+            if self.warning.rect is not None:
+                self.dirty_rects.append(self.warning.rect)
             if not self.warning.is_current_cannonball_available():
                 error = audio_cache["sounds/error.mp3"]
                 error.play()
 
         if self.winner is not None:
             self.winner_msj.draw(self.context.screen)
+            self.full_update = True
 
-        if self.wind is not None:
-            self.wind.tick(1.0 / self.context.fps)
-
-        pygame.display.flip()
+        self.update_display()
         self.context.clock.tick(constants.FPS)
         self.context.fps = self.context.clock.get_fps()
+        self.simulation_clock.feed(self.context.clock.get_time() / 1000)
+
+    def update_scene(self) -> list[pygame.Rect]:
+        """
+        This method draws the background and the terrain on the scene layer,
+        only if the terrain has changed since it was last drawn. Returns the
+        areas of the scene that changed.
+        """
+        if self.scene_version == self.terrain.version:
+            return []
+
+        rects = self.terrain.get_rects()
+        if self.scene_version is None:
+            rects.append(self.scene.get_rect())
+        self.background.draw(self.scene)
+        self.terrain_layer.fill((0, 0, 0, 0))
+        self.terrain.draw(self.terrain_layer)
+        self.scene.blit(self.terrain_layer, (0, 0))
+        self.scene_version = self.terrain.version
+        return rects
+
+    def collect_game_rects(self, scene_rects: list[pygame.Rect]) -> None:
+        """
+        This method adds to the dirty rectangles the areas of the game where
+        something is drawn in this frame, the changes of the scene and the
+        moving elements, moved to their place in the window. The areas drawn
+        in the last frame are also updated, to erase what moved from there.
+        """
+        rects = scene_rects + self.snow_storm.get_rects()
+        rects.extend(tank.get_rect() for tank in self.tanks)
+
+        if self.cannonball is not None:
+            self.cannonball.interpolation = (
+                self.simulation_clock.alpha if self.last_state is None else 1.0
+            )
+            rects.append(self.cannonball.get_rect())
+            if self.cannonball.position.y < 0:
+                # The indicator of the cannonball out of the screen
+                rects.append(pygame.Rect(0, 0, self.context.map_size[0], 60))
+            if self.last_state is not None:
+                rects.append(self.cannonball.get_trajectory_rect())
+
+        if self.projectiles is not None:
+            self.projectiles.interpolation = self.simulation_clock.alpha
+            rects.extend(self.projectiles.get_rects())
+        if self.animacion is not None:
+            rects.append(self.animacion.get_rect())
+        rects.extend(explosion.get_rect() for explosion in self.explosions)
+
+        game_area = self.game_rect.get_rect()
+        padding = self.context.border_padding
+        for rect in rects:
+            rect = rect.clip(game_area)
+            if rect.width > 0 and rect.height > 0:
+                self.dirty_rects.append(rect.move(padding, padding))
+
+    def update_display(self) -> None:
+        """
+        This method updates on the display the dirty rectangles of this frame
+        and the last one, or the whole window when the dirty area is large or
+        something has changed everywhere, like the layer of the HUD.
+        """
+        rects = self.dirty_rects + self.previous_dirty_rects
+        width, height = self.context.screen.get_size()
+        area = sum(rect.width * rect.height for rect in rects)
+        if self.full_update or area > constants.DIRTY_AREA_LIMIT * width * height:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+        self.previous_dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        self.full_update = False
 
     def process_shoot_angle_change(
         self, playing_tank: Tank, keys_pressed: ScancodeWrapper
@@ -379,44 +556,68 @@ class Round:
     def process_in_game_menu(self):
         """This method allows you to check if the pause menu is active or not."""
         menu_state = self.in_game_menu.start_menu()
+        # The menu was drawn over the whole window
+        self.full_update = True
 
         if menu_state is InGameMenuStatus.EXIT:
             raise ExitRequested
         if menu_state is InGameMenuStatus.RESTART:
             raise RestartRequested
 
-    def process_cannonball_trajectory(self) -> Optional[Impact]:
+    def find_first_impact(
+        self, start: pygame.Vector2, end: pygame.Vector2
+    ) -> Optional[Impact]:
+        """
+        This method sweeps the movement of the cannonball between two positions
+        against the terrain and the tanks, and returns the impact that happens
+        first along the way, placed at the exact point of contact. If nothing is
+        hit, but the cannonball left the map, it returns a border impact.
         """
-        This method is responsible for moving the cannonball and seeing what happens,
-        in case there is a terminal event, it stops the execution
+        if self.cannonball is None:
+            return None
+
+        impact_time = self.terrain.sweep(start, end)
+        impact_type = ImpactType.TERRAIN
+        impacted_tank = None
+
+        for tank in self.tanks:
+            tank_time = tank.sweep(start, end, self.cannonball.radius)
+            if tank_time is not None and (
+                impact_time is None or tank_time < impact_time
+            ):
+                impact_time = tank_time
+                impact_type = ImpactType.TANK
+                impacted_tank = tank
+
+        if impact_time is not None:
+            self.cannonball.position = start.lerp(end, impact_time)
+            return Impact(self.cannonball.position, impact_type, impacted_tank)
+
+        if end.x < 0 or end.x > self.context.map_size[0]:
+            return Impact(self.cannonball.position, ImpactType.BORDER)
+
+        return None
+
+    def process_cannonball_trajectory(self, dt: float) -> Optional[Impact]:
+        """
+        This method is responsible for moving the cannonball one step of dt
+        seconds and seeing what happens, in case there is a terminal event, it
+        stops the execution. The whole movement of the step is checked, so the
+        cannonball can not pass through thin terrain or tanks when it moves fast.
         :return:
         """
         if self.cannonball is None:
             return None
 
-        self.cannonball.tick((1.0 / self.context.fps) * constants.X_SPEED, self.gravity)
+        previous_position = self.cannonball.position.copy()
+        self.cannonball.tick(dt * constants.X_SPEED, self.gravity)
 
         if self.wind is not None:
             self.cannonball.position.x += (
-                self.wind.velocity
-                * (1.0 / self.context.fps)
-                * constants.WIND_EFFECT_SCALE
+                self.wind.velocity * dt * constants.WIND_EFFECT_SCALE
             )
 
-        if (
-            self.cannonball.position.x < 0
-            or self.cannonball.position.x > self.context.map_size[0]
-        ):
-            return Impact(self.cannonball.position, ImpactType.BORDER)
-
-        if self.terrain.collides_with(self.cannonball.position):
-            return Impact(self.cannonball.position, ImpactType.TERRAIN)
-
-        for tank in self.tanks:
-            if tank.collides_with(self.cannonball.position, self.cannonball.radius):
-                return Impact(self.cannonball.position, ImpactType.TANK, tank)
-
-        return None
+        return self.find_first_impact(previous_position, self.cannonball.position)
 
     def get_current_tank(self):
         """
@@ -462,10 +663,18 @@ class Round:
         self.fall_sound.play()
         while self.running and self.last_state is None:
             check_running()
-            self.last_state = self.process_cannonball_trajectory()
+            self.simulate(self.cannonball_step)
             self.render()
         self.fall_sound.stop()
 
+    def cannonball_step(self, dt: float) -> bool:
+        """
+        This method is a physics step of the cannonball flight, it returns True
+        when the cannonball impacts.
+        """
+        self.last_state = self.process_cannonball_trajectory(dt)
+        return self.last_state is not None
+
     def wait_on_space(self) -> None:
         """
         This function will pause most of the game logic but won't completely
@@ -544,42 +753,7 @@ class Round:
             return
 
         if self.cannonball is not None and self.last_state is not None:
-            radius = int(self.cannonball.radius_damage)
-            imp_x, imp_y = self.cannonball.position
-            imp_x = int(imp_x)
-            imp_y = self.context.map_size[1] - imp_y
-
-            for i in range(imp_x - radius, imp_x + radius + 1):
-                left_damage = math.sqrt(max(radius**2 - (i - imp_x) ** 2, 0))
-
-                sup_limit = imp_y + left_damage
-                inf_limit = imp_y - left_damage
-                if i < len(self.terrain.ground_lines):
-                    current_line = self.terrain.new_ground_lines[i]
-
-                    accumulated = 0
-                    for j, size in enumerate(current_line):
-                        start_layer = accumulated
-                        end_layer = start_layer + size
-
-                        affected = max(
-                            0, min(end_layer, sup_limit) - max(start_layer, inf_limit)
-                        )
-
-                        self.terrain.ground_lines[i] -= affected
-
-                        if sup_limit < end_layer:
-                            fall = end_layer - max(sup_limit, start_layer)
-                            self.terrain.falling[i][j] = (
-                                self.context.map_size[1] - end_layer,
-                                fall,
-                            )
-                            affected += fall
-                            self.terrain.falling_speed = 0
-                            self.terrain.is_falling = True
-
-                        current_line[j] -= max(0, affected)
-                        accumulated = end_layer
+            self.terrain.carve(self.cannonball.position, self.cannonball.radius_damage)
 
     def display_fire(self):
         """
@@ -671,6 +845,8 @@ class Round:
                 tank.buy_cannonballs()
             else:
                 self.shop_menu.start_shop(tank)
+        # The shop was drawn over the whole window
+        self.full_update = True
 
     def update_wind(self):
         """
@@ -759,23 +935,31 @@ class Round:
         self.has_fallen = set()
         while self.terrain.is_falling or self.tanks_falling:
             check_running()
-            dt = 1.0 / self.context.fps
-            self.terrain.tick(dt * constants.TERRAIN_FALL_X_SPEED, self.gravity)
-            self.make_tanks_fall(dt * constants.TERRAIN_FALL_X_SPEED)
+            self.simulate(self.fall_step)
             self.render()
 
+    def fall_step(self, dt: float) -> bool:
+        """
+        This method is a physics step of the fall of the terrain and the tanks,
+        it returns True when everything has landed.
+        """
+        self.terrain.tick(dt * constants.TERRAIN_FALL_X_SPEED, self.gravity)
+        self.make_tanks_fall(dt * constants.TERRAIN_FALL_X_SPEED)
+        return not (self.terrain.is_falling or self.tanks_falling)
+
     def wait_to_end_of_turn(self):
         """
         This method is responsible for waiting for the end of the turn.
         In the screen appears the stats of the shooting.
-        If the player is a bot, it will wait for a while, otherwise it will wait
-        for the player to press the space bar.
+        If the player is a bot, it will wait for a while, less the time it
+        spent thinking, otherwise it will wait for the player to press the
+        space bar.
         """
         if not isinstance(self.get_current_tank(), Bot):
             self.wait_release_space()
             self.wait_on_space()
         else:
-            self.sleep_rendering(constants.BOT_SLEEP_TIME)
+            self.sleep_rendering(max(constants.BOT_SLEEP_TIME - self.think_time, 0))
 
     def play_turn(self):
         """
@@ -783,9 +967,11 @@ class Round:
         call the functions that are responsible for the different parts of the
         turn.
         """
+        self.think_time = 0
         self.update_wind()
         self.aim_and_shoot()
         self.cannonball_travel()
+        self.record_bot_shot()
         self.do_explotion()
         self.do_radius_damage()
         self.terrain_destruction()
@@ -795,6 +981,208 @@ class Round:
         self.check_last_state()
         self.wait_release_space()
 
+    def play_simultaneous_turn(self) -> bool:
+        """
+        This method is responsible for playing a turn of all the players at
+        once: every tank that can shoot aims in turn, then all the cannonballs
+        fly together, and their explosions, damage and terrain destruction are
+        applied together. Returns False if no one can shoot.
+        """
+        self.think_time = 0
+        self.update_wind()
+        shots = self.aim_all()
+        if len(shots) == 0:
+            return False
+
+        self.salvo_travel(shots)
+        self.record_salvo_shots()
+        self.do_salvo_explosions()
+        dealt = self.do_salvo_damage()
+        self.salvo_terrain_destruction()
+        self.do_fall_terrain_and_tanks()
+        self.correct_tanks_position()
+        self.sleep_rendering(max(constants.BOT_SLEEP_TIME - self.think_time, 0))
+        self.check_salvo_deaths(dealt)
+        self.projectiles = None
+        self.salvo_impacts = []
+        return True
+
+    def aim_all(self) -> list[tuple[pygame.Vector2, pygame.Vector2, int, int]]:
+        """
+        This method lets every tank that is alive and has cannonballs aim and
+        shoot, in a random order, and returns the position, velocity,
+        CannonballType and tank of every cannonball fired. The cannonballs do
+        not fly until all of them are fired.
+        """
+        order = [*range(len(self.tanks))]
+        random.shuffle(order)
+
+        shots = []
+        for index in order:
+            tank = self.tanks[index]
+            if not tank.is_alive or sum(tank.player.ammunition.values()) == 0:
+                continue
+
+            self.actual_player = index
+            self.aim_and_shoot()
+            if self.cannonball is not None:
+                shots.append(
+                    (
+                        self.cannonball.position,
+                        self.cannonball.velocity,
+                        tank.actual,
+                        index,
+                    )
+                )
+            self.cannonball = None
+            self.wait_release_space()
+
+        return shots
+
+    def salvo_travel(
+        self, shots: list[tuple[pygame.Vector2, pygame.Vector2, int, int]]
+    ) -> None:
+        """
+        This method is responsible for making all the cannonballs of the turn
+        fly together until every one of them impacts.
+        """
+        self.projectiles = ProjectileBatch()
+        position, velocity, caliber, shooter = zip(*shots)
+        self.projectiles.add(position, velocity, caliber, shooter)
+
+        self.fall_sound.play()
+        while self.running and len(self.projectiles) > 0:
+            check_running()
+            self.simulate(self.salvo_step)
+            self.render()
+        self.fall_sound.stop()
+
+    def salvo_step(self, dt: float) -> bool:
+        """
+        This method is a physics step of the cannonballs of the turn, it keeps
+        the impacts of the step and returns True when all of them have impacted.
+        """
+        wind = 0.0 if self.wind is None else self.wind.velocity
+        self.projectiles.step(dt, self.gravity, wind)
+        rows, impact_type, position, hit = self.projectiles.collide(
+            self.terrain, np.array([tank.position for tank in self.tanks])
+        )
+        self.salvo_impacts += zip(
+            self.projectiles.shooter[rows],
+            self.projectiles.caliber[rows],
+            impact_type,
+            position,
+            hit,
+        )
+        return len(self.projectiles) == 0
+
+    def record_salvo_shots(self) -> None:
+        """
+        This method lets every bot keep where its cannonball hit, so it can
+        correct the miss in its next turn.
+        """
+        wind = 0.0 if self.wind is None else self.wind.velocity
+        for shooter, _, impact_type, position, hit in self.salvo_impacts:
+            tank = self.tanks[shooter]
+            if isinstance(tank, Bot):
+                impacted_tank = self.tanks[hit] if hit >= 0 else None
+                impact = Impact(pygame.Vector2(*position), impact_type, impacted_tank)
+                tank.record_shot(self.tanks, impact, wind)
+
+    def do_salvo_explosions(self) -> None:
+        """
+        This method is responsible for displaying the explosions of all the
+        cannonballs of the turn at once.
+        """
+        impact_types = set()
+        for _, _, impact_type, position, _ in self.salvo_impacts:
+            if impact_type == ImpactType.BORDER:
+                continue
+            impact_types.add(impact_type)
+            animation = (
+                "tank_explosion" if impact_type == ImpactType.TANK else "snow_explosion"
+            )
+            self.explosions.append(
+                Explosion(pygame.Vector2(*position), animation_cache[animation])
+            )
+
+        if ImpactType.TANK in impact_types:
+            audio_cache["sounds/bomb.mp3"].play()
+        if ImpactType.TERRAIN in impact_types:
+            audio_cache["sounds/shoot.mp3"].play()
+
+        self.display_explosions()
+        self.explosions = []
+
+    def display_explosions(self) -> None:
+        """This method is responsible for the animation of the explosions."""
+        while any(explosion.has_next() for explosion in self.explosions):
+            for explosion in self.explosions:
+                explosion.tick(1.0 / (self.context.fps + 0.001))
+            self.render()
+
+    def do_salvo_damage(self) -> np.ndarray:
+        """
+        This method applies the radius damage and the direct hits of all the
+        cannonballs of the turn, like do_radius_damage and check_last_state,
+        and returns the damage that every shooter did to every tank.
+        """
+        dealt = np.zeros((len(self.tanks), len(self.tanks)), dtype=int)
+        if len(self.salvo_impacts) == 0:
+            return dealt
+
+        shooter, caliber, impact_type, position, hit = (
+            np.array(values) for values in zip(*self.salvo_impacts)
+        )
+        damage = radius_damage(
+            np.array([tank.position for tank in self.tanks]),
+            position,
+            DAMAGE[caliber],
+            impact_type,
+            hit,
+        )
+        direct = np.flatnonzero(hit >= 0)
+        damage[direct, hit[direct]] += DAMAGE[caliber[direct]]
+        np.add.at(dealt, shooter, damage)
+
+        for tank, taken in zip(self.tanks, damage.sum(axis=0)):
+            tank.life -= int(taken)
+        return dealt
+
+    def salvo_terrain_destruction(self) -> None:
+        """
+        This method carves the craters of all the cannonballs of the turn that
+        did not leave the map.
+        """
+        for _, caliber, impact_type, position, _ in self.salvo_impacts:
+            if impact_type != ImpactType.BORDER:
+                self.terrain.carve(pygame.Vector2(*position), RADIUS_DAMAGE[caliber])
+
+    def check_salvo_deaths(self, dealt: np.ndarray) -> None:
+        """
+        This method is responsible for checking the tanks that died in the
+        turn, like check_last_state, crediting every death to the tank that
+        did the most damage to it. The deaths only caused by a fall are not
+        credited to anyone.
+        """
+        for index, tank in enumerate(self.tanks):
+            if not tank.is_alive or tank.life > 0:
+                continue
+
+            tank.is_alive = False
+            tank.life = 0
+            self.tanks_alive -= 1
+            tank.player.deaths += 1
+
+            killer = int(np.argmax(dealt[:, index]))
+            if dealt[killer, index] <= 0:
+                continue
+            if self.tanks[killer].player is not tank.player:
+                self.tanks[killer].player.money += 5000
+                self.tanks[killer].player.murders += 1
+            else:
+                self.tanks[killer].player.money -= 5000
+
     def try_to_find_winner(self):
         """
         This method is responsible for checking if there is a winner, if there
@@ -835,11 +1223,16 @@ class Round:
         while self.running:
             check_running()
 
-            if self.try_next_turn() is False:
-                # No one can shoot
-                return
+            if self.context.simultaneous_turns:
+                if self.play_simultaneous_turn() is False:
+                    # No one can shoot
+                    return
+            else:
+                if self.try_next_turn() is False:
+                    # No one can shoot
+                    return
 
-            self.play_turn()
+                self.play_turn()
             self.try_to_find_winner()
 
             self.cannonball = None
@@ -1,15 +1,15 @@
 from typing import Optional
 
 import pygame
-from pygame.font import Font
-
 import constants
 from caches import audio_cache
-from caches import font_cache
 from caches import image_cache
+from caches import text_cache
+from cannonballs import CannonballType
 from context import instance
 from inputs import check_running
 from tank import Tank
+from trajectory import SHELLS
 
 
 class ShopStatus:
@@ -29,7 +29,7 @@ class Shop:
     money they have.
     """
 
-    money_font: Font
+    money_font: tuple[str, int]
     c60_button_color: str
     c80_button_color: str
     c105_button_color: str
@@ -52,10 +52,8 @@ class Shop:
         self.buy_button_reset_position = pygame.Vector2(
             instance.windows_size[0] / 10, instance.windows_size[1] / 20
         )
-        self.money_font = font_cache["Roboto.ttf", int(instance.windows_size[0] / 51.2)]
-        self.principal_font = font_cache[
-            "Roboto.ttf", int(instance.windows_size[0] / 40)
-        ]
+        self.money_font = ("Roboto.ttf", int(instance.windows_size[0] / 51.2))
+        self.principal_font = ("Roboto.ttf", int(instance.windows_size[0] / 40))
         self.ammunition = {}
         self.Ammo60 = 0
         self.Ammo80 = 0
@@ -79,15 +77,15 @@ class Shop:
         """This method draws the buttons for each ammo type."""
         self.screen.blit(self.image, self.image_rect.topleft)
         self.screen.blit(
-            self.cannonball_buttons("$1000"),
+            self.cannonball_buttons(CannonballType.MM60),
             (instance.windows_size[0] / 2.78, instance.windows_size[1] / 4),
         )
         self.screen.blit(
-            self.cannonball_buttons("$2500"),
+            self.cannonball_buttons(CannonballType.MM80),
             (instance.windows_size[0] / 2.78, instance.windows_size[1] / 2.91),
         )
         self.screen.blit(
-            self.cannonball_buttons("$4000"),
+            self.cannonball_buttons(CannonballType.MM105),
             (instance.windows_size[0] / 2.78, instance.windows_size[1] / 2.28),
         )
         self.screen.blit(
@@ -98,10 +96,12 @@ class Shop:
             self.buy_ammo("Comprar"),
             (instance.windows_size[0] / 1.67, instance.windows_size[1] / 1.82),
         )
-        money = self.principal_font.render(f"${self.money_player}", True, "#ffffff")
-        quantity60mm = self.money_font.render(f"{self.Ammo60}", True, "#ffffff")
-        quantity80mm = self.money_font.render(f"{self.Ammo80}", True, "#ffffff")
-        quantity105mm = self.money_font.render(f"{self.Ammo105}", True, "#ffffff")
+        money = text_cache.render(
+            self.principal_font, f"${self.money_player}", "#ffffff"
+        )
+        quantity60mm = text_cache.render(self.money_font, f"{self.Ammo60}", "#ffffff")
+        quantity80mm = text_cache.render(self.money_font, f"{self.Ammo80}", "#ffffff")
+        quantity105mm = text_cache.render(self.money_font, f"{self.Ammo105}", "#ffffff")
         self.screen.blit(
             quantity60mm,
             (instance.windows_size[0] / 1.82, instance.windows_size[1] / 3.89),
@@ -126,6 +126,9 @@ class Shop:
         of their money.
         """
         self.money_player = tank.player.money
+        price60mm = SHELLS[CannonballType.MM60].price
+        price80mm = SHELLS[CannonballType.MM80].price
+        price105mm = SHELLS[CannonballType.MM105].price
         contador60mm = 0
         contador80mm = 0
         contador105mm = 0
@@ -145,33 +148,33 @@ class Shop:
             if pygame.mouse.get_pressed()[0]:
                 click = audio_cache["sounds/click.mp3"]
                 click.play()
-                if self.upon == 1 and self.money_player >= 1000:
-                    self.money_player -= 1000
+                if self.upon == 1 and self.money_player >= price60mm:
+                    self.money_player -= price60mm
                     self.Ammo60 += 1
                     contador60mm += 1
-                    tank.player.money -= 1000
-                if self.upon == 2 and self.money_player >= 2500:
-                    self.money_player -= 2500
+                    tank.player.money -= price60mm
+                if self.upon == 2 and self.money_player >= price80mm:
+                    self.money_player -= price80mm
                     self.Ammo80 += 1
                     contador80mm += 1
-                    tank.player.money -= 2500
-                if self.upon == 3 and self.money_player >= 4000:
-                    self.money_player -= 4000
+                    tank.player.money -= price80mm
+                if self.upon == 3 and self.money_player >= price105mm:
+                    self.money_player -= price105mm
                     self.Ammo105 += 1
                     contador105mm += 1
-                    tank.player.money -= 4000
+                    tank.player.money -= price105mm
                 if self.upon == 4:
                     tank.player.money = (
                         tank.player.money
-                        + contador60mm * 1000
-                        + contador80mm * 2500
-                        + contador105mm * 4000
+                        + contador60mm * price60mm
+                        + contador80mm * price80mm
+                        + contador105mm * price105mm
                     )
                     self.money_player = (
                         tank.player.money
-                        + contador60mm * 1000
-                        + contador80mm * 2500
-                        + contador105mm * 4000
+                        + contador60mm * price60mm
+                        + contador80mm * price80mm
+                        + contador105mm * price105mm
                     )
                     contador60mm = 0
                     contador80mm = 0
@@ -264,20 +267,21 @@ class Shop:
         else:
             self.c105_button_color = "#A4947A"
 
-    def cannonball_buttons(self, message: str):
+    def cannonball_buttons(self, caliber: int):
         """
-        Function responsible for creating the surface that represents the button,
-        in addition to writing the message of each button in the center of each surface
+        Function responsible for creating the surface that represents the button
+        of the given CannonballType, in addition to writing its price in the
+        center of the surface
         """
         sf = pygame.Surface(self.ammo_button_reset_position)
         box_size = sf.get_size()
-        end = self.money_font.render(message, True, "#ffffff")
+        end = text_cache.render(self.money_font, f"${SHELLS[caliber].price}", "#ffffff")
         box_pos = ((box_size[0] - box_size[0]) / 3, box_size[1] / 4)
-        if message == "$1000":
+        if caliber == CannonballType.MM60:
             sf.fill(self.c60_button_color)
-        elif message == "$2500":
+        elif caliber == CannonballType.MM80:
             sf.fill(self.c80_button_color)
-        elif message == "$4000":
+        elif caliber == CannonballType.MM105:
             sf.fill(self.c105_button_color)
 
         sf.blit(
@@ -293,7 +297,7 @@ class Shop:
         """This method draws the button for the resetting option."""
         sf = pygame.Surface(self.button_reset_position)
         box_size = sf.get_size()
-        end = self.money_font.render(message, True, "#ffffff")
+        end = text_cache.render(self.money_font, message, "#ffffff")
         box_pos = ((box_size[0] - box_size[0]) / 3, box_size[1] / 4)
         sf.fill(self.reset_button_color)
 
@@ -310,7 +314,7 @@ class Shop:
         """This method draw the button that finish the shopping."""
         sf = pygame.Surface(self.buy_button_reset_position)
         box_size = sf.get_size()
-        end = self.money_font.render(message, True, "#ffffff")
+        end = text_cache.render(self.money_font, message, "#ffffff")
         box_pos = ((box_size[0] - box_size[0]) / 3, box_size[1] / 4)
         sf.fill(self.buy_button_color)
 
@@ -387,20 +391,22 @@ class Shop:
             (instance.windows_size[0] / 2.32, instance.windows_size[1] / 2.4),
             int(instance.windows_size[0] / 51.2),
         )
-        buy_now = self.money_font.render(
-            "Compre ya sus balas al por menor", True, "#ffffff"
+        buy_now = text_cache.render(
+            self.money_font, "Compre ya sus balas al por menor", "#ffffff"
         )
         self.screen.blit(
             buy_now,
             (instance.windows_size[0] / 2.72, instance.windows_size[1] / 1.44),
         )
-        best = self.principal_font.render("Tienda Los Manqueques", True, "#ffffff")
+        best = text_cache.render(
+            self.principal_font, "Tienda Los Manqueques", "#ffffff"
+        )
         self.screen.blit(
             best,
             (instance.windows_size[0] / 2.56, instance.windows_size[1] / 10.28),
         )
-        press_to_continue = self.money_font.render(
-            "Presione espacio para continuar", True, "#ffffff"
+        press_to_continue = text_cache.render(
+            self.money_font, "Presione espacio para continuar", "#ffffff"
         )
         self.screen.blit(
             press_to_continue,
@@ -0,0 +1,192 @@
+"""
+This module keeps a range table with the shots that the bots use to start
+their search. For every gravity, wind and target, relative to the tank, it
+stores the speed to reach the target in free flight with a few elevations.
+The table is built once, saved as a .npy file and memory-mapped when the game
+starts, and the shots that hit during the session are remembered in a small
+LRU cache. It is built with:
+
+    python shot_table.py
+"""
+
+import logging
+import math
+import os
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+import constants
+from caches import resource_path
+from cannonballs import CannonballType
+from trajectory import SPAWN_OFFSET
+
+TABLE_PATH = resource_path("tables/shot_table.npy")
+# Buckets of the table, the wind of the game settles on whole numbers
+GRAVITY_BUCKETS = np.union1d(
+    np.geomspace(constants.MIN_GRAVITY, constants.MAX_GRAVITY, 16),
+    [constants.DEFAULT_GRAVITY],
+)
+WIND_BUCKETS = np.arange(-10, 11)
+DISTANCE_STEP = 32  # px
+MAX_DX = 1920  # px
+MAX_DY = 800  # px
+DX_BUCKETS = np.arange(-MAX_DX, MAX_DX + 1, DISTANCE_STEP)
+DY_BUCKETS = np.arange(-MAX_DY, MAX_DY + 1, DISTANCE_STEP)
+# Elevations over the horizon of the shots stored for every target
+ELEVATIONS = np.radians([20, 35, 50, 65, 80])
+SPEED_BISECTIONS = 30
+# Number of solved shots remembered during a session
+SOLVED_SHOTS = 256
+
+logger = logging.getLogger(__name__)
+
+
+def solve_speeds(
+    dx: np.ndarray,
+    dy: np.ndarray,
+    elevation: np.ndarray,
+    gravity: float,
+    wind: float,
+) -> np.ndarray:
+    """
+    Returns the speed that takes a cannonball, fired with the given elevation
+    towards the target, through the point (dx, dy) relative to the tank, with
+    the trajectory of Trajectory and without terrain. The speed is searched by
+    bisection, and it is nan when no speed of the game reaches the target.
+    """
+    angle = np.where(dx < 0, math.pi - elevation, elevation)
+    cos, sin = np.cos(angle), np.sin(angle)
+    offset = SPAWN_OFFSET[CannonballType.MM80]
+    distance = dx - offset * cos
+    drift = wind * constants.WIND_EFFECT_SCALE / constants.X_SPEED
+    step = constants.X_SPEED / constants.PHYSICS_FPS
+
+    def below(speed: np.ndarray) -> np.ndarray:
+        """Whether the path passes under the target or never reaches it"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            time = distance / (speed * cos + drift)
+        y = (
+            -offset * sin
+            + (-speed * sin - gravity * step / 2) * time
+            + gravity * time**2 / 2
+        )
+        return (time <= 0) | ~np.isfinite(time) | (y > dy)
+
+    low = np.ones(angle.shape)
+    high = np.full(angle.shape, float(constants.SHOOT_MAX_SPEED))
+    reachable = below(low) & ~below(high)
+    for _ in range(SPEED_BISECTIONS):
+        middle = (low + high) / 2
+        is_below = below(middle)
+        low = np.where(is_below, middle, low)
+        high = np.where(is_below, high, middle)
+
+    return np.where(reachable, high, np.nan)
+
+
+def build_table() -> np.ndarray:
+    """
+    Returns the table of speeds, with shape (gravity, wind, dx, dy,
+    elevation).
+    """
+    table = np.empty(
+        (
+            len(GRAVITY_BUCKETS),
+            len(WIND_BUCKETS),
+            len(DX_BUCKETS),
+            len(DY_BUCKETS),
+            len(ELEVATIONS),
+        ),
+        dtype=np.float16,
+    )
+    dx, dy, elevation = np.meshgrid(DX_BUCKETS, DY_BUCKETS, ELEVATIONS, indexing="ij")
+    for i, gravity in enumerate(GRAVITY_BUCKETS):
+        for j, wind in enumerate(WIND_BUCKETS):
+            table[i, j] = solve_speeds(dx, dy, elevation, gravity, wind)
+    return table
+
+
+class ShotTable:
+    """
+    This class looks up the shots of the table, with the speed corrected for
+    the exact gravity, and remembers the shots that hit during the session,
+    forgetting the least recently used ones.
+    """
+
+    table: Optional[np.ndarray]
+    solved: OrderedDict[tuple[int, int, int, int], tuple[float, float]]
+
+    def __init__(self, path: str):
+        """Maps the table file, if it has been built"""
+        self.table = None
+        self.solved = OrderedDict()
+        try:
+            self.table = np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            logger.warning(
+                "The shot table %s has not been built, the bots will search "
+                "their shots without it. Build it with: python shot_table.py",
+                path,
+            )
+
+    @staticmethod
+    def key(
+        dx: float, dy: float, gravity: float, wind: float
+    ) -> tuple[int, int, int, int]:
+        """Returns the indices of the nearest buckets of the table"""
+        return (
+            int(np.argmin(np.abs(np.log(GRAVITY_BUCKETS / gravity)))),
+            int(np.argmin(np.abs(WIND_BUCKETS - wind))),
+            int(np.clip(round((dx + MAX_DX) / DISTANCE_STEP), 0, len(DX_BUCKETS) - 1)),
+            int(np.clip(round((dy + MAX_DY) / DISTANCE_STEP), 0, len(DY_BUCKETS) - 1)),
+        )
+
+    def lookup(
+        self, dx: float, dy: float, gravity: float, wind: float
+    ) -> list[tuple[float, float]]:
+        """
+        Returns the angles and speeds known to reach the target at (dx, dy)
+        from the tank, first the one that hit it in this session, if any. The
+        speeds of the table grow with the square root of the gravity.
+        """
+        key = self.key(dx, dy, gravity, wind)
+        shots = []
+        if key in self.solved:
+            self.solved.move_to_end(key)
+            shots.append(self.solved[key])
+
+        if self.table is not None:
+            speeds = self.table[key].astype(float)
+            speeds *= math.sqrt(gravity / GRAVITY_BUCKETS[key[0]])
+            for elevation, speed in zip(ELEVATIONS, speeds):
+                if np.isfinite(speed):
+                    angle = math.pi - elevation if dx < 0 else elevation
+                    shots.append((float(angle), float(speed)))
+
+        return shots
+
+    def remember(
+        self, dx: float, dy: float, gravity: float, wind: float, shot: tuple
+    ) -> None:
+        """Saves the angle and speed of a shot that hit the target at (dx, dy)"""
+        key = self.key(dx, dy, gravity, wind)
+        self.solved[key] = (shot[0], shot[1])
+        self.solved.move_to_end(key)
+        if len(self.solved) > SOLVED_SHOTS:
+            self.solved.popitem(last=False)
+
+
+shot_table = ShotTable(TABLE_PATH)
+
+
+def main():
+    """Builds the table and saves it where the game loads it"""
+    os.makedirs(os.path.dirname(TABLE_PATH), exist_ok=True)
+    np.save(TABLE_PATH, build_table())
+    print(f"Saved {TABLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+This module runs complete games without window, sound or frame pacing, with
+bots in every tank, and prints the results of every player. It is used to
+evaluate balance changes over many games, for example:
+
+    python sim.py --players 8 --bots 8 --rounds 10 --seed 1
+"""
+
+import argparse
+import os
+
+# The dummy drivers must be selected before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import random
+from typing import Optional
+
+import pygame
+
+import context
+import planner
+from difficulty import BotDifficulty
+from effects import AmbientEffect
+from planner import ShotSearch
+from player import Player
+from round import Round
+from tank_game import TankGame
+
+
+class HeadlessRound(Round):
+    """
+    This class is a Round that is never drawn. Every frame only advances the
+    simulation clock one fixed step, so the game runs as fast as the physics
+    can be calculated, and the pauses made for the players are skipped.
+    """
+
+    def render(self) -> None:
+        """Consumes the pending steps and advances the clock one step"""
+        self.simulate()
+        self.simulation_clock.feed(self.simulation_clock.step)
+
+    def sleep_rendering(self, time_ms: int) -> None:
+        """There is nobody to wait for"""
+
+    def display_explotion(self):
+        """The explosion is only an animation"""
+
+    def display_explosions(self) -> None:
+        """The explosions are only animations"""
+
+    def display_results(self):
+        """The results are returned by play_match"""
+
+    def wait_planning(self, search: ShotSearch) -> None:
+        """The bots try all the shots of their budget, without deadline"""
+        search.future.result()
+
+
+def play_match(
+    players: int,
+    bots: int,
+    rounds: int,
+    seed: Optional[int] = None,
+    effect: AmbientEffect = AmbientEffect.NONE,
+    difficulty: BotDifficulty = BotDifficulty.NORMAL,
+    simultaneous: bool = False,
+) -> list[dict[str, int]]:
+    """
+    Plays a game of the given number of rounds, like TankGame.start, and
+    returns the statistics of every player at the end. With simultaneous,
+    all the tanks shoot at once in every turn.
+    """
+    if bots != players:
+        raise ValueError("every player must be a bot in a headless game")
+
+    random.seed(seed)
+    instance = context.instance
+    instance.number_of_players = players
+    instance.number_of_bots = bots
+    instance.number_of_rounds = rounds
+    instance.type_of_effect = effect
+    instance.bot_difficulty = difficulty
+    instance.simultaneous_turns = simultaneous
+    instance.players = [
+        Player(color) for color in TankGame.create_different_colors(players)
+    ]
+
+    try:
+        for _ in range(rounds):
+            for player in instance.players:
+                player.money += 10000
+            HeadlessRound().start()
+    finally:
+        planner.shutdown()
+
+    return [
+        {
+            "points": player.points,
+            "murders": player.murders,
+            "deaths": player.deaths,
+            "money": player.money,
+        }
+        for player in instance.players
+    ]
+
+
+def print_results(results: list[dict[str, int]]) -> None:
+    """Prints the statistics of every player as a table"""
+    print(f"{'Player':>6} {'Points':>8} {'Murders':>8} {'Deaths':>7} {'Money':>8}")
+    for i, stats in enumerate(results, 1):
+        print(
+            f"{i:>6} {stats['points']:>8} {stats['murders']:>8}"
+            f" {stats['deaths']:>7} {stats['money']:>8}"
+        )
+
+
+def parse_arguments(description: str) -> argparse.ArgumentParser:
+    """Returns the parser of the options shared by the headless programs"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--bots", type=int, default=None, help="defaults to players")
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--effect",
+        choices=[effect.name.lower() for effect in AmbientEffect],
+        default=AmbientEffect.NONE.name.lower(),
+    )
+    parser.add_argument(
+        "--difficulty",
+        choices=[difficulty.name.lower() for difficulty in BotDifficulty],
+        default=BotDifficulty.NORMAL.name.lower(),
+    )
+    parser.add_argument(
+        "--simultaneous", action="store_true", help="all the tanks shoot at once"
+    )
+    return parser
+
+
+def main():
+    """Runs one headless game with the options of the command line"""
+    parser = parse_arguments(__doc__.strip().splitlines()[0])
+    args = parser.parse_args()
+    if args.bots is None:
+        args.bots = args.players
+    if args.players < 2 or args.bots != args.players:
+        parser.error("a headless game needs at least 2 players, all of them bots")
+
+    pygame.init()
+    print_results(
+        play_match(
+            args.players,
+            args.bots,
+            args.rounds,
+            args.seed,
+            AmbientEffect[args.effect.upper()],
+            BotDifficulty[args.difficulty.upper()],
+            args.simultaneous,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
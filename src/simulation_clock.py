@@ -0,0 +1,39 @@
+from typing import Iterator
+
+import constants
+
+
+class SimulationClock:
+    """
+    This class is a fixed timestep clock for the physics of the game. The time
+    of every rendered frame is accumulated and then consumed in steps of the
+    same size, so the simulation gives the same results whatever the frame
+    rate is. The time left in the accumulator is used to interpolate the
+    drawing between the last two steps.
+    """
+
+    step: float
+    accumulator: float
+
+    def __init__(self, step: float = 1.0 / constants.PHYSICS_FPS):
+        """Initialize the clock with an empty accumulator"""
+        self.step = step
+        self.accumulator = 0.0
+
+    def feed(self, elapsed: float) -> None:
+        """
+        Adds the elapsed time of a frame to the accumulator. It is limited to
+        MAX_FRAME_TIME to avoid a spiral of steps after a very slow frame.
+        """
+        self.accumulator += min(elapsed, constants.MAX_FRAME_TIME)
+
+    def steps(self) -> Iterator[float]:
+        """Yields the fixed dt once for every complete step accumulated"""
+        while self.accumulator >= self.step:
+            self.accumulator -= self.step
+            yield self.step
+
+    @property
+    def alpha(self) -> float:
+        """Return how far the time is between the last step and the next one"""
+        return self.accumulator / self.step
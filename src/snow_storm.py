@@ -69,3 +69,21 @@ class SnowStorm(Drawable):
     def draw(self, screen: pygame.surface.Surface) -> None:
         """This function only draws the particles on the screen"""
         self.draw_snowflakes(screen)
+
+    def get_rects(self) -> list[pygame.Rect]:
+        """This function returns the areas where the snowflakes are drawn"""
+        return [
+            pygame.Rect(snowflake.x - 3, snowflake.y - 3, 7, 7)
+            for snowflake in self.snowflakes
+        ]
+
+    def draw_behind(
+        self, screen: pygame.surface.Surface, terrain: pygame.surface.Surface
+    ) -> None:
+        """
+        This function draws the snowflakes and then the given layer of the
+        terrain again over each of them, so the snow falls behind the terrain.
+        """
+        self.draw_snowflakes(screen)
+        for rect in self.get_rects():
+            screen.blit(terrain, rect, rect)
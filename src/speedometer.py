@@ -1,8 +1,11 @@
 import math
+from typing import Optional
 
 import pygame
 
-from caches import font_cache
+from caches import text_cache
+
+NEEDLE_ANGLE_STEP = 1  # degrees between the needles kept
 
 
 class Speedometer:
@@ -15,6 +18,8 @@ class Speedometer:
     min: int
     max: int
     actual: float
+    dial: Optional[pygame.Surface]  # face of the speedometer, without needle
+    needles: dict[int, tuple[pygame.Surface, pygame.Vector2]]
 
     def __init__(self, size: int):
         """Initialize the class with the default values"""
@@ -23,16 +28,20 @@ class Speedometer:
         self.inc = 10
         self.start_angle = math.radians(200)
         self.end_angle = math.radians(-20)
-        self.font = font_cache["Roboto.ttf", 30]
-        self.font.set_bold(True)
+        self.font = ("Roboto.ttf", 30)
         self.size = size
+        self.dial = None
+        self.needles = {}
 
-    def get_draw(self) -> pygame.Surface:
+    def get_dial(self) -> pygame.Surface:
         """
-        This function is responsible for drawing and rendering the "drawing" of
-        the speedometer on the HUD. Used to display the current speed according
-        to the parameters and values in the class instance.
+        This function returns the face of the speedometer, with the marks and
+        the numbers of the speeds, scaled to its size. It is only drawn the
+        first time it is requested.
         """
+        if self.dial is not None:
+            return self.dial
+
         surface = pygame.Surface((500, 500), pygame.SRCALPHA, 32)
         surface = surface.convert_alpha()
 
@@ -53,13 +62,13 @@ class Speedometer:
                     4,
                 )
                 if a > math.radians(90):
-                    num = self.font.render(f"{i}", True, "#ffffff")
+                    num = text_cache.render(self.font, f"{i}", "#ffffff", bold=True)
                     surface.blit(
                         num,
                         (x + (x - 70) * ax, y - (y - 70) * ay),
                     )
                 elif a == math.radians(90):
-                    num = self.font.render(f"{i}", True, "#ffffff")
+                    num = text_cache.render(self.font, f"{i}", "#ffffff", bold=True)
                     surface.blit(
                         num,
                         (
@@ -68,7 +77,7 @@ class Speedometer:
                         ),
                     )
                 else:
-                    num = self.font.render(f"{i}", True, "#ffffff")
+                    num = text_cache.render(self.font, f"{i}", "#ffffff", bold=True)
                     surface.blit(
                         num,
                         (x + (x - 70) * ax - num.get_size()[0], y - (y - 70) * ay),
@@ -83,19 +92,33 @@ class Speedometer:
                     4,
                 )
 
-        self.font.set_bold(False)
-        sp = self.font.render("Shoot Speed", True, "#ffffff")
-        self.font.set_bold(True)
+        sp = text_cache.render(self.font, "Shoot Speed", "#ffffff")
 
         surface.blit(sp, (250 - sp.get_size()[0] / 2, 350))
 
+        self.dial = pygame.transform.scale(surface, (self.size, self.size))
+        return self.dial
+
+    def get_needle(self, step: int) -> tuple[pygame.Surface, pygame.Vector2]:
+        """
+        This function returns the needle of the speedometer pointing to the
+        given multiple of NEEDLE_ANGLE_STEP, scaled like the face and cropped
+        to its drawing, and its offset from the corner of the face. Every
+        needle is only drawn the first time it is requested.
+        """
+        if step in self.needles:
+            return self.needles[step]
+
+        surface = pygame.Surface((500, 500), pygame.SRCALPHA, 32)
+        surface = surface.convert_alpha()
+        needle_angle = math.radians(step * NEEDLE_ANGLE_STEP)
         pygame.draw.line(
             surface,
             "red",
             (250, 250),
             (
-                250 + 60 * math.cos(self.start_angle + angle * self.actual),
-                250 - 60 * math.sin(self.start_angle + angle * self.actual),
+                250 + 60 * math.cos(needle_angle),
+                250 - 60 * math.sin(needle_angle),
             ),
             16,
         )
@@ -103,15 +126,32 @@ class Speedometer:
             surface,
             "red",
             (
-                250 + 60 * math.cos(self.start_angle + angle * self.actual),
-                250 - 60 * math.sin(self.start_angle + angle * self.actual),
+                250 + 60 * math.cos(needle_angle),
+                250 - 60 * math.sin(needle_angle),
             ),
             (
-                250 + 140 * math.cos(self.start_angle + angle * self.actual),
-                250 - 140 * math.sin(self.start_angle + angle * self.actual),
+                250 + 140 * math.cos(needle_angle),
+                250 - 140 * math.sin(needle_angle),
             ),
             10,
         )
         pygame.draw.circle(surface, "red", (250, 250), 10)
 
-        return pygame.transform.scale(surface, (self.size, self.size))
+        surface = pygame.transform.scale(surface, (self.size, self.size))
+        bounds = surface.get_bounding_rect()
+        self.needles[step] = (
+            surface.subsurface(bounds).copy(),
+            pygame.Vector2(bounds.topleft),
+        )
+        return self.needles[step]
+
+    def draw(self, screen: pygame.Surface, position: tuple[float, float]) -> None:
+        """
+        This function draws the speedometer on the screen at the given
+        position, showing the current speed of the class instance.
+        """
+        angle = (self.end_angle - self.start_angle) / (self.max - self.min)
+        needle_angle = math.degrees(self.start_angle + angle * self.actual)
+        needle, offset = self.get_needle(round(needle_angle / NEEDLE_ANGLE_STEP))
+        screen.blit(self.get_dial(), position)
+        screen.blit(needle, offset + position)
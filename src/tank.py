@@ -65,6 +65,36 @@ class Tank(Drawable, Collidable):
             return True
         return False
 
+    def sweep(
+        self,
+        start: pygame.Vector2,
+        end: pygame.Vector2,
+        validation_distance: float = 0,
+    ) -> Optional[float]:
+        """
+        This function is responsible for checking if the cannonball hits the
+        tank while moving from start to end, solving where the segment enters
+        the circle of validation_distance around the tank. Returns the fraction
+        of the way where it happens or None.
+        """
+        delta = end - start
+        offset = start - self.position
+
+        c = offset.dot(offset) - validation_distance**2
+        if c <= 0:
+            return 0.0
+
+        a = delta.dot(delta)
+        b = 2 * offset.dot(delta)
+        discriminant = b**2 - 4 * a * c
+        if a == 0 or discriminant < 0:
+            return None
+
+        t = (-b - math.sqrt(discriminant)) / (2 * a)
+        if 0 <= t <= 1:
+            return t
+        return None
+
     def shoot(self) -> Optional[Cannonball]:
         """
         This function calculates the directions to fire the projectile,
@@ -116,6 +146,16 @@ class Tank(Drawable, Collidable):
                 return Cannonball105mm(start_point, start_velocity)
         return None
 
+    def get_rect(self) -> pygame.Rect:
+        """
+        This function returns the area where the tank is drawn, with its
+        cannon in any angle and the fire when it is not alive.
+        """
+        rect = pygame.Rect(self.position.x - 30, self.position.y - 30, 60, 60)
+        if not self.is_alive:
+            rect.union_ip(self.animacion_fuego.get_rect())
+        return rect
+
     def draw(self, screen: pygame.surface.Surface) -> None:
         """
         This function is responsible for drawing the tank and updates the
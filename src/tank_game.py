@@ -1,10 +1,9 @@
 from random import shuffle
 
 import pygame
-from pygame.font import Font
 from positions_table import PositionTableButton
 import constants
-from caches import audio_cache, image_cache, font_cache
+from caches import audio_cache, image_cache, text_cache
 from context import Context
 from exit_requested import ExitRequested, RestartRequested
 from final_winner import FinalWinner
@@ -26,7 +25,7 @@ class TankGame:
     menu: Menu
     menu_option: OptionMenu
     screen_resolution: list[tuple[int, int]]
-    font: Font
+    font: tuple[str, int]
 
     def __init__(self, context: Context) -> None:
         """
@@ -43,7 +42,7 @@ class TankGame:
             (1600, 900),
             (1920, 1080),
         ]
-        self.font = font_cache["Roboto.ttf", int(self.context.windows_size[0] // 53.33)]
+        self.font = ("Roboto.ttf", int(self.context.windows_size[0] // 53.33))
         self.position_table = PositionTable(self.context.screen)
         self.shop_menu = None
         self.finalWinner = FinalWinner()
@@ -109,10 +108,8 @@ class TankGame:
                 self.context.windows_size[1] / 2 - size[1] / 2,
             ),
         )
-        out_text = self.font.render(
-            "Presione espacio para continuar",
-            True,
-            "white",
+        out_text = text_cache.render(
+            self.font, "Presione espacio para continuar", "white"
         )
         size = out_text.get_rect().size
         screen.blit(
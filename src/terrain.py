@@ -1,12 +1,53 @@
+import math
 import random
 from random import randint
+from typing import Optional
 
+import numpy as np
 import pygame
+from numpy.lib.stride_tricks import sliding_window_view
 
 import constants
 from collidable import Collidable
 from context import instance
 from draw import Drawable
+from height_index import HeightIndex
+
+
+def cut_circle(
+    layers: np.ndarray,
+    columns: np.ndarray,
+    center_x: float | np.ndarray,
+    center_y: float | np.ndarray,
+    radius: float | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes how a circle cuts the layers (..., columns, layers) of the given
+    columns (..., columns). The center is measured from the bottom of the
+    map, and any leading dimensions are independent terrains, each one with
+    its own center and radius. Returns the soil removed inside the circle,
+    which layers are above the circle, the soil of them that falls and the top
+    of every layer.
+    """
+    center_x = np.asarray(center_x)[..., np.newaxis]
+    center_y = np.asarray(center_y)[..., np.newaxis]
+    radius = np.asarray(radius)[..., np.newaxis]
+
+    left_damage = np.sqrt(np.maximum(radius**2 - (columns - center_x) ** 2, 0))
+    sup_limit = (center_y + left_damage)[..., np.newaxis]
+    inf_limit = (center_y - left_damage)[..., np.newaxis]
+
+    end_layer = np.cumsum(layers, axis=-1)
+    start_layer = end_layer - layers
+
+    affected = np.maximum(
+        0,
+        np.minimum(end_layer, sup_limit) - np.maximum(start_layer, inf_limit),
+    )
+    above = sup_limit < end_layer
+    fall = np.where(above, end_layer - np.maximum(sup_limit, start_layer), 0)
+
+    return affected, above, fall, end_layer
 
 
 class Terrain(Drawable, Collidable):
@@ -16,9 +57,14 @@ class Terrain(Drawable, Collidable):
     """
 
     size: tuple[int, int]
-    ground_lines: list[int]
-    new_ground_lines: list[list[float]]
-    falling: list[list[tuple[float, float]]]
+    ground_lines: np.ndarray  # (width,) total height of each column
+    new_ground_lines: np.ndarray  # (width, layers) height of each layer
+    falling: np.ndarray  # (width, layers, 2) top and size of falling soil
+    falling_columns: np.ndarray  # sorted indices of the columns with falling soil
+    height_index: HeightIndex
+    surface: Optional[pygame.surface.Surface]
+    dirty_columns: list[tuple[int, int]]
+    version: int  # changes every time the drawing of the terrain changes
 
     def generate_terrain(self, mountains: int, valley: int):
         """
@@ -65,11 +111,8 @@ class Terrain(Drawable, Collidable):
         original_max = (m - i - 1) ** 2
         multiplier = height / original_max
 
-        for k in range(i, m):
-            self.ground_lines[k] += int(((k - i) ** 2) * multiplier)
-
-        for k in range(m, j):
-            self.ground_lines[k] += int(((j - k) ** 2) * multiplier)
+        self.ground_lines[i:m] += np.trunc((np.arange(i, m) - i) ** 2 * multiplier)
+        self.ground_lines[m:j] += np.trunc((j - np.arange(m, j)) ** 2 * multiplier)
 
     def valley(self, start: int, end: int, depth: int):
         """
@@ -82,11 +125,12 @@ class Terrain(Drawable, Collidable):
         original_max = (m - start - 1) ** 2
         multiplier = depth / original_max
 
-        for i in range(start, m):
-            self.ground_lines[i] -= int(((i - start) ** 2) * multiplier)
-
-        for j in range(m, end):
-            self.ground_lines[j] -= int(((j - end) ** 2) * multiplier)
+        self.ground_lines[start:m] -= np.trunc(
+            (np.arange(start, m) - start) ** 2 * multiplier
+        )
+        self.ground_lines[m:end] -= np.trunc(
+            (np.arange(m, end) - end) ** 2 * multiplier
+        )
 
     def __init__(
         self, size: tuple[int, int], mountains: int, valleys: int, colors: list[str]
@@ -96,88 +140,194 @@ class Terrain(Drawable, Collidable):
         and valleys, and color layers for rendering.
         """
         self.size = size
-        self.ground_lines = [constants.SEA_LEVEL] * (self.size[0])
+        self.ground_lines = np.full(self.size[0], constants.SEA_LEVEL, dtype=float)
 
+        # Generate the terrain, with a fixed seed it does not touch the state
+        # of the random generator used by the rest of the game
+        state = random.getstate()
         if constants.MAP_SEED != -1:
             random.seed(constants.MAP_SEED)
-
-        # Generate the terrain
         self.generate_terrain(mountains, valleys)
-        random.seed()
+        if constants.MAP_SEED != -1:
+            random.setstate(state)
+        self.height_index = HeightIndex(self.ground_lines)
 
         self.terrain_layer_colors = colors
         self.layers_num = len(colors)
 
-        self.new_ground_lines = []
-        self.falling = []
         self.is_falling = False
         self.falling_speed = 0
-        # Transform to a new model
-        for height in self.ground_lines:
-            self.new_ground_lines.append([height / self.layers_num] * self.layers_num)
-            self.falling.append([(0, 0)] * self.layers_num)
+        # Transform to a new model, every layer starts with the same height
+        self.new_ground_lines = np.repeat(
+            self.ground_lines[:, np.newaxis] / self.layers_num, self.layers_num, axis=1
+        )
+        self.falling = np.zeros((self.size[0], self.layers_num, 2))
+        self.falling_columns = np.empty(0, dtype=int)
+
+        # Pre-rendered ground, only the dirty columns are painted again. It is
+        # created on the first draw, so a terrain that is never drawn is light
+        self.surface = None
+        self.dirty_columns = [(0, self.size[0])]
+        self.version = 0
+
+    def mark_dirty(self, start: int, end: int) -> None:
+        """
+        Marks the columns in [start, end) to be painted again on the cached
+        surface the next time the terrain is drawn.
+        """
+        start = max(int(start), 0)
+        end = min(int(end), self.size[0])
+        if start < end:
+            self.dirty_columns.append((start, end))
+            self.version += 1
+
+    def carve(self, center: pygame.Vector2, radius: float) -> tuple[int, int]:
+        """
+        Removes a circle of ground centered on the given screen position. The
+        cut is computed for all the affected columns and layers at once, the
+        soil left above the hole starts to fall. Returns the range of columns
+        [start, end) that were modified.
+        """
+        radius = int(radius)
+        imp_x = int(center.x)
+        imp_y = self.size[1] - center.y
+
+        start = max(imp_x - radius, 0)
+        end = min(imp_x + radius + 1, self.size[0])
+        if start >= end:
+            return start, start
+
+        # The soil still falling from an earlier crater lands before the cut,
+        # the new fall would overwrite it otherwise
+        pending = self.falling[start:end, :, 1]
+        if pending.any():
+            self.new_ground_lines[start:end] += pending
+            self.falling[start:end] = 0
+
+        columns = np.arange(start, end)
+        layers = self.new_ground_lines[start:end]
+        affected, above, fall, end_layer = cut_circle(
+            layers, columns, imp_x, imp_y, radius
+        )
+        self.ground_lines[start:end] -= affected.sum(axis=1)
+        self.height_index.update(start, end, self.ground_lines[start:end])
+
+        # Everything above the hole falls
+        falling = self.falling[start:end]
+        falling[above, 0] = (self.size[1] - end_layer)[above]
+        falling[above, 1] = fall[above]
+        affected = affected + fall
+
+        if above.any():
+            self.falling_speed = 0
+            self.is_falling = True
+            self.falling_columns = np.union1d(
+                self.falling_columns, columns[above.any(axis=1)]
+            )
+
+        layers -= np.maximum(0, affected)
+        self.mark_dirty(start, end)
+
+        return start, end
 
     def tick(self, dt: float, gravity: float):
         """
         This method is responsible for the calculations for each frame of the
-        fall of the ground.
+        fall of the ground. Only the columns with falling soil are processed,
+        a column lands when the top of its highest falling layer reaches the
+        ground, and then it leaves the set of falling columns.
         """
-        self.is_falling = False
         self.falling_speed += gravity * dt
-        for i, layers in enumerate(self.falling):
-            top_point = None
-            for j, layer in enumerate(layers):
-                if layer == (0, 0):
-                    continue
-                self.is_falling = True
-                top_point = instance.map_size[1] - layer[0]
-                layers[j] = (layer[0] + self.falling_speed * dt, layer[1])
-
-            if top_point is not None and top_point < self.ground_lines[i]:
-                for j, layer in enumerate(layers):
-                    self.new_ground_lines[i][j] += layer[1]
-                    self.falling[i][j] = (0, 0)
+
+        columns = self.falling_columns
+        self.is_falling = columns.size > 0
+        if not self.is_falling:
+            return
+
+        falling = self.falling[columns]
+        active = np.any(falling != 0, axis=2)
+
+        # The top point is taken before moving the layers, as the original model
+        top_layer = self.layers_num - 1 - np.argmax(active[:, ::-1], axis=1)
+        top_point = (
+            instance.map_size[1] - falling[np.arange(columns.size), top_layer, 0]
+        )
+        falling[:, :, 0] += np.where(active, self.falling_speed * dt, 0)
+        self.version += 1
+
+        landed = ~active.any(axis=1) | (top_point < self.ground_lines[columns])
+        if landed.any():
+            landed_columns = columns[landed]
+            self.new_ground_lines[landed_columns] += falling[landed, :, 1]
+            falling[landed] = 0
+            self.falling_columns = columns[~landed]
+            self.mark_dirty(landed_columns[0], landed_columns[-1] + 1)
+
+        self.falling[columns] = falling
 
     def draw_falling(self, screen: pygame.surface.Surface) -> None:
         """
         This method is responsible for each frame when the ground is destroyed
         and a part of it needs to fall.
         """
-        for i, layers in enumerate(self.falling):
-            for layer, color in zip(layers, self.terrain_layer_colors):
-                if layer == (0, 0):
-                    continue
-                pygame.draw.rect(
-                    screen,
-                    color,
-                    pygame.Rect(
-                        i,
-                        layer[0],
-                        1,
-                        layer[1],
-                    ),
-                )
+        columns = self.falling_columns
+        for i, j in np.argwhere(np.any(self.falling[columns] != 0, axis=2)):
+            top, size = self.falling[columns[i], j]
+            pygame.draw.rect(
+                screen,
+                self.terrain_layer_colors[j],
+                pygame.Rect(columns[i], top, 1, size),
+            )
 
-    def draw(self, screen: pygame.surface.Surface) -> None:
+    def redraw_columns(self, start: int, end: int) -> None:
         """
-        Draws different layers of the terrain using different colors and heights,
-        simulating the substrate of the ground.
+        Paints again the columns in [start, end) of the cached surface using
+        different colors and heights, simulating the substrate of the ground.
         """
-        for i, layers in enumerate(self.new_ground_lines):
-            latest_height = 0
-            for layer, color in zip(layers, self.terrain_layer_colors):
+        self.surface.fill(
+            (0, 0, 0, 0), pygame.Rect(start, 0, end - start, self.size[1])
+        )
+        tops = np.cumsum(self.new_ground_lines[start:end], axis=1)
+
+        for i, (layers, layer_tops) in enumerate(
+            zip(self.new_ground_lines[start:end], tops), start
+        ):
+            for layer, top, color in zip(layers, layer_tops, self.terrain_layer_colors):
                 if layer != 0:
                     pygame.draw.rect(
-                        screen,
+                        self.surface,
                         color,
-                        pygame.Rect(
-                            i,
-                            self.size[1] - latest_height - layer,
-                            1,
-                            layer + 1,
-                        ),
+                        pygame.Rect(i, self.size[1] - top, 1, layer + 1),
                     )
-                latest_height += layer
+
+    def get_rects(self) -> list[pygame.Rect]:
+        """
+        Returns the areas that change the next time the terrain is drawn, the
+        dirty columns and the columns with falling soil.
+        """
+        rects = [
+            pygame.Rect(start, 0, end - start, self.size[1])
+            for start, end in self.dirty_columns
+        ]
+        if self.falling_columns.size > 0:
+            start = int(self.falling_columns.min())
+            end = int(self.falling_columns.max()) + 1
+            rects.append(pygame.Rect(start, 0, end - start, self.size[1]))
+        return rects
+
+    def draw(self, screen: pygame.surface.Surface) -> None:
+        """
+        Draws the terrain by blitting the cached surface, painting again only
+        the columns that changed since the last frame, and then the falling
+        soil on top.
+        """
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        for start, end in self.dirty_columns:
+            self.redraw_columns(start, end)
+        self.dirty_columns.clear()
+
+        screen.blit(self.surface, (0, 0))
         self.draw_falling(screen)
 
     def collides_with(
@@ -190,4 +340,83 @@ class Terrain(Drawable, Collidable):
         """
         line_index = int(point.x)
 
-        return point.y > (self.size[1] - self.ground_lines[line_index])
+        return bool(point.y > (self.size[1] - self.ground_lines[line_index]))
+
+    def is_clear(
+        self,
+        start: pygame.Vector2,
+        end: pygame.Vector2,
+        validation_distance: float = 0,
+    ) -> bool:
+        """
+        Broad phase check for a moving point, returns True when the segment
+        between the two positions is entirely above the highest ground under
+        its range of columns, in which case it can not collide with the
+        terrain and the exact check can be skipped.
+        """
+        reach = math.ceil(validation_distance)
+        first = int(min(start.x, end.x)) - reach
+        last = int(max(start.x, end.x)) + 1 + reach
+        highest = self.height_index.max(first, last)
+
+        return bool(max(start.y, end.y) <= self.size[1] - highest - validation_distance)
+
+    def sweep(
+        self,
+        start: pygame.Vector2,
+        end: pygame.Vector2,
+        validation_distance: float = 0,
+    ) -> Optional[float]:
+        """
+        Checks the whole segment between start and end against the height of
+        every column it crosses, and returns the fraction of the way where it
+        first goes under the ground, or None if it stays above it.
+        The ground is raised by validation_distance and widened by it to each
+        side, so the point collides when it is that close to the terrain.
+        """
+        if self.is_clear(start, end, validation_distance):
+            return None
+
+        delta = end - start
+        first = max(int(min(start.x, end.x)), 0)
+        last = min(int(max(start.x, end.x)), self.size[0] - 1)
+        if first > last:
+            return None
+
+        columns = np.arange(first, last + 1)
+        reach = math.ceil(validation_distance)
+        if reach > 0:
+            # Highest column within reach of each column crossed
+            low = max(first - reach, 0)
+            high = min(last + reach + 1, self.size[0])
+            heights = np.pad(
+                self.ground_lines[low:high],
+                (low - (first - reach), last + reach + 1 - high),
+            )
+            heights = sliding_window_view(heights, 2 * reach + 1).max(axis=1)
+        else:
+            heights = self.ground_lines[columns]
+        tops = self.size[1] - heights - validation_distance
+
+        if abs(delta.x) < constants.EPSILON:
+            enter = np.zeros(columns.size)
+            leave = np.ones(columns.size)
+        else:
+            # Fraction of the way where the segment enters and leaves each column
+            borders = (np.stack((columns, columns + 1)) - start.x) / delta.x
+            enter = np.clip(borders.min(axis=0), 0, 1)
+            leave = np.clip(borders.max(axis=0), 0, 1)
+
+        enter_y = start.y + delta.y * enter
+        leave_y = start.y + delta.y * leave
+
+        times = np.full(columns.size, np.inf)
+        under_at_leave = leave_y > tops
+        if delta.y > 0:
+            times[under_at_leave] = (tops[under_at_leave] - start.y) / delta.y
+        times = np.where(enter_y > tops, enter, times)
+
+        first_time = times.min()
+        if not np.isfinite(first_time):
+            return None
+        return float(first_time)
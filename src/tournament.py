@@ -0,0 +1,120 @@
+"""
+This module plays many headless games between bots in parallel, one process
+per core, and prints summary tables of the statistics of the players, for
+example:
+
+    python tournament.py --matches 1000 --players 8 --rounds 10 --seed 1
+"""
+
+# sim selects the dummy drivers, it must be imported before pygame
+import sim
+
+# pylint: disable=wrong-import-order
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import pygame
+
+from difficulty import BotDifficulty
+from effects import AmbientEffect
+
+STATS = ("points", "murders", "deaths", "money")
+
+
+def init_worker() -> None:
+    """
+    Initializes pygame once in every worker process, the fonts and images
+    loaded by the caches are then reused by all the matches of the worker.
+    """
+    pygame.init()
+
+
+def run_match(
+    task: tuple[int, int, int, AmbientEffect, BotDifficulty, bool],
+) -> list[dict[str, int]]:
+    """Plays a single match in a worker and returns the stats of its players"""
+    players, rounds, seed, effect, difficulty, simultaneous = task
+    return sim.play_match(
+        players, players, rounds, seed, effect, difficulty, simultaneous
+    )
+
+
+def run_tournament(
+    matches: int,
+    players: int,
+    rounds: int,
+    seed: int,
+    effect: AmbientEffect = AmbientEffect.NONE,
+    difficulty: BotDifficulty = BotDifficulty.NORMAL,
+    simultaneous: bool = False,
+    workers: Optional[int] = None,
+) -> list[list[dict[str, int]]]:
+    """
+    Plays all the matches in a pool of processes, each one with its own seed
+    derived from the seed of the tournament, and returns their results in
+    order.
+    """
+    seeds = random.Random(seed)
+    tasks = [
+        (players, rounds, seeds.getrandbits(32), effect, difficulty, simultaneous)
+        for _ in range(matches)
+    ]
+    workers = workers or os.cpu_count()
+    chunk_size = max(1, matches // (4 * workers))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        return list(pool.map(run_match, tasks, chunksize=chunk_size))
+
+
+def print_summary(results: list[list[dict[str, int]]]) -> None:
+    """
+    Prints the mean of every stat for each seat of the matches, and the
+    distribution of every stat over all the players.
+    """
+    print(f"{'Seat':>6}" + "".join(f"{stat.capitalize():>10}" for stat in STATS))
+    for seat in range(len(results[0])):
+        means = [
+            statistics.fmean(match[seat][stat] for match in results) for stat in STATS
+        ]
+        print(f"{seat + 1:>6}" + "".join(f"{mean:>10.2f}" for mean in means))
+
+    print()
+    print(f"{'Stat':>8}{'Mean':>10}{'Stdev':>10}{'Min':>8}{'Max':>8}")
+    for stat in STATS:
+        values = [player[stat] for match in results for player in match]
+        print(
+            f"{stat.capitalize():>8}{statistics.fmean(values):>10.2f}"
+            f"{statistics.pstdev(values):>10.2f}{min(values):>8}{max(values):>8}"
+        )
+
+
+def main():
+    """Runs a tournament with the options of the command line"""
+    parser = sim.parse_arguments(__doc__.strip().splitlines()[0])
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    if args.bots is None:
+        args.bots = args.players
+    if args.players < 2 or args.bots != args.players:
+        parser.error("a tournament needs at least 2 players, all of them bots")
+
+    print_summary(
+        run_tournament(
+            args.matches,
+            args.players,
+            args.rounds,
+            0 if args.seed is None else args.seed,
+            AmbientEffect[args.effect.upper()],
+            BotDifficulty[args.difficulty.upper()],
+            args.simultaneous,
+            args.workers,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+"""
+This module predicts the flight of cannonballs without simulating it frame by
+frame. With constant gravity and wind the path is a parabola, so the impact
+against the terrain is found solving it between the columns of the heightmap.
+Every function works with arrays, so many shots can be solved at once.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pygame
+
+import constants
+from cannonballs import Cannonball105mm, Cannonball60mm, Cannonball80mm
+from impact import ImpactType
+from terrain import Terrain
+
+# Number of columns grouped in the broad phase of the terrain impact
+CHUNK_SIZE = 32
+# Samples and refinements used to find the contact with a circle
+CIRCLE_SAMPLES = 9
+CIRCLE_BISECTIONS = 12
+
+# Stats of every CannonballType, taken from the cannonballs themselves
+SHELLS = [
+    shell(pygame.Vector2(), pygame.Vector2())
+    for shell in (Cannonball60mm, Cannonball80mm, Cannonball105mm)
+]
+DAMAGE = np.array([shell.damage for shell in SHELLS])
+RADIUS = np.array([shell.radius for shell in SHELLS], dtype=float)
+RADIUS_DAMAGE = np.array([shell.radius_damage for shell in SHELLS])
+# Distance from the cannon where Tank.shoot places every cannonball
+SPAWN_OFFSET = np.array([10, 20, 30]) + constants.TANK_RADIO
+
+
+class Trajectory:
+    """
+    This class represents the parabolic path of one or more cannonballs, with
+    the same units used by Cannonball.tick: the time is the simulation time
+    (seconds of the game multiplied by X_SPEED) and the y axis points down.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    velocity_x: np.ndarray
+    velocity_y: np.ndarray
+    gravity: np.ndarray
+
+    def __init__(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        gravity: float | np.ndarray,
+        wind: float | np.ndarray = 0.0,
+        step: float = 0.0,
+    ):
+        """
+        Initializes the trajectories from the launch positions and velocities,
+        arrays of shape (2,) or (n, 2), gravity and wind can be a value for
+        all of them or one for each. The wind is the velocity of Wind, that
+        is applied as a constant drift like in Round. If step is given, the
+        parabola passes exactly through the positions of a simulation that
+        advances in steps of that size.
+        """
+        position = np.atleast_2d(np.asarray(position, dtype=float))
+        velocity = np.atleast_2d(np.asarray(velocity, dtype=float))
+        gravity = np.asarray(gravity, dtype=float)
+        drift = np.asarray(wind, dtype=float) * (
+            constants.WIND_EFFECT_SCALE / constants.X_SPEED
+        )
+
+        # Cannonball.tick moves before accelerating, which is the same as
+        # starting half a step slower on a continuous parabola
+        (
+            self.x,
+            self.y,
+            self.velocity_x,
+            self.velocity_y,
+            self.gravity,
+        ) = np.broadcast_arrays(
+            position[:, 0],
+            position[:, 1],
+            velocity[:, 0] + drift,
+            velocity[:, 1] - gravity * step / 2,
+            gravity,
+        )
+
+    def position_at(self, time: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the x and y coordinates of the trajectories at the given time"""
+        return (
+            self.x + self.velocity_x * time,
+            self.y + self.velocity_y * time + self.gravity * time**2 / 2,
+        )
+
+    def leave_time(self, width: float) -> np.ndarray:
+        """Returns the time when each trajectory leaves the map horizontally"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            border = np.where(self.velocity_x > 0, width, 0.0)
+            time = (border - self.x) / self.velocity_x
+        return np.where(self.velocity_x == 0, np.inf, time)
+
+    def _crossing_times(
+        self, start: np.ndarray, end: np.ndarray, rows: slice | np.ndarray = slice(None)
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the times when the selected trajectories enter and leave the
+        vertical bands between the x coordinates start and end, clipped to the
+        future.
+        """
+        velocity_x = self.velocity_x[rows, np.newaxis]
+        velocity_x = np.where(velocity_x == 0, constants.EPSILON**3, velocity_x)
+        x = self.x[rows, np.newaxis]
+        first = (start - x) / velocity_x
+        second = (end - x) / velocity_x
+        enter = np.maximum(np.minimum(first, second), 0)
+        leave = np.maximum(first, second)
+        return enter, leave
+
+    def _column_impacts(
+        self, rows: np.ndarray, columns: np.ndarray, tops: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns, for the selected trajectories, the first time they go under
+        the top of each given column, or inf if they pass over it.
+        """
+        enter, leave = self._crossing_times(columns, columns + 1, rows)
+        y = self.y[rows, np.newaxis]
+        velocity_y = self.velocity_y[rows, np.newaxis]
+        gravity = self.gravity[rows, np.newaxis]
+
+        enter_y = y + velocity_y * enter + gravity * enter**2 / 2
+        leave_y = y + velocity_y * leave + gravity * leave**2 / 2
+
+        # The crossing is the bigger root of y(t) = top
+        discriminant = np.maximum(velocity_y**2 - 2 * gravity * (y - tops), 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            root = (-velocity_y + np.sqrt(discriminant)) / gravity
+        root = np.clip(root, enter, leave)
+
+        times = np.where(leave_y > tops, root, np.inf)
+        times = np.where(enter_y > tops, enter, times)
+        return np.where(leave > enter, times, np.inf)
+
+    def terrain_impact(
+        self,
+        heights: np.ndarray,
+        map_height: float,
+        terrain_index: Optional[np.ndarray] = None,
+        chunk_maxima: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Returns the time when each trajectory goes under the terrain, or inf if
+        it leaves the map first. heights has shape (width,) or (terrains,
+        width), in which case terrain_index says the terrain of every
+        trajectory. Groups of CHUNK_SIZE columns are discarded first comparing
+        the path with their highest column, and only the first candidate group
+        of every trajectory is solved column by column.
+        """
+        heights = np.atleast_2d(heights)
+        width = heights.shape[1]
+        count = self.x.shape[0]
+        if terrain_index is None:
+            terrain_index = np.zeros(count, dtype=int)
+
+        chunks = -(-width // CHUNK_SIZE)
+        if chunk_maxima is None:
+            padded = np.full((heights.shape[0], chunks * CHUNK_SIZE), -np.inf)
+            padded[:, :width] = heights
+            chunk_maxima = padded.reshape(-1, chunks, CHUNK_SIZE).max(axis=2)
+        chunk_maxima = np.atleast_2d(chunk_maxima)
+
+        # The borders of the groups are sorted in the order the path crosses
+        # them, so the times grow along every row, and neighbour groups share
+        # the border where the path is solved
+        backwards = self.velocity_x < 0
+        borders = np.minimum(np.arange(chunks + 1) * CHUNK_SIZE, width)
+        borders = np.where(backwards[:, np.newaxis], borders[::-1], borders)
+        velocity_x = np.where(
+            self.velocity_x == 0, constants.EPSILON**3, self.velocity_x
+        )
+        times = (borders - self.x[:, np.newaxis]) / velocity_x[:, np.newaxis]
+        future = np.maximum(times, 0)
+        border_y = self.y[:, np.newaxis] + future * (
+            self.velocity_y[:, np.newaxis] + self.gravity[:, np.newaxis] / 2 * future
+        )
+
+        # The path is convex, so its lowest point in a group is at one border
+        lowest = np.maximum(border_y[:, :-1], border_y[:, 1:])
+        ceiling = map_height - chunk_maxima
+        ceiling = np.stack((ceiling, ceiling[:, ::-1]), axis=1)
+        candidates = (times[:, 1:] > future[:, :-1]) & (
+            lowest > ceiling[terrain_index, backwards.astype(int)]
+        )
+
+        impact = np.full(count, np.inf)
+        offsets = np.arange(CHUNK_SIZE)
+        rows = np.flatnonzero(candidates.any(axis=1))
+        while rows.size > 0:
+            # The first candidate left in a row is the next group it crosses
+            position = np.argmax(candidates[rows], axis=1)
+            chunk = np.where(backwards[rows], chunks - 1 - position, position)
+
+            columns = chunk[:, np.newaxis] * CHUNK_SIZE + offsets
+            inside = columns < width
+            columns = np.minimum(columns, width - 1)
+            tops = map_height - heights[terrain_index[rows, np.newaxis], columns]
+            times = np.where(
+                inside, self._column_impacts(rows, columns, tops), np.inf
+            ).min(axis=1)
+
+            found = np.isfinite(times)
+            impact[rows[found]] = times[found]
+            candidates[rows, position] = False
+            rows = rows[~found]
+            rows = rows[candidates[rows].any(axis=1)]
+
+        return impact
+
+    def circle_impact(
+        self,
+        centers: np.ndarray,
+        radius: float | np.ndarray,
+        until: float | np.ndarray = np.inf,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the first time each trajectory gets within radius of one of the
+        centers, with shape (circles, 2) or (trajectories, circles, 2), before
+        the time until, and the index of that circle (inf and -1 if none).
+        The path is only inside the bounding box of a circle in at most two
+        short intervals, which are sampled and then refined by bisection.
+        """
+        count = self.x.shape[0]
+        centers = np.broadcast_to(centers, (count,) + np.shape(centers)[-2:])
+        center_x, center_y = centers[..., 0], centers[..., 1]
+        radius = np.broadcast_to(radius, (count,))[:, np.newaxis]
+        until = np.broadcast_to(until, (count,))[:, np.newaxis]
+        x, y, velocity_y, gravity = (
+            value[:, np.newaxis]
+            for value in (self.x, self.y, self.velocity_y, self.gravity)
+        )
+
+        enter, leave = self._crossing_times(center_x - radius, center_x + radius)
+        leave = np.minimum(leave, until)
+
+        def solve(level: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            """Roots of y(t) = level, nan when the path never reaches it"""
+            discriminant = velocity_y**2 - 2 * gravity * (y - level)
+            with np.errstate(invalid="ignore"):
+                root = np.sqrt(discriminant)
+            return (-velocity_y - root) / gravity, (-velocity_y + root) / gravity
+
+        # The path is under the top of the box between the first two roots and
+        # over its bottom outside the second two
+        below_first, below_last = solve(center_y + radius)
+        over_first, over_last = solve(center_y - radius)
+        over_first = np.where(np.isnan(over_first), below_last, over_first)
+        over_last = np.where(np.isnan(over_last), below_last, over_last)
+
+        starts = np.stack((below_first, over_last), axis=-1)
+        ends = np.stack((np.minimum(below_last, over_first), below_last), axis=-1)
+        starts = np.maximum(starts, enter[..., np.newaxis])
+        ends = np.minimum(ends, leave[..., np.newaxis])
+        valid = ends >= starts  # nan compares as False
+
+        # Only the intervals that exist are sampled
+        rows, circles, _ = np.nonzero(valid)
+        starts, ends = starts[valid], ends[valid]
+        path = (
+            value[rows]
+            for value in (
+                self.x,
+                self.y,
+                self.velocity_x,
+                self.velocity_y,
+                self.gravity,
+            )
+        )
+        x, y, velocity_x, velocity_y, gravity = (value[:, np.newaxis] for value in path)
+        center_x = center_x[rows, circles][:, np.newaxis]
+        center_y = center_y[rows, circles][:, np.newaxis]
+        radius = np.broadcast_to(radius, valid.shape[:2])[rows, circles][:, np.newaxis]
+
+        def inside(time: np.ndarray) -> np.ndarray:
+            """Whether the path is inside the circle at the given times"""
+            path_x = x + velocity_x * time
+            path_y = y + velocity_y * time + gravity * time**2 / 2
+            return (path_x - center_x) ** 2 + (path_y - center_y) ** 2 <= radius**2
+
+        times = starts[:, np.newaxis] + (ends - starts)[:, np.newaxis] * np.linspace(
+            0, 1, CIRCLE_SAMPLES
+        )
+        hits = inside(times)
+        first = np.argmax(hits, axis=1)
+        found = hits.any(axis=1)
+
+        # Bisection between the last sample outside and the first one inside
+        indices = np.arange(first.size)
+        high = times[indices, first]
+        low = np.where(first == 0, high, times[indices, np.maximum(first - 1, 0)])
+        for _ in range(CIRCLE_BISECTIONS):
+            middle = (low + high) / 2
+            is_inside = inside(middle[:, np.newaxis])[:, 0]
+            high = np.where(is_inside, middle, high)
+            low = np.where(is_inside, low, middle)
+
+        impact = np.full(valid.shape[:2], np.inf)
+        np.minimum.at(impact, (rows[found], circles[found]), high[found])
+        circle = np.argmin(impact, axis=1)
+        time = impact[np.arange(count), circle]
+        return time, np.where(np.isfinite(time), circle, -1)
+
+    def first_impact(
+        self,
+        heights: np.ndarray,
+        size: tuple[int, int],
+        centers: np.ndarray,
+        radius: float | np.ndarray,
+        terrain_index: Optional[np.ndarray] = None,
+        chunk_maxima: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the ImpactType, the time and the index of the tank hit (or -1)
+        of the first impact of every trajectory, like Round.find_first_impact,
+        against the terrain of the given heights and the tanks in centers. The
+        terrain wins the ties, and the cannonballs that leave the map hit the
+        border.
+        """
+        width, height = size
+        terrain_time = self.terrain_impact(heights, height, terrain_index, chunk_maxima)
+        leave_time = self.leave_time(width)
+        tank_time, tank = self.circle_impact(
+            centers, radius, np.minimum(terrain_time, leave_time)
+        )
+
+        hit = (tank >= 0) & (tank_time < terrain_time)
+        impact_type = np.where(
+            terrain_time < leave_time, ImpactType.TERRAIN, ImpactType.BORDER
+        )
+        impact_type = np.where(hit, ImpactType.TANK, impact_type)
+        impact_time = np.where(hit, tank_time, np.minimum(terrain_time, leave_time))
+
+        return impact_type, impact_time, np.where(hit, tank, -1)
+
+
+def launch(
+    position: np.ndarray,
+    angle: np.ndarray,
+    speed: np.ndarray,
+    caliber: np.ndarray,
+    gravity: float | np.ndarray,
+    wind: float | np.ndarray = 0.0,
+) -> Trajectory:
+    """
+    Returns the trajectories of the cannonballs fired like Tank.shoot by tanks
+    at the given positions, with arrays of angles in radians, speeds and
+    CannonballType. The trajectories match the steps of Round.
+    """
+    # The y axis points down
+    direction = np.stack((np.cos(angle), -np.sin(angle)), axis=-1)
+    return Trajectory(
+        position + SPAWN_OFFSET[caliber][:, np.newaxis] * direction,
+        np.asarray(speed)[:, np.newaxis] * direction,
+        gravity,
+        wind,
+        step=constants.X_SPEED / constants.PHYSICS_FPS,
+    )
+
+
+def predict_impact(
+    terrain: Terrain,
+    position: pygame.Vector2,
+    velocity: pygame.Vector2,
+    gravity: float,
+    wind: float = 0.0,
+) -> Optional[tuple[float, pygame.Vector2]]:
+    """
+    Returns the time, in seconds of the game, and the point where a cannonball
+    launched with the given position and velocity hits the terrain, or None if
+    it leaves the map before. The trajectory matches the steps of Round.
+    """
+    trajectory = Trajectory(
+        np.array(position),
+        np.array(velocity),
+        gravity,
+        wind,
+        step=constants.X_SPEED / constants.PHYSICS_FPS,
+    )
+
+    chunk_maxima = None
+    if terrain.height_index.leaves >= CHUNK_SIZE:
+        chunk_maxima = terrain.height_index.chunks(CHUNK_SIZE)
+
+    time = trajectory.terrain_impact(
+        terrain.ground_lines, terrain.size[1], chunk_maxima=chunk_maxima
+    )
+    if not np.isfinite(time[0]):
+        return None
+
+    x, y = trajectory.position_at(time)
+    return float(time[0]) / constants.X_SPEED, pygame.Vector2(x[0], y[0])
@@ -0,0 +1,350 @@
+"""
+This module is an environment to train aiming policies with reinforcement
+learning. It holds many independent games as arrays, and every step resolves
+the shot of the current tank of all of them at once, with the same rules of
+Round but without simulating the flight frame by frame, for example:
+
+    env = VectorTankEnv(256, num_tanks=2)
+    observation = env.reset(seed=1)
+    observation, reward, done, info = env.step(actions)
+"""
+
+import os
+
+# The dummy drivers must be selected before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import random
+from typing import Optional
+
+import numpy as np
+import pygame
+
+import constants
+import context
+from cannonballs import CannonballType
+from effects import AmbientEffect
+from impact import ImpactType
+from map import Map
+from terrain import Terrain, cut_circle
+from planner import radius_damage
+from trajectory import CHUNK_SIZE, DAMAGE, RADIUS, RADIUS_DAMAGE, launch
+
+# Time of a physics step of the fall of the terrain and the tanks
+FALL_STEP = constants.TERRAIN_FALL_X_SPEED / constants.PHYSICS_FPS
+
+
+class VectorTankEnv:
+    """
+    This class is a Gym style environment over num_envs independent games of
+    num_tanks tanks. The terrains are generated by Terrain, and a step fires
+    one cannonball in every game, applies the radius damage, carves the crater,
+    lets the tanks fall and applies the direct hit, in the order of
+    Round.play_turn. The falls are solved when they are over instead of step
+    by step. A game whose tanks are all dead but one is done, and it is reset
+    automatically. The ammunition of the players is not tracked, every tank can
+    fire any cannonball.
+    """
+
+    num_envs: int
+    num_tanks: int
+    size: tuple[int, int]
+    effect: AmbientEffect
+    layers_num: int
+    ground: np.ndarray  # (envs, width) total height of each column
+    layers: np.ndarray  # (envs, width, layers) height of each layer
+    chunk_maxima: np.ndarray  # (envs, chunks) highest column of every chunk
+    positions: np.ndarray  # (envs, tanks, 2) center of every tank
+    life: np.ndarray  # (envs, tanks)
+    alive: np.ndarray  # (envs, tanks)
+    order: np.ndarray  # (envs, tanks) shuffled order of the turns
+    turn: np.ndarray  # (envs,) index in order of the tank that shoots
+    gravity: np.ndarray  # (envs,)
+    wind: np.ndarray  # (envs,) velocity of the wind of the next shot
+    rng: np.random.Generator
+
+    def __init__(
+        self,
+        num_envs: int,
+        num_tanks: int = 2,
+        size: Optional[tuple[int, int]] = None,
+        effect: AmbientEffect = AmbientEffect.NONE,
+    ):
+        """
+        Creates the arrays of the games, that are empty until reset is called.
+        By default the map has the size of the one of the game.
+        """
+        if num_tanks < 2:
+            raise ValueError("a game needs at least two tanks")
+
+        self.num_envs = num_envs
+        self.num_tanks = num_tanks
+        self.size = size or context.instance.map_size
+        self.effect = effect
+        self.layers_num = 0
+        self.rng = np.random.default_rng()
+
+        width = self.size[0]
+        self.ground = np.zeros((num_envs, width))
+        self.layers = np.zeros((num_envs, width, 0))
+        self.chunk_maxima = np.zeros((num_envs, -(-width // CHUNK_SIZE)))
+        self.positions = np.zeros((num_envs, num_tanks, 2))
+        self.life = np.zeros((num_envs, num_tanks), dtype=int)
+        self.alive = np.zeros((num_envs, num_tanks), dtype=bool)
+        self.order = np.tile(np.arange(num_tanks), (num_envs, 1))
+        self.turn = np.zeros(num_envs, dtype=int)
+        self.gravity = np.full(num_envs, constants.DEFAULT_GRAVITY)
+        self.wind = np.zeros(num_envs)
+
+    @property
+    def current(self) -> np.ndarray:
+        """Return the index of the tank that shoots next in every game"""
+        return self.order[np.arange(self.num_envs), self.turn]
+
+    def reset_game(self, index: int) -> None:
+        """
+        Starts a new game in the given position, generating the terrain, the
+        gravity and the tanks like a new Round.
+        """
+        biome = Map()
+        if self.effect in [AmbientEffect.GRAVITY, AmbientEffect.GRAVITY_AND_WIND]:
+            self.gravity[index] = random.uniform(
+                constants.MIN_GRAVITY, constants.MAX_GRAVITY
+            )
+        else:
+            self.gravity[index] = constants.DEFAULT_GRAVITY
+
+        terrain = Terrain(
+            self.size,
+            constants.MOUNTAINS,
+            constants.VALLEYS,
+            biome.define_terrain_colors(),
+        )
+        if self.layers.shape[2] != terrain.layers_num:
+            self.layers_num = terrain.layers_num
+            self.layers = np.zeros(self.ground.shape + (self.layers_num,))
+        self.ground[index] = terrain.ground_lines
+        self.layers[index] = terrain.new_ground_lines
+        self.update_chunks(np.array([index]), np.array([0]), self.chunk_maxima.shape[1])
+
+        # Same distribution of Round.generate_tanks_positions
+        segments_size = self.size[0] / self.num_tanks
+        for zone in range(self.num_tanks):
+            center = ((zone * segments_size) + ((zone + 1) * segments_size)) / 2
+            x = center + random.normalvariate(0, segments_size / 4)
+            x = int(min(max(zone * segments_size, x), (zone + 1) * segments_size))
+            y = self.size[1] - terrain.ground_lines[x - 1] - constants.TANK_OFFSET
+            self.positions[index, zone] = x, y
+
+        self.life[index] = 100
+        self.alive[index] = True
+        order = [*range(self.num_tanks)]
+        random.shuffle(order)
+        self.order[index] = order
+        self.turn[index] = 0
+
+    def update_chunks(self, envs: np.ndarray, start: np.ndarray, count: int) -> None:
+        """
+        Recomputes the highest column of count chunks of CHUNK_SIZE columns of
+        the given games, from the chunk that contains the column start.
+        """
+        width = self.size[0]
+        last = self.chunk_maxima.shape[1] - 1
+        chunks = np.minimum(
+            (start // CHUNK_SIZE)[:, np.newaxis] + np.arange(count), last
+        )
+        columns = chunks[..., np.newaxis] * CHUNK_SIZE + np.arange(CHUNK_SIZE)
+        heights = self.ground[
+            envs[:, np.newaxis, np.newaxis], np.minimum(columns, width - 1)
+        ]
+        self.chunk_maxima[envs[:, np.newaxis], chunks] = np.where(
+            columns < width, heights, -np.inf
+        ).max(axis=2)
+
+    def change_wind(self) -> None:
+        """
+        Draws the wind of the next shot of every game, with the values that
+        Wind.change_speed can reach, or no wind if the effect has none.
+        """
+        if self.effect not in [AmbientEffect.WIND, AmbientEffect.GRAVITY_AND_WIND]:
+            self.wind[:] = 0.0
+            return
+
+        target = self.rng.integers(-9, 10, self.num_envs)
+        self.wind[:] = np.where(target < 0, target - 1, target + 1)
+
+    def observe(self) -> dict[str, np.ndarray]:
+        """Returns a copy of the state that the shooting tanks can see"""
+        return {
+            "ground": self.ground.copy(),
+            "positions": self.positions.copy(),
+            "life": self.life.copy(),
+            "alive": self.alive.copy(),
+            "current": self.current,
+            "gravity": self.gravity.copy(),
+            "wind": self.wind.copy(),
+        }
+
+    def reset(self, seed: Optional[int] = None) -> dict[str, np.ndarray]:
+        """
+        Starts a new game in every position and returns the observation. The
+        terrains use the random module like the game, so the seed is also
+        given to it.
+        """
+        if seed is not None:
+            random.seed(seed)
+        self.rng = np.random.default_rng(seed)
+
+        for index in range(self.num_envs):
+            self.reset_game(index)
+        self.change_wind()
+
+        return self.observe()
+
+    def carve(
+        self, exploded: np.ndarray, center: np.ndarray, radius: np.ndarray
+    ) -> None:
+        """
+        Removes the craters of the given games, like Terrain.carve after its
+        soil has landed, when the columns of each layer only lose the soil
+        inside the circle.
+        """
+        width, height = self.size
+        envs = np.flatnonzero(exploded)
+        center_x = center[envs, 0].astype(int)
+        widest = int(RADIUS_DAMAGE.max())
+
+        columns = center_x[:, np.newaxis] + np.arange(-widest, widest + 1)
+        inside = (columns >= 0) & (columns < width)
+        columns = np.clip(columns, 0, width - 1)
+        affected = cut_circle(
+            self.layers[envs[:, np.newaxis], columns],
+            columns,
+            center_x,
+            height - center[envs, 1],
+            radius[envs],
+        )[0]
+
+        # The clipped columns are repeated, only the ones inside are written
+        rows = np.broadcast_to(envs[:, np.newaxis], columns.shape)[inside]
+        columns = columns[inside]
+        affected = affected[inside]
+        self.layers[rows, columns] -= affected
+        self.ground[rows, columns] -= affected.sum(axis=1)
+
+        span = -(-(2 * widest + 1) // CHUNK_SIZE) + 1
+        self.update_chunks(envs, np.maximum(center_x - widest, 0), span)
+
+    def fall_tanks(self) -> None:
+        """
+        Drops the tanks that are left in the air to the ground, with the
+        damage that Round.make_tanks_fall gives when they land. The tanks fall
+        the same distance every physics step, so the step when they land is
+        found solving the accumulated distance.
+        """
+        width, height = self.size
+        envs = np.arange(self.num_envs)[:, np.newaxis]
+        x = self.positions[..., 0].astype(int)
+        column = np.minimum(x, width - 1)
+        ground = self.ground[envs, column]
+
+        drop = np.where(
+            x < width, height - self.positions[..., 1] - constants.TANK_OFFSET, 0
+        )
+        drop = np.maximum(drop - ground, 0)
+
+        # After k steps the tank has fallen gravity * FALL_STEP**2 * k(k+1)/2
+        unit = (self.gravity * FALL_STEP**2)[:, np.newaxis]
+        steps = np.ceil((np.sqrt(1 + 8 * drop / unit) - 1) / 2)
+        steps = np.where(unit * steps * (steps + 1) / 2 < drop, steps + 1, steps)
+        steps = np.where(
+            (steps > 0) & (unit * (steps - 1) * steps / 2 >= drop), steps - 1, steps
+        )
+        speed = (steps + 1) * self.gravity[:, np.newaxis] * FALL_STEP
+        damage = (speed * constants.DAMAGE_PER_SPEED).astype(int)
+
+        self.life = np.where(drop > 0, np.maximum(0, self.life - damage), self.life)
+        self.positions[..., 1] = height - ground - constants.TANK_OFFSET
+
+    def next_turn(self) -> None:
+        """Passes the turn of every game to its next tank that is alive"""
+        envs = np.arange(self.num_envs)
+        self.turn = (self.turn + 1) % self.num_tanks
+        for _ in range(self.num_tanks):
+            dead = ~self.alive[envs, self.current]
+            self.turn = np.where(dead, (self.turn + 1) % self.num_tanks, self.turn)
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """
+        Fires the cannonball of the current tank of every game. actions has
+        shape (envs, 3) with the angle in radians, the speed and the
+        CannonballType of each shot. The reward is the life taken from the
+        other tanks minus the life lost by the shooter. Returns the
+        observation, the rewards, which games are done (the observation is
+        already the one of their new game) and information about the impacts.
+        """
+        actions = np.asarray(actions, dtype=float)
+        envs = np.arange(self.num_envs)
+        angle = actions[:, 0]
+        speed = np.clip(actions[:, 1], 1, constants.SHOOT_MAX_SPEED)
+        caliber = np.clip(
+            actions[:, 2].astype(int), CannonballType.MM60, CannonballType.MM105
+        )
+
+        shooter = self.current
+        trajectory = launch(
+            self.positions[envs, shooter],
+            angle,
+            speed,
+            caliber,
+            self.gravity,
+            self.wind,
+        )
+        impact_type, impact_time, hit = trajectory.first_impact(
+            self.ground,
+            self.size,
+            self.positions,
+            RADIUS[caliber],
+            envs,
+            self.chunk_maxima,
+        )
+        exploded = impact_type != ImpactType.BORDER
+        center = np.stack(trajectory.position_at(impact_time), axis=1)
+
+        life = self.life.copy()
+        self.life -= radius_damage(
+            self.positions, center, DAMAGE[caliber], impact_type, hit
+        )
+
+        self.carve(exploded, center, RADIUS_DAMAGE[caliber])
+        self.fall_tanks()
+        self.life[envs[hit >= 0], hit[hit >= 0]] -= DAMAGE[caliber][hit >= 0]
+
+        self.alive &= self.life > 0
+        self.life = np.maximum(self.life, 0)
+
+        lost = life - self.life
+        own = lost[envs, shooter]
+        reward = (lost.sum(axis=1) - 2 * own).astype(float)
+
+        done = self.alive.sum(axis=1) <= 1
+        winner = np.where(
+            done & self.alive.any(axis=1), np.argmax(self.alive, axis=1), -1
+        )
+        info = {
+            "impact_type": impact_type,
+            "impact_position": center,
+            "hit": hit,
+            "winner": winner,
+        }
+
+        self.next_turn()
+        for index in np.flatnonzero(done):
+            self.reset_game(index)
+        self.change_wind()
+
+        return self.observe(), reward, done, info
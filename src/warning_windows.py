@@ -1,5 +1,7 @@
+from typing import Optional
+
 import pygame
-from caches import font_cache
+from caches import font_cache, text_cache
 from caches import image_cache
 from cannonballs import CannonballType
 from draw import Drawable
@@ -14,6 +16,7 @@ class WarningWindows(Drawable):
 
     num_seleccionado: int
     quantity: list[int]
+    rect: Optional[pygame.Rect]  # area of the last warning drawn, if any
 
     def __init__(self, tank_game):
         """
@@ -25,12 +28,12 @@ class WarningWindows(Drawable):
         self.tank_game = tank_game
         self.quantity = []
         self.num_seleccionado = 0
-        self.font = font_cache["Roboto.ttf", int(instance.windows_size[0] / 64)]
-        self.font2 = font_cache["Roboto.ttf", int(instance.windows_size[0] / 106.66)]
+        self.font = ("Roboto.ttf", int(instance.windows_size[0] / 64))
+        self.font2 = ("Roboto.ttf", int(instance.windows_size[0] / 106.66))
         self.font100 = font_cache["Roboto.ttf", int(instance.windows_size[0] / 21.33)]
-        self.font.set_bold(True)
         self.font50 = font_cache["Roboto.ttf", int(instance.windows_size[0] / 85.33)]
         self.size = (instance.windows_size[0] / 3.6, instance.windows_size[1] / 7.2)
+        self.rect = None
 
     def get_background(self) -> pygame.Surface:
         """
@@ -68,6 +71,7 @@ class WarningWindows(Drawable):
             self.tank_game.actual_player
         ].actual
         self.quantity = self.tank_game.get_current_tank().player.ammunition
+        self.rect = None
 
         if self.is_current_cannonball_available():
             # In this case there are cannonballs available, so is not necessary
@@ -88,19 +92,15 @@ class WarningWindows(Drawable):
             alternatives = "1 o 2"
 
         sf = self.get_background()
-        self.font100 = self.font.render(
-            f"No quedan balas de {missing_caliber}",
-            True,
-            "white",
+        self.font100 = text_cache.render(
+            self.font, f"No quedan balas de {missing_caliber}", "white", bold=True
         )
         sf.blit(
             self.font100,
             (instance.windows_size[0] / 12.8, instance.windows_size[1] / 36),
         )
-        self.font50 = self.font2.render(
-            "Seleccione alguna bala diferente",
-            True,
-            "white",
+        self.font50 = text_cache.render(
+            self.font2, "Seleccione alguna bala diferente", "white"
         )
         if instance.windows_size[0] > 1000:
             sf.blit(
@@ -112,10 +112,8 @@ class WarningWindows(Drawable):
                 self.font50,
                 (instance.windows_size[0] / 9, instance.windows_size[1] / 14.4),
             )
-        self.font50 = self.font2.render(
-            f"con los números {alternatives}",
-            True,
-            "white",
+        self.font50 = text_cache.render(
+            self.font2, f"con los números {alternatives}", "white"
         )
         if instance.windows_size[0] > 1000:
             sf.blit(
@@ -128,4 +126,6 @@ class WarningWindows(Drawable):
                 (instance.windows_size[0] / 8, instance.windows_size[1] / 11.07),
             )
 
-        screen.blit(sf, (instance.windows_size[0] / 2 - sf.get_size()[0] / 2, 0))
+        self.rect = screen.blit(
+            sf, (instance.windows_size[0] / 2 - sf.get_size()[0] / 2, 0)
+        )
@@ -1,7 +1,7 @@
 import random
 import pygame
 
-from caches import font_cache
+from caches import text_cache
 import constants
 
 from draw import Drawable
@@ -20,16 +20,14 @@ class WinnerScreen(Drawable):
         Constructor that initializes all the elements needed to demonstrate
         the message of victory.
         """
-        self.font = font_cache["Roboto.ttf", int(instance.windows_size[0] / 64)]
+        self.font = ("Roboto.ttf", int(instance.windows_size[0] / 64))
         self.tank_game = tank_game
         self.text_winner_info = None
         self.text_winner_life = None
         self.text_winner_score = None
         self.text_life1 = None
         self.text_life2 = None
-        self.font100 = font_cache["Roboto.ttf", int(instance.windows_size[0] // 8.53)]
-        self.font100.set_bold(True)
-        self.font100.set_italic(True)
+        self.font100 = ("Roboto.ttf", int(instance.windows_size[0] // 8.53))
         self.vx = random.uniform(-1, 1)
         self.vy = random.uniform(-5, -1)
         self.radio = 2
@@ -57,21 +55,15 @@ class WinnerScreen(Drawable):
             instance.windows_size[1] / 12,
         )
         screen.blit(rect_surface, (rect_x1, rect_y1))
-        self.text_winner_info = self.font100.render(
-            "WINNER",
-            True,
-            "white",
+        self.text_winner_info = text_cache.render(
+            self.font100, "WINNER", "white", bold=True, italic=True
         )
         screen.blit(self.text_winner_info, center)
 
         life = self.tank_game.tanks[self.tank_game.winner].life
-        self.font.set_bold(True)
-        self.text_winner_life = self.font.render(
-            f"Vida: {life} puntos de vida",
-            True,
-            "white",
+        self.text_winner_life = text_cache.render(
+            self.font, f"Vida: {life} puntos de vida", "white", bold=True
         )
-        self.font.set_bold(False)
         position_winner_life = pygame.Vector2(
             instance.windows_size[0] / 2.32, instance.windows_size[1] / 6
         )
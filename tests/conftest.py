@@ -0,0 +1,11 @@
+"""
+The tests import the modules of the game from src, as the game does when it
+runs from there, with the dummy drivers of SDL so no window is opened.
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
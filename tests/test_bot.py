@@ -0,0 +1,101 @@
+import itertools
+import math
+
+import numpy as np
+import pygame
+import pytest
+
+import constants
+import context  # noqa: F401, the context is imported before the bot
+from bot import Bot, best_purchase
+from impact import Impact, ImpactType
+from player import Player
+from trajectory import SHELLS, SPAWN_OFFSET
+
+
+def brute_force_purchase(money: int) -> int:
+    """Returns the largest value of all the purchases that money can pay"""
+    best = 0
+    for units in itertools.product(
+        *(range(money // shell.price + 1) for shell in SHELLS)
+    ):
+        if sum(shell.price * n for shell, n in zip(SHELLS, units)) <= money:
+            value = sum(
+                shell.damage * shell.radius * n for shell, n in zip(SHELLS, units)
+            )
+            best = max(best, value)
+    return best
+
+
+@pytest.mark.parametrize("money", [0, 500, 999, 1000, 3500, 6000, 10000, 17500])
+def test_best_purchase_matches_brute_force(money):
+    units = best_purchase(money)
+    assert sum(shell.price * n for shell, n in zip(SHELLS, units)) <= money
+    value = sum(shell.damage * shell.radius * n for shell, n in zip(SHELLS, units))
+    assert value == brute_force_purchase(money)
+
+
+def landing(bot: Bot, wind: float, gravity: float) -> float:
+    """
+    Returns where the shot of the bot lands on flat ground at the height of
+    the cannon, with the motion of the Round without steps.
+    """
+    angle, speed = bot.shoot_angle, bot.shoot_velocity
+    start = bot.position.x + SPAWN_OFFSET[bot.actual] * math.cos(angle)
+    drift = wind * constants.WIND_EFFECT_SCALE / constants.X_SPEED
+    return (
+        start
+        + (speed * math.cos(angle) + drift) * 2 * speed * math.sin(angle) / gravity
+    )
+
+
+def make_tanks() -> list[Bot]:
+    """Returns a bot and its target on the same flat ground"""
+    return [
+        Bot("red", pygame.Vector2(100, 300), Player("red")),
+        Bot("blue", pygame.Vector2(500, 300), Player("blue")),
+    ]
+
+
+def test_corrected_shots_solve_the_secant():
+    bot, target = make_tanks()
+    bot.actual = 0
+    # Misses that change linearly with the speed are corrected in one step
+    bot.history[1] = [
+        (math.radians(45), speed, 0, 0.0, 10.0, 3 * (speed - 130))
+        for speed in (100, 120)
+    ]
+    bot.history_positions[1] = (bot.position.copy(), target.position.copy())
+
+    [(angle, speed)] = bot.corrected_shots([bot, target], 0.0)
+    slope, intercept = np.polyfit([100, 120], [-90, -30], 1)
+    assert angle == math.radians(45)
+    assert speed == pytest.approx(-intercept / slope)
+
+
+@pytest.mark.parametrize(
+    "winds, tolerance",
+    [
+        ([0, 0, 0, 0, 0, 0], 1e-3),
+        ([4, 4, 4, 4, 4, 4], 1e-3),
+        # The drift of the wind is moved with the time of the old flights
+        ([3, -2, 5, 0, -4, 1], constants.TANK_RADIO / 4),
+    ],
+)
+def test_corrected_shots_converge_to_the_target(winds, tolerance):
+    gravity = 9.8
+    bot, target = make_tanks()
+    tanks = [bot, target]
+    bot.actual = 0
+    bot.shoot_angle = math.radians(50)
+    bot.shoot_velocity = 40.0
+
+    for shot_wind, wind in zip(winds, winds[1:]):
+        x = landing(bot, shot_wind, gravity)
+        bot.record_shot(
+            tanks, Impact(pygame.Vector2(x, 300), ImpactType.TERRAIN), shot_wind
+        )
+        [(bot.shoot_angle, bot.shoot_velocity)] = bot.corrected_shots(tanks, wind)
+
+    miss = landing(bot, winds[-1], gravity) - target.position.x
+    assert abs(miss) < tolerance
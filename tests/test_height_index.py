@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from height_index import HeightIndex
+
+
+def brute_force_max(heights: np.ndarray, start: int, end: int) -> float:
+    """Returns the highest column in [start, end), or -inf if it is empty"""
+    columns = heights[max(start, 0) : max(end, 0)]
+    return float(columns.max()) if columns.size else -np.inf
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 100, 757])
+def test_max_matches_the_columns(size):
+    rng = np.random.default_rng(size)
+    heights = rng.uniform(0, 500, size)
+    index = HeightIndex(heights)
+
+    for _ in range(300):
+        start, end = sorted(rng.integers(-5, size + 5, 2))
+        assert index.max(start, end) == brute_force_max(heights, start, end)
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, 757])
+def test_update_matches_the_columns(size):
+    rng = np.random.default_rng(size)
+    heights = rng.uniform(0, 500, size)
+    index = HeightIndex(heights)
+
+    for _ in range(50):
+        start, end = sorted(rng.integers(0, size + 1, 2))
+        heights[start:end] = rng.uniform(0, 500, end - start)
+        index.update(start, end, heights[start:end])
+
+        for _ in range(20):
+            first, last = sorted(rng.integers(0, size + 1, 2))
+            assert index.max(first, last) == brute_force_max(heights, first, last)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 16, 64])
+def test_chunks_match_the_columns(chunk_size):
+    rng = np.random.default_rng(chunk_size)
+    heights = rng.uniform(0, 500, 757)
+    index = HeightIndex(heights)
+    index.update(100, 300, np.zeros(200))
+    heights[100:300] = 0
+
+    expected = [
+        heights[start : start + chunk_size].max()
+        for start in range(0, heights.size, chunk_size)
+    ]
+    np.testing.assert_array_equal(index.chunks(chunk_size), expected)
@@ -0,0 +1,34 @@
+import numpy as np
+
+import context  # noqa: F401, the context is imported before the cannonballs
+from impact import ImpactType
+from planner import radius_damage
+
+
+def test_radius_damage_matches_the_round():
+    positions = np.array([[0.0, 0.0], [3.0, 4.0], [0.5, 0.0], [1.0, 0.0]])
+    damage = radius_damage(
+        positions,
+        np.zeros(2),
+        np.array(20),
+        np.array(ImpactType.TERRAIN),
+        np.array(-1),
+    )
+    distance = np.linalg.norm(positions, axis=1)
+    # The tank at a distance of exactly 1 is left out, the Round divides by zero
+    expected = [int(20 / (1.0 - d) ** 2 * 100) for d in distance[:3]] + [0]
+    assert damage.tolist() == expected
+
+
+def test_radius_damage_skips_the_hit_tank_and_the_border():
+    positions = np.array([[0.0, 0.0], [3.0, 4.0]])
+    center = np.zeros((2, 2))
+    damage = radius_damage(
+        positions,
+        center,
+        np.array([20, 20]),
+        np.array([ImpactType.TANK, ImpactType.BORDER]),
+        np.array([0, -1]),
+    )
+    assert damage[0, 0] == 0 and damage[0, 1] > 0
+    assert not damage[1].any()
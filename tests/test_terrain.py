@@ -0,0 +1,93 @@
+import numpy as np
+import pygame
+import pytest
+
+from context import instance
+from terrain import Terrain
+
+COLORS = ["#111111", "#222222", "#333333", "#444444"]
+
+
+def settle(terrain: Terrain) -> None:
+    """Lets the falling soil land"""
+    for _ in range(10000):
+        terrain.tick(1 / 75, 9.8)
+        if not terrain.is_falling:
+            return
+    raise AssertionError("the soil never landed")
+
+
+def heights_error(terrain: Terrain) -> float:
+    """Difference between the heights and the layers, with the falling soil"""
+    layers = terrain.new_ground_lines.sum(axis=1) + terrain.falling[:, :, 1].sum(axis=1)
+    return float(np.abs(terrain.ground_lines - layers).max())
+
+
+@pytest.mark.parametrize("first_depth", [10, 30, 60, 90])
+@pytest.mark.parametrize("second_depth", [10, 30, 60, 90])
+@pytest.mark.parametrize("offset", [0, 10, 20])
+def test_overlapping_craters_keep_the_layers(first_depth, second_depth, offset):
+    terrain = Terrain(instance.map_size, 3, 2, COLORS)
+    x = 400
+    top = instance.map_size[1] - terrain.ground_lines[x]
+
+    terrain.carve(pygame.Vector2(x, top + first_depth), 15)
+    terrain.carve(pygame.Vector2(x + offset, top + second_depth), 15)
+    assert heights_error(terrain) < 1e-9
+
+    settle(terrain)
+    assert not terrain.falling.any()
+    np.testing.assert_allclose(
+        terrain.ground_lines, terrain.new_ground_lines.sum(axis=1), atol=1e-9
+    )
+
+
+def test_carve_on_falling_soil_only_removes_the_cut():
+    terrain = Terrain(instance.map_size, 3, 2, COLORS)
+    x = 400
+    top = instance.map_size[1] - terrain.ground_lines[x]
+
+    terrain.carve(pygame.Vector2(x, top + 60), 15)
+    assert terrain.falling[x, :, 1].sum() > 0
+
+    soil = terrain.new_ground_lines.sum() + terrain.falling[:, :, 1].sum()
+    heights = terrain.ground_lines.sum()
+    terrain.carve(pygame.Vector2(x, top + 10), 15)
+    removed_soil = (
+        soil - terrain.new_ground_lines.sum() - terrain.falling[:, :, 1].sum()
+    )
+    assert removed_soil == pytest.approx(heights - terrain.ground_lines.sum())
+
+
+def first_contact(terrain: Terrain, start, end, distance: float) -> float:
+    """Fraction of the way of the first sample within distance of the ground"""
+    reach = int(np.ceil(distance))
+    times = np.linspace(0, 1, 20001)
+    xs = start.x + (end.x - start.x) * times
+    ys = start.y + (end.y - start.y) * times
+    heights = [
+        terrain.ground_lines[max(column - reach, 0) : column + reach + 1].max()
+        for column in range(terrain.size[0])
+    ]
+    tops = instance.map_size[1] - np.array(heights)[xs.astype(int)] - distance
+    under = np.flatnonzero(ys > tops)
+    return float(times[under[0]]) if under.size else np.inf
+
+
+@pytest.mark.parametrize("distance", [0, 2.5, 10])
+def test_sweep_matches_the_sampled_segment(distance):
+    terrain = Terrain(instance.map_size, 3, 2, COLORS)
+    rng = np.random.default_rng(7)
+    hits = 0
+    for _ in range(200):
+        start = pygame.Vector2(rng.uniform(50, 700), rng.uniform(200, 533))
+        end = start + pygame.Vector2(rng.uniform(-40, 40), rng.uniform(-40, 40))
+
+        time = terrain.sweep(start, end, distance)
+        expected = first_contact(terrain, start, end, distance)
+        if time is None:
+            assert expected == np.inf
+        else:
+            assert time == pytest.approx(expected, abs=1e-3)
+            hits += 1
+    assert 0 < hits < 200
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+import pygame
+import pytest
+
+import constants
+from context import instance  # the context is imported before the cannonballs
+from cannonballs import Cannonball60mm
+from terrain import Terrain
+from trajectory import predict_impact
+
+COLORS = ["#3C474F", "#586874", "#99B4C9", "#B8D9F2"]
+
+
+def stepped_impact(terrain, position, velocity, gravity, wind):
+    """
+    Moves a cannonball with the steps of Round.process_cannonball_trajectory,
+    and returns the time and the point where it hits the terrain, or None if
+    it leaves the map before.
+    """
+    dt = 1 / constants.PHYSICS_FPS
+    cannonball = Cannonball60mm(position.copy(), velocity.copy())
+    for step in range(200000):
+        start = cannonball.position.copy()
+        cannonball.tick(dt * constants.X_SPEED, gravity)
+        cannonball.position.x += wind * dt * constants.WIND_EFFECT_SCALE
+        end = cannonball.position
+
+        fraction = terrain.sweep(start, end)
+        if fraction is not None:
+            return (step + fraction) * dt, start.lerp(end, fraction)
+        if end.x < 0 or end.x > terrain.size[0]:
+            return None
+    raise AssertionError("the cannonball never landed")
+
+
+def test_predict_impact_matches_the_steps():
+    terrain = Terrain(instance.map_size, 3, 2, COLORS)
+    width, height = terrain.size
+    rng = np.random.default_rng(3)
+    hits = 0
+    for _ in range(300):
+        position = pygame.Vector2(
+            rng.uniform(0, width),
+            rng.uniform(0, height - terrain.ground_lines.max() - 30),
+        )
+        angle, speed = rng.uniform(0, math.pi), rng.uniform(1, 200)
+        velocity = pygame.Vector2(speed * math.cos(angle), -speed * math.sin(angle))
+        gravity, wind = rng.uniform(1, 30), rng.uniform(-10, 10)
+
+        predicted = predict_impact(terrain, position, velocity, gravity, wind)
+        expected = stepped_impact(terrain, position, velocity, gravity, wind)
+        if expected is None:
+            assert predicted is None
+        else:
+            assert predicted is not None
+            assert predicted[0] == pytest.approx(expected[0], abs=1e-4)
+            assert predicted[1].distance_to(expected[1]) < 0.05
+            hits += 1
+    assert 0 < hits < 300